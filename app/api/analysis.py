@@ -1,14 +1,21 @@
 # app/api/analysis.py
 import logging
+from typing import Optional
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
 from app.database import get_db
 from app.repositories import NewsRepository
-from app.utils import create_success_response, handle_api_error, validate_pagination_params, format_news_article
+from app.rss_feeds import get_countries
+from app.trending import trending_terms
+from app.utils import create_success_response, handle_api_error, validate_country, validate_pagination_params, format_news_article
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/analysis", tags=["analysis"])
 
+# 경제, 정치, 기술 순으로 정렬
+ANALYSIS_SECTIONS = ['business', 'politics', 'technology']
+
 
 @router.get("/us-news")
 async def get_us_news_for_analysis(
@@ -18,41 +25,80 @@ async def get_us_news_for_analysis(
     """AI 분석용 미국 뉴스 데이터 (경제, 정치, 기술만)"""
     try:
         days, limit = validate_pagination_params(days, limit)
-        
+
         db = next(get_db())
         try:
             repo = NewsRepository(db)
-            # 경제, 정치, 기술 섹션만 조회
-            target_sections = ['business', 'politics', 'technology']
-            all_articles = []
-            
-            for section in target_sections:
-                articles = repo.get_news_by_section(section, 'US', days, limit, include_url=False)
-                all_articles.extend(articles)
-            
-            # 섹션별로 정렬 (경제, 정치, 기술 순)
-            section_order = {'business': 0, 'politics': 1, 'technology': 2}
-            all_articles.sort(key=lambda x: section_order.get(x.get('section', ''), 999))
-            
+            # 수집 시점에 만들어 둔 텍스트 블록을 섹션별 limit개씩 한 번에 조회
+            text_data = repo.get_analysis_corpus('US', ANALYSIS_SECTIONS, days, limit)
         finally:
             db.close()
-        
-        # 단순 문자열 데이터 생성
-        text_data = []
-        for article in all_articles:
-            text_row = f"제목: {article['title']}\n출처: {article['source']}\n요약: {article['summary'] or '요약 없음'}\n섹션: {article['section'] or 'general'}\n국가: {article['country']}\n---"
-            text_data.append(text_row)
-        
+
         return create_success_response(
             data=text_data,
             message=f"Retrieved {len(text_data)} US news articles for analysis (business, politics, technology only)",
             meta={
                 "count": len(text_data),
-                "sections": target_sections,
+                "sections": ANALYSIS_SECTIONS,
                 "days": days,
                 "limit": limit
             }
         )
-            
+
     except Exception as e:
         raise handle_api_error(e, "Failed to get US news for analysis")
+
+
+@router.get("/us-news/stream")
+async def stream_us_news_for_analysis(
+    days: int = Query(1, ge=1, le=30, description="Days to look back"),
+    limit: int = Query(50, ge=1, le=100, description="Number of articles")
+):
+    """AI 분석용 미국 뉴스 데이터 (plain text 스트리밍)"""
+    try:
+        days, limit = validate_pagination_params(days, limit)
+        db = next(get_db())
+    except Exception as e:
+        raise handle_api_error(e, "Failed to stream US news for analysis")
+
+    def generate():
+        try:
+            repo = NewsRepository(db)
+            for block in repo.iter_analysis_corpus('US', ANALYSIS_SECTIONS, days, limit):
+                yield block + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="text/plain; charset=utf-8")
+
+
+@router.get("/trending")
+async def get_trending_terms(
+    country: Optional[str] = Query(None, description="US or KR (default: all countries)"),
+    hours: int = Query(24, ge=1, le=48, description="Recent window in hours"),
+    baseline_hours: int = Query(168, ge=1, le=672, description="Baseline window before the recent window"),
+    limit: int = Query(20, ge=1, le=100, description="Number of terms per country")
+):
+    """급상승 키워드 - 수집 시 갱신한 시간 버킷 요약에서 최근 구간과 기준 구간 빈도를 비교"""
+    try:
+        countries = [validate_country(country)] if country else get_countries()
+
+        db = next(get_db())
+        try:
+            trends = {code: trending_terms(db, code, hours, baseline_hours, limit) for code in countries}
+        finally:
+            db.close()
+
+        return create_success_response(
+            data=trends,
+            message=f"Retrieved trending terms for {', '.join(countries)}",
+            meta={
+                "countries": countries,
+                "hours": hours,
+                "baseline_hours": baseline_hours,
+                "limit": limit
+            }
+        )
+
+    except Exception as e:
+        raise handle_api_error(e, "Failed to get trending terms")
@@ -1,115 +1,151 @@
 # app/api/cleanup.py
 import logging
-import os
-import re
-from fastapi import APIRouter
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.article import format_analysis_text
 from app.database import get_db
+from app.dimensions import section_cache, source_cache
+from app.fragment_cache import invalidate_news_fragments
+from app.news_service import clean_html_text
+from app.retention import RETENTION_DAYS, RETENTION_MAX_BATCHES, run_retention
 from app.utils import create_success_response, handle_api_error
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/cleanup", tags=["cleanup"])
 
+# 한 번에 읽고 갱신할 기사 수 (청크마다 커밋)
+CLEANUP_BATCH_SIZE = 500
+# 요청 하나가 처리하는 최대 청크 수 (나머지는 last_id를 after_id로 넘겨 이어서 실행)
+CLEANUP_MAX_BATCHES = 20
 
-def clean_html_summary(summary: str) -> str:
-    """HTML 태그를 제거하고 텍스트를 정리합니다."""
-    if not summary:
-        return ""
-    
-    # HTML 엔티티 디코딩
-    text = summary.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&').replace('&quot;', '"').replace('&#34;', '"')
-    
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]*>', '', text)
-    
-    # URL 패턴 제거
-    text = re.sub(r'https?://[^\s]+', '', text)
-    
-    # 공백 정리
-    text = ' '.join(text.split())
-    
-    return text
+
+def run_html_cleanup(
+    db: Session,
+    after_id: Optional[str] = None,
+    batch_size: int = CLEANUP_BATCH_SIZE,
+    max_batches: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    요약의 HTML 태그/엔티티를 청크 단위로 정리합니다.
+
+    기사 id 기준 keyset 순서로 batch_size개씩 읽어 executemany로 갱신하고 청크마다 커밋하므로
+    테이블 전체를 한 트랜잭션으로 잠그지 않습니다. 반환된 last_id를 after_id로 넘기면
+    중단된 지점부터 이어서 실행할 수 있습니다.
+    """
+    select_query = text("""
+        SELECT id, title, source_id, summary, section_id, country
+        FROM news_articles
+        WHERE id > :last_id
+          AND (summary LIKE '%<%' OR summary LIKE '%&%;%')
+        ORDER BY id
+        LIMIT :batch_size
+    """)
+    update_query = text("""
+        UPDATE news_articles
+        SET summary = :summary, analysis_text = :analysis_text
+        WHERE id = :id
+    """)
+
+    last_id = after_id or ""
+    processed = 0
+    updated = 0
+    batches = 0
+    done = False
+
+    while max_batches is None or batches < max_batches:
+        rows = db.execute(select_query, {'last_id': last_id, 'batch_size': batch_size}).fetchall()
+        if not rows:
+            done = True
+            break
+
+        changes = []
+        for row in rows:
+            cleaned = clean_html_text(row.summary)
+            if cleaned != row.summary:
+                changes.append({
+                    'id': row.id,
+                    'summary': cleaned,
+                    'analysis_text': format_analysis_text(
+                        row.title, source_cache.name(row.source_id), cleaned, section_cache.name(row.section_id), row.country
+                    )
+                })
+
+        if changes:
+            db.execute(update_query, changes)
+        db.commit()
+        if changes:
+            invalidate_news_fragments()
+
+        batches += 1
+        processed += len(rows)
+        updated += len(changes)
+        last_id = rows[-1].id
+        logger.info(f"HTML cleanup batch {batches}: processed={processed}, updated={updated}, last_id={last_id}")
+
+        if len(rows) < batch_size:
+            done = True
+            break
+
+    return {
+        "updated_rows": updated,
+        "processed_rows": processed,
+        "batches": batches,
+        "last_id": last_id or None,
+        "done": done
+    }
 
 
 @router.post("/html-tags")
-async def cleanup_html_tags():
-    """데이터베이스에서 HTML 태그를 정리합니다."""
+def cleanup_html_tags(
+    after_id: Optional[str] = Query(None, description="Resume after this article id"),
+    batch_size: int = Query(CLEANUP_BATCH_SIZE, ge=1, le=5000, description="Rows per batch"),
+    max_batches: int = Query(CLEANUP_MAX_BATCHES, ge=1, le=1000, description="Stop after this many batches")
+):
+    """
+    데이터베이스에서 HTML 태그를 정리합니다. (done=false면 last_id를 after_id로 넘겨 이어서 실행)
+
+    청크 SELECT/UPDATE를 동기로 반복하므로 일반 함수로 두어 스레드 풀에서 실행합니다.
+    """
     try:
         db = next(get_db())
         try:
-            # 데이터베이스 타입 확인
-            is_postgresql = os.getenv("DATABASE_URL", "").startswith("postgres")
-            
-            if is_postgresql:
-                # PostgreSQL용 쿼리
-                cleanup_query = text("""
-                    UPDATE news_articles 
-                    SET summary = REGEXP_REPLACE(
-                        REGEXP_REPLACE(
-                            REGEXP_REPLACE(
-                                REGEXP_REPLACE(
-                                    REGEXP_REPLACE(
-                                        REGEXP_REPLACE(
-                                            REGEXP_REPLACE(
-                                                REGEXP_REPLACE(
-                                                    REGEXP_REPLACE(
-                                                        REGEXP_REPLACE(summary, '&lt;', '<', 'g'),
-                                                        '&gt;', '>', 'g'
-                                                    ),
-                                                    '&amp;', '&', 'g'
-                                                ),
-                                                '&quot;', '"', 'g'
-                                            ),
-                                            '&#34;', '"', 'g'
-                                        ),
-                                        '<[^>]+>', '', 'g'
-                                    ),
-                                    '  ', ' ', 'g'
-                                ),
-                                '   ', ' ', 'g'
-                            ),
-                            '    ', ' ', 'g'
-                        ),
-                        '^\\s+|\\s+$', '', 'g'
-                    )
-                    WHERE summary LIKE '%<%' OR summary LIKE '%&lt;%'
-                """)
-                
-                result = db.execute(cleanup_query)
-                updated_count = result.rowcount
-            else:
-                # SQLite용 - Python에서 처리
-                articles_query = text("""
-                    SELECT id, summary FROM news_articles 
-                    WHERE summary LIKE '%<%' OR summary LIKE '%&lt;%'
-                """)
-                
-                articles = db.execute(articles_query).fetchall()
-                updated_count = 0
-                
-                for article_id, old_summary in articles:
-                    cleaned_summary = clean_html_summary(old_summary)
-                    if cleaned_summary != old_summary:
-                        update_query = text("""
-                            UPDATE news_articles SET summary = :new_summary WHERE id = :article_id
-                        """)
-                        db.execute(update_query, {
-                            'new_summary': cleaned_summary,
-                            'article_id': article_id
-                        })
-                        updated_count += 1
-            
-            db.commit()
-            
-            return create_success_response(
-                data={"updated_rows": updated_count},
-                message=f"Cleaned HTML tags from {updated_count} articles"
-            )
-            
+            result = run_html_cleanup(db, after_id=after_id, batch_size=batch_size, max_batches=max_batches)
         finally:
             db.close()
-            
+
+        return create_success_response(
+            data=result,
+            message=f"Cleaned HTML tags from {result['updated_rows']} articles"
+        )
+
     except Exception as e:
         raise handle_api_error(e, "Failed to cleanup HTML tags")
+
+
+@router.post("/retention")
+def archive_old_news(
+    max_batches: int = Query(RETENTION_MAX_BATCHES, ge=1, le=1000, description="Stop after this many batches"),
+    dry_run: bool = Query(False, description="Only count rows to archive")
+):
+    """
+    보관 기간(RETENTION_DAYS)이 지난 기사를 아카이브합니다. (done=false면 다시 호출)
+
+    배치 아카이브/DELETE를 동기로 반복하므로 일반 함수로 두어 스레드 풀에서 실행합니다.
+    """
+    try:
+        db = next(get_db())
+        try:
+            result = run_retention(db, max_batches=max_batches, dry_run=dry_run)
+        finally:
+            db.close()
+
+        return create_success_response(
+            data=result,
+            message=f"Archived {result['archived_rows']} articles older than {RETENTION_DAYS} days"
+        )
+
+    except Exception as e:
+        raise handle_api_error(e, "Failed to archive old news")
@@ -1,11 +1,12 @@
 # app/api/feeds.py
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.news_service import refresh_all_feeds
+from app.news_service import refresh_all_feeds_with_report
+from app.repositories import RefreshRunRepository
 from app.rss_feeds import get_all_feeds
 # from app.schemas import FeedsResponse, RefreshResponse
 from app.utils import create_success_response, handle_api_error
@@ -31,18 +32,80 @@ async def get_feeds():
 
 
 @router.post("/refresh")
-async def refresh_feeds():
-    """뉴스 피드 새로고침"""
+def refresh_feeds():
+    """뉴스 피드 새로고침 (동기 작업이므로 일반 함수로 두어 스레드 풀에서 실행, 이벤트 루프를 막지 않음)"""
     try:
-        result = refresh_all_feeds()
+        result, run = refresh_all_feeds_with_report()
         
         total_articles = sum(result.values())
         
         return create_success_response(
             data=result,
             message=f"Feed refresh completed. Collected {total_articles} articles",
-            meta={"total_articles": total_articles}
+            meta={
+                "total_articles": total_articles,
+                "new_articles": run['new_articles'],
+                "failed_feeds": run['failed_feeds'],
+                "duration_ms": run['duration_ms'],
+                "run_id": run.get('id')
+            }
         )
         
     except Exception as e:
         raise handle_api_error(e, "Failed to refresh feeds")
+
+
+@router.get("/refresh-runs")
+async def get_refresh_runs(
+    limit: int = Query(20, ge=1, le=200, description="Number of runs")
+):
+    """최근 피드 새로고침 실행 요약 목록"""
+    try:
+        db = next(get_db())
+        try:
+            runs = RefreshRunRepository(db).get_recent_runs(limit)
+        finally:
+            db.close()
+        
+        return create_success_response(
+            data=runs,
+            message=f"Retrieved {len(runs)} refresh runs",
+            meta={"limit": limit}
+        )
+        
+    except Exception as e:
+        raise handle_api_error(e, "Failed to get refresh runs")
+
+
+@router.get("/refresh-runs/latest")
+async def get_latest_refresh_run():
+    """가장 최근 새로고침의 피드별 프로파일 리포트"""
+    return _refresh_run_response(None)
+
+
+@router.get("/refresh-runs/{run_id}")
+async def get_refresh_run(run_id: int):
+    """새로고침 실행의 피드별 프로파일 리포트"""
+    return _refresh_run_response(run_id)
+
+
+def _refresh_run_response(run_id):
+    try:
+        db = next(get_db())
+        try:
+            run = RefreshRunRepository(db).get_run(run_id)
+        finally:
+            db.close()
+        
+        if run is None:
+            raise HTTPException(status_code=404, detail="Refresh run not found")
+        
+        return create_success_response(
+            data=run,
+            message=f"Retrieved refresh run {run['id']}"
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise handle_api_error(e, "Failed to get refresh run")
@@ -2,10 +2,8 @@
 import time
 import logging
 from fastapi import APIRouter
-from sqlalchemy import text
-from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import database_health
 # from app.schemas import HealthResponse
 from app.utils import create_success_response, handle_api_error
 
@@ -17,21 +15,15 @@ router = APIRouter(prefix="/api/v1", tags=["health"])
 async def health_check():
     """서버 상태 확인"""
     try:
-        # 데이터베이스 연결 확인
-        db = next(get_db())
-        try:
-            # 간단한 쿼리로 DB 연결 확인
-            db.execute(text("SELECT 1"))
-            db_status = "healthy"
-        except Exception as e:
-            db_status = f"unhealthy: {str(e)}"
-        finally:
-            db.close()
+        # 주 DB / 읽기 복제본 연결 확인
+        databases = database_health()
+        db_status = databases["primary"]["status"]
         
         health_data = {
             "status": "healthy",
             "timestamp": time.time(),
             "database": db_status,
+            "databases": databases,
             "message": "NextPicker News is running"
         }
         
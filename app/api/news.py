@@ -1,17 +1,25 @@
 # app/api/news.py
 import logging
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from app.article import LIST_FIELDS, RECENT_FIELDS
 from app.database import get_db
-from app.repositories import NewsRepository
+from app.dimensions import section_cache
+from app.news_stream import stream_events
+from app.ranking import top_story_entry
+from app.repositories import NewsRepository, RelatedRepository, StoryRepository
+from app.repositories.story_repository import ALL_SECTIONS
+from app.rss_feeds import get_countries
 from app.utils import (
-    create_success_response, 
+    create_fast_response, 
     handle_api_error, 
     validate_country, 
     validate_section,
     validate_pagination_params,
-    format_news_article
+    format_news_article,
+    serialize_articles
 )
 
 logger = logging.getLogger(__name__)
@@ -22,7 +30,8 @@ router = APIRouter(prefix="/api/v1/news", tags=["news"])
 async def get_all_news(
     days_us: int = Query(1, ge=1, le=30, description="US news days"),
     days_kr: int = Query(1, ge=1, le=30, description="KR news days"),
-    limit: int = Query(30, ge=1, le=100, description="Limit per country")
+    limit: int = Query(30, ge=1, le=100, description="Limit per country"),
+    collapse: bool = Query(False, description="Show one article per story cluster")
 ):
     """전체 뉴스 조회 (미국 + 한국)"""
     try:
@@ -32,8 +41,8 @@ async def get_all_news(
         db = next(get_db())
         try:
             repo = NewsRepository(db)
-            news_us = repo.get_recent_news('US', days=days_us, limit=limit)
-            news_kr = repo.get_recent_news('KR', days=days_kr, limit=limit)
+            news_us = repo.get_recent_news('US', days=days_us, limit=limit, collapse=collapse)
+            news_kr = repo.get_recent_news('KR', days=days_kr, limit=limit, collapse=collapse)
         finally:
             db.close()
         
@@ -45,11 +54,12 @@ async def get_all_news(
             "kr_count": len(news_kr),
             "days_us": days_us,
             "days_kr": days_kr,
-            "limit": limit
+            "limit": limit,
+            "collapse": collapse
         }
         
-        return create_success_response(
-            data=all_news,
+        return create_fast_response(
+            data=serialize_articles(all_news, RECENT_FIELDS),
             message=f"Retrieved {len(all_news)} news articles",
             meta=meta
         )
@@ -75,8 +85,8 @@ async def get_economy_politics_news(
             db.close()
         
         # 국가별로 분리
-        kr_articles = [a for a in all_articles if a['country'] == 'KR'][:limit]
-        us_articles = [a for a in all_articles if a['country'] == 'US'][:limit]
+        kr_articles = [a for a in all_articles if a.country == 'KR'][:limit]
+        us_articles = [a for a in all_articles if a.country == 'US'][:limit]
         
         meta = {
             "total": len(all_articles),
@@ -86,8 +96,8 @@ async def get_economy_politics_news(
             "limit": limit
         }
         
-        return create_success_response(
-            data=all_articles,
+        return create_fast_response(
+            data=serialize_articles(all_articles, LIST_FIELDS),
             message=f"Retrieved {len(all_articles)} economy/politics news articles",
             meta=meta
         )
@@ -96,12 +106,39 @@ async def get_economy_politics_news(
         raise handle_api_error(e, "Failed to get economy/politics news")
 
 
+@router.get("/stream")
+async def stream_news(
+    country: Optional[str] = Query(None, description="US or KR (default: both)"),
+    section: Optional[str] = Query(None, description="Section filter"),
+    last_event_id: Optional[int] = Query(None, description="Resume after this event id"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """신규 기사 실시간 스트림 (SSE) - 새로고침으로 저장된 기사만 DB 조회 없이 전달"""
+    try:
+        country = validate_country(country) if country else None
+        section = validate_section(section) if section else None
+        # EventSource 재연결 시 브라우저가 보내는 Last-Event-ID 헤더가 우선
+        if last_event_id_header and last_event_id_header.isdigit():
+            last_event_id = int(last_event_id_header)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise handle_api_error(e, "Failed to open news stream")
+
+    return StreamingResponse(
+        stream_events(country, section, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/sections/{section}")
 async def get_news_by_section(
     section: str,
     country: Optional[str] = Query(None, description="Country filter"),
     days: int = Query(1, ge=1, le=30, description="Days to look back"),
-    limit: int = Query(50, ge=1, le=100, description="Number of articles")
+    limit: int = Query(50, ge=1, le=100, description="Number of articles"),
+    collapse: bool = Query(False, description="Show one article per story cluster")
 ):
     """섹션별 뉴스 조회"""
     try:
@@ -113,7 +150,7 @@ async def get_news_by_section(
         db = next(get_db())
         try:
             repo = NewsRepository(db)
-            news = repo.get_news_by_section(section, country, days, limit)
+            news = repo.get_news_by_section(section, country, days, limit, collapse=collapse)
         finally:
             db.close()
         
@@ -122,11 +159,12 @@ async def get_news_by_section(
             "section": section,
             "country": country,
             "days": days,
-            "limit": limit
+            "limit": limit,
+            "collapse": collapse
         }
         
-        return create_success_response(
-            data=news,
+        return create_fast_response(
+            data=serialize_articles(news, LIST_FIELDS),
             message=f"Retrieved {len(news)} {section} news articles",
             meta=meta
         )
@@ -135,11 +173,134 @@ async def get_news_by_section(
         raise handle_api_error(e, f"Failed to get {section} news")
 
 
+@router.get("/search")
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    country: Optional[str] = Query(None, description="Country filter"),
+    section: Optional[str] = Query(None, description="Section filter"),
+    days: int = Query(1, ge=1, le=30, description="Days to look back"),
+    limit: int = Query(30, ge=1, le=100, description="Number of articles")
+):
+    """제목/요약 전문 검색 (관련도순)"""
+    try:
+        if not q.strip():
+            raise HTTPException(status_code=400, detail="Query parameter 'q' is required")
+        if country:
+            country = validate_country(country)
+        if section:
+            section = validate_section(section)
+        days, limit = validate_pagination_params(days, limit)
+        
+        db = next(get_db())
+        try:
+            repo = NewsRepository(db)
+            news = repo.search_news(q, country=country, section=section, days=days, limit=limit)
+        finally:
+            db.close()
+        
+        meta = {
+            "total": len(news),
+            "query": q,
+            "country": country,
+            "section": section,
+            "days": days,
+            "limit": limit
+        }
+        
+        return create_fast_response(
+            data=serialize_articles(news),
+            message=f"Found {len(news)} news articles matching '{q}'",
+            meta=meta
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise handle_api_error(e, "Failed to search news")
+
+
+@router.get("/top")
+async def get_top_stories(
+    country: Optional[str] = Query(None, description="US or KR (default: all countries)"),
+    section: Optional[str] = Query(None, description="Section filter"),
+    limit: int = Query(20, ge=1, le=50, description="Number of stories per country")
+):
+    """주요 사건 순위 - 수집 시 미리 계산한 상위 목록(top_stories)에서 조회"""
+    try:
+        countries = [validate_country(country)] if country else get_countries()
+        section_id = section_cache.lookup(validate_section(section)) if section else ALL_SECTIONS
+        
+        db = next(get_db())
+        try:
+            repo = StoryRepository(db)
+            stories = []
+            for code in countries:
+                stories.extend(repo.get_top_stories(code, section_id, limit))
+        finally:
+            db.close()
+        
+        # 국가별 순위를 점수 순으로 합침 (점수는 시각과 무관하게 비교 가능)
+        stories.sort(key=lambda item: item[1]['story_score'], reverse=True)
+        
+        meta = {
+            "total": len(stories),
+            "country": country.upper() if country else None,
+            "section": section.lower() if section else None,
+            "limit": limit
+        }
+        
+        return create_fast_response(
+            data=[top_story_entry(article, story) for article, story in stories],
+            message=f"Retrieved {len(stories)} top stories",
+            meta=meta
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise handle_api_error(e, "Failed to get top stories")
+
+
+@router.get("/{article_id}/related")
+async def get_related_articles(
+    article_id: str,
+    limit: int = Query(10, ge=1, le=50, description="Number of related articles")
+):
+    """관련 기사 - 수집 시 미리 계산한 목록(article_neighbors)에서 조회"""
+    try:
+        db = next(get_db())
+        try:
+            repo = RelatedRepository(db)
+            related = repo.get_related(article_id, limit)
+            if not related and not repo.article_exists(article_id):
+                raise HTTPException(status_code=404, detail="Article not found")
+        finally:
+            db.close()
+        
+        meta = {
+            "total": len(related),
+            "article_id": article_id,
+            "limit": limit
+        }
+        
+        return create_fast_response(
+            data=[{**article.to_dict(), 'score': score} for article, score in related],
+            message=f"Retrieved {len(related)} related articles",
+            meta=meta
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise handle_api_error(e, "Failed to get related articles")
+
+
 @router.get("/{country}")
 async def get_news_by_country(
     country: str,
     days: int = Query(1, ge=1, le=30, description="Days to look back"),
-    limit: int = Query(30, ge=1, le=100, description="Number of articles")
+    limit: int = Query(30, ge=1, le=100, description="Number of articles"),
+    collapse: bool = Query(False, description="Show one article per story cluster")
 ):
     """국가별 뉴스 조회"""
     try:
@@ -149,7 +310,7 @@ async def get_news_by_country(
         db = next(get_db())
         try:
             repo = NewsRepository(db)
-            news = repo.get_recent_news(country, days=days, limit=limit)
+            news = repo.get_recent_news(country, days=days, limit=limit, collapse=collapse)
         finally:
             db.close()
         
@@ -157,11 +318,12 @@ async def get_news_by_country(
             "total": len(news),
             "country": country,
             "days": days,
-            "limit": limit
+            "limit": limit,
+            "collapse": collapse
         }
         
-        return create_success_response(
-            data=news,
+        return create_fast_response(
+            data=serialize_articles(news, RECENT_FIELDS),
             message=f"Retrieved {len(news)} {country} news articles",
             meta=meta
         )
@@ -0,0 +1,79 @@
+# app/article.py
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from app.dimensions import section_cache, source_cache
+from app.timeutils import local_display, to_utc
+
+
+class Article(NamedTuple):
+    """
+    뉴스 기사 레코드
+
+    수집(fetch_rss_feed) → 저장(save_articles_to_db) → 조회(NewsRepository) → 템플릿까지
+    공통으로 사용하는 불변 타입입니다. tuple 기반이라 기사당 dict보다 메모리를 적게 쓰고,
+    DB row는 article_from_row(row)로 매핑합니다.
+
+    published/created_at은 UTC aware datetime이며, published_local_str/local_tz는
+    조회 직후 한 번 계산한 기사 국가의 현지 시각 표시값(KST/ET)입니다.
+    """
+    id: Optional[str]
+    title: str
+    url: Optional[str]
+    source: str
+    published: Any
+    summary: Optional[str] = None
+    section: Optional[str] = None
+    country: Optional[str] = None
+    created_at: Any = None
+    cluster_id: Optional[str] = None
+    published_local_str: Optional[str] = None
+    local_tz: Optional[str] = None
+
+    def to_dict(self, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """JSON 응답용 dict로 변환합니다. (fields: 응답에 넣을 필드, 기본은 전체)"""
+        if fields is None:
+            return self._asdict()
+        return {field: getattr(self, field) for field in fields}
+
+
+# 목록 API 응답 필드 - Article 도입 전의 응답 형식을 유지 (id는 넣지 않음)
+# cluster_id/published_local_str/local_tz는 이후 사건 묶기/현지 시각 표시와 함께 응답에 추가된 필드
+_ADDED_FIELDS = ("cluster_id", "published_local_str", "local_tz")
+# 최근 뉴스 (/api/v1/news/, /api/v1/news/{country})
+RECENT_FIELDS = ("title", "url", "source", "published", "summary", "section", "country", "created_at") + _ADDED_FIELDS
+# 섹션별/경제·정치 뉴스
+LIST_FIELDS = ("title", "url", "source", "published", "summary", "section", "country") + _ADDED_FIELDS
+
+
+def format_analysis_text(title: str, source: str, summary: Optional[str], section: Optional[str], country: Optional[str]) -> str:
+    """AI 분석용 텍스트 블록 형식 (제목/출처/요약/섹션/국가) - 수집 시점에 한 번 생성하여 저장"""
+    return f"제목: {title}\n출처: {source}\n요약: {summary or '요약 없음'}\n섹션: {section or 'general'}\n국가: {country}\n---"
+
+
+def article_from_row(row) -> Article:
+    """
+    ARTICLE_COLUMNS 순서의 DB row를 Article로 변환합니다.
+    (출처/섹션 ID → 이름, UTC 정규화 + 현지 시각 표시값 계산)
+    """
+    published, local_str, tz_name = local_display(row[4], row[7])
+    return Article(
+        row[0], row[1], row[2], source_cache.name(row[3]), published, row[5], section_cache.name(row[6]), row[7],
+        to_utc(row[8]), row[9], local_str, tz_name
+    )
+
+
+def articles_from_rows(rows: Iterable) -> List[Article]:
+    """조회 결과 전체를 한 번에 변환합니다."""
+    return [article_from_row(row) for row in rows]
+
+
+# SELECT 절 컬럼 순서 (Article 앞 10개 필드 순서와 반드시 일치해야 합니다, 출처/섹션은 차원 테이블 ID)
+ARTICLE_COLUMNS = "id, title, url, source_id, published, summary, section_id, country, created_at, cluster_id"
+
+# URL이 필요 없는 조회(AI 분석용 등)에서 사용하는 컬럼 목록
+ARTICLE_COLUMNS_NO_URL = "id, title, NULL AS url, source_id, published, summary, section_id, country, created_at, cluster_id"
+
+
+def article_columns(alias: str) -> str:
+    """테이블 별칭을 붙인 ARTICLE_COLUMNS (JOIN 쿼리용)"""
+    return ", ".join(f"{alias}.{column.strip()}" for column in ARTICLE_COLUMNS.split(","))
@@ -0,0 +1,126 @@
+# app/clustering.py
+"""
+유사 기사(같은 사건) 클러스터링
+
+구글 뉴스는 같은 사건을 여러 언론사 기사로 제공하므로 제목이 조금씩 다른 기사가 반복됩니다.
+기사마다 제목/요약으로 64비트 SimHash 시그니처를 계산하고, 16비트씩 4개 밴드로 나눈
+LSH 버킷에 색인합니다. 해밍 거리가 MAX_DISTANCE(3) 이하인 시그니처는 비둘기집 원리에
+의해 최소 한 밴드가 같으므로, 전체 쌍 비교 없이 버킷 후보만 비교하면 됩니다.
+"""
+import hashlib
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+SIGNATURE_BITS = 64
+BANDS = 4
+BAND_BITS = SIGNATURE_BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+MAX_DISTANCE = 3
+
+# 클러스터 비교 대상 기간 (일)
+CLUSTER_WINDOW_DAYS = 3
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def _strip_source_suffix(title: str, source: Optional[str]) -> str:
+    """구글 뉴스 제목 끝의 ' - 언론사명'을 제거합니다."""
+    if source and title.endswith(f" - {source}"):
+        return title[: -(len(source) + 3)]
+    return title
+
+
+def _features(text: str) -> Counter:
+    """단어 토큰 + 한글 단어의 문자 바이그램 (조사 변화에 덜 민감하도록)"""
+    features = Counter()
+    for token in TOKEN_RE.findall(text.lower()):
+        if len(token) < 2:
+            continue
+        features[token] += 1
+        if HANGUL_RE.search(token) and len(token) > 2:
+            for i in range(len(token) - 1):
+                features[token[i:i + 2]] += 1
+    return features
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """64비트 SimHash 시그니처 (unsigned)"""
+    features = _features(text)
+    if not features:
+        return 0
+
+    weights = [0] * SIGNATURE_BITS
+    for feature, weight in features.items():
+        h = _feature_hash(feature)
+        for bit in range(SIGNATURE_BITS):
+            if (h >> bit) & 1:
+                weights[bit] += weight
+            else:
+                weights[bit] -= weight
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def article_signature(title: str, summary: Optional[str], source: Optional[str]) -> int:
+    """기사 제목(언론사명 제외)과 요약으로 시그니처를 계산합니다."""
+    title = _strip_source_suffix(title or "", source)
+    summary = (summary or "").replace(source or "", " ") if source else (summary or "")
+    return simhash(f"{title} {title} {summary}")  # 제목에 가중치
+
+
+def to_signed(signature: int) -> int:
+    """DB BIGINT(부호 있는 64비트) 저장용 변환"""
+    return signature - (1 << 64) if signature >= (1 << 63) else signature
+
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class SimHashIndex:
+    """SimHash 시그니처 LSH 밴드 인덱스"""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._buckets: Dict[Tuple[int, int], List[Tuple[int, str]]] = defaultdict(list)
+
+    @staticmethod
+    def _bands(signature: int):
+        for band in range(BANDS):
+            yield band, (signature >> (band * BAND_BITS)) & BAND_MASK
+
+    def add(self, signature: int, cluster_id: str) -> None:
+        if not signature:
+            return
+        entry = (signature, cluster_id)
+        for key in self._bands(signature):
+            self._buckets[key].append(entry)
+
+    def find(self, signature: int) -> Optional[str]:
+        """가장 가까운 기존 기사의 cluster_id를 반환합니다. (없으면 None)"""
+        if not signature:
+            return None
+        best_id, best_distance = None, self.max_distance + 1
+        for key in self._bands(signature):
+            for candidate, cluster_id in self._buckets.get(key, ()):
+                distance = hamming_distance(signature, candidate)
+                if distance < best_distance:
+                    best_id, best_distance = cluster_id, distance
+        return best_id
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._buckets.values()) // BANDS
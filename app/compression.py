@@ -0,0 +1,150 @@
+# app/compression.py
+"""
+응답 압축 미들웨어
+
+Accept-Encoding 협상 결과에 따라 brotli(br) 또는 gzip으로 JSON/HTML/텍스트 응답을 압축합니다.
+- 최소 크기(COMPRESSION_MIN_SIZE) 미만의 응답은 압축하지 않습니다.
+- 동적 응답은 요청마다 압축합니다. (API envelope에 요청별 timestamp가 있어 같은 본문이 반복되지 않으므로
+  본문 기준 캐시는 적중하지 않음) 새로고침 사이에 바뀌지 않는 응답은 스냅샷 모드(app/snapshots.py)가
+  미리 압축한 파일로 제공합니다.
+- 스트리밍 응답(SSE 등)은 압축하지 않고 그대로 전달합니다.
+"""
+import gzip
+import logging
+import os
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "text/html",
+    "text/plain",
+    "text/css",
+    "application/javascript",
+)
+
+MINIMUM_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # 동적 응답용 (11은 너무 느림)
+# 미리 압축해 두는 정적 스냅샷용 최고 압축률 (한 번만 압축하므로 느려도 됨)
+GZIP_BEST_LEVEL = 9
+BROTLI_BEST_QUALITY = 11
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """서버가 지원하는 인코딩 목록 (선호 순)"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더를 해석하여 사용할 인코딩을 고릅니다."""
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress_body(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """본문을 지정한 인코딩으로 압축합니다. (best=True: 미리 압축하는 스냅샷용 최고 압축률)"""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_BEST_QUALITY if best else BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_BEST_LEVEL if best else GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class CompressionMiddleware:
+    """brotli/gzip 응답 압축 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """응답 메시지를 가로채 단일 본문 응답만 압축합니다."""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            return
+
+        if message["type"] != "http.response.body" or self.start_message is None:
+            await self.send(message)
+            return
+
+        start_message, self.start_message = self.start_message, None
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        # 스트리밍 응답이거나 압축 대상이 아니면 그대로 전달
+        if self.passthrough or more_body or len(body) < self.minimum_size:
+            await self.send(start_message)
+            await self.send(message)
+            self.passthrough = True
+            return
+
+        compressed = compress_body(body, self.encoding)
+
+        headers = MutableHeaders(raw=start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+
+        await self.send(start_message)
+        await self.send({"type": "http.response.body", "body": compressed})
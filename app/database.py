@@ -1,10 +1,17 @@
 # app/database.py
 import os
+import time
 import logging
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Integer
+import functools
+import inspect as pyinspect
+from sqlalchemy import create_engine, event, inspect, text, Column, String, DateTime, Text, Integer, BigInteger, SmallInteger, Float, LargeBinary, Index
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timezone, timedelta
+from sqlalchemy.orm import Session, sessionmaker
+from datetime import datetime, timedelta
+
+from app.metrics import install_query_hooks
+from app.timeutils import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -23,38 +30,371 @@ if not DATABASE_URL:
 else:
     logger.info("Using Neon PostgreSQL database")
 
-# 엔진 생성 (시간대 설정 추가)
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # SQL 로그 비활성화
-    pool_pre_ping=True,  # 연결 상태 확인
-    pool_recycle=300,  # 5분마다 연결 재생성
-    connect_args={"options": "-c timezone=Asia/Seoul"} if DATABASE_URL and "postgresql" in DATABASE_URL else {}
-)
+# 읽기 전용 복제본 URL (없으면 모든 조회가 주 DB로 감)
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+if DATABASE_READ_URL and DATABASE_READ_URL.startswith("postgres://"):
+    DATABASE_READ_URL = DATABASE_READ_URL.replace("postgres://", "postgresql://", 1)
+
+# 주 DB에 쓴 뒤 이 시간(초) 동안은 복제 지연을 피하려고 조회도 주 DB에서 (read-your-writes)
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "30"))
+# 복제본 연결 오류 후 이 시간(초) 동안은 복제본을 쓰지 않음
+REPLICA_RETRY_SECONDS = float(os.getenv("REPLICA_RETRY_SECONDS", "60"))
+
+
+def _create_engine(url: str):
+    """엔진 생성 (시각은 UTC로 저장하므로 PostgreSQL 세션 시간대도 UTC)"""
+    return create_engine(
+        url,
+        echo=False,  # SQL 로그 비활성화
+        pool_pre_ping=True,  # 연결 상태 확인
+        pool_recycle=300,  # 5분마다 연결 재생성
+        connect_args={"options": "-c timezone=UTC"} if "postgresql" in url else {}
+    )
+
+engine = _create_engine(DATABASE_URL)
+read_engine = _create_engine(DATABASE_READ_URL) if DATABASE_READ_URL else None
+if read_engine is not None:
+    logger.info("Routing repository reads to the read replica (DATABASE_READ_URL)")
+
+# 쿼리 시간 계측
+install_query_hooks(engine)
+if read_engine is not None:
+    install_query_hooks(read_engine)
+
+# 읽기/쓰기 분리 상태 (프로세스 단위)
+_last_primary_write = 0.0
+_replica_down_until = 0.0
+
+# session.info 키
+_REPLICA_DEPTH = "replica_read_depth"  # replica_read 메서드 실행 중 (중첩 호출 수)
+_FORCE_PRIMARY = "force_primary"       # 복제본 오류 후 재시도 중
+_USED_REPLICA = "used_replica"         # 현재 트랜잭션에서 복제본을 사용함
+_WROTE = "wrote_primary"               # 현재 트랜잭션에서 주 DB에 쓰기를 실행함
+
+
+def mark_primary_write() -> None:
+    """주 DB 쓰기 커밋 시각을 기록합니다. (이후 READ_YOUR_WRITES_SECONDS 동안 조회도 주 DB)"""
+    global _last_primary_write
+    _last_primary_write = time.monotonic()
+
+
+def read_your_writes_active() -> bool:
+    return time.monotonic() - _last_primary_write < READ_YOUR_WRITES_SECONDS
+
+
+def replica_available() -> bool:
+    return read_engine is not None and time.monotonic() >= _replica_down_until
+
+
+def _is_read_statement(clause) -> bool:
+    """SELECT 문인지 (raw text()는 첫 키워드로 판단)"""
+    if clause is None:
+        return False
+    if getattr(clause, "is_select", False):
+        return True
+    sql = getattr(clause, "text", None)
+    if not isinstance(sql, str):
+        return False
+    words = sql.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in ("SELECT", "WITH")
+
+
+class RoutingSession(Session):
+    """읽기/쓰기 분리 세션
+
+    replica_read로 표시한 Repository 메서드 안의 SELECT만 복제본(read_engine)으로 보내고,
+    나머지(쓰기, 표시 없는 조회, 마이그레이션)는 모두 주 DB로 보냅니다.
+    한 트랜잭션에서 주 DB에 쓴 뒤에는 커밋/롤백 전까지 조회도 주 DB를 사용합니다.
+    """
+
+    def get_bind(self, mapper=None, **kw):
+        clause = kw.get("clause")
+        is_read = _is_read_statement(clause) and not self._flushing
+        if (
+            is_read
+            and self.info.get(_REPLICA_DEPTH)
+            and not self.info.get(_FORCE_PRIMARY)
+            and not self.info.get(_WROTE)
+            and replica_available()
+            and not read_your_writes_active()
+        ):
+            self.info[_USED_REPLICA] = True
+            return read_engine
+        if not is_read:
+            self.info[_WROTE] = True
+        return super().get_bind(mapper, **kw)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _after_commit(session):
+    if session.info.pop(_WROTE, False):
+        mark_primary_write()
+    session.info.pop(_USED_REPLICA, None)
+
 
-# 세션 팩토리
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(RoutingSession, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(_WROTE, None)
+    session.info.pop(_USED_REPLICA, None)
+
+
+def replica_read(method):
+    """Repository 조회 메서드 데코레이터: 실행 중 SELECT를 복제본으로 보냅니다.
+
+    복제본 연결 오류면 REPLICA_RETRY_SECONDS 동안 복제본을 끄고 주 DB로 한 번 다시 실행합니다.
+    (제너레이터 메서드는 스트리밍 중 재시도할 수 없으므로 재시도하지 않음)
+    """
+    if pyinspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            info = self.db.info
+            generator = method(self, *args, **kwargs)
+            while True:
+                info[_REPLICA_DEPTH] = info.get(_REPLICA_DEPTH, 0) + 1
+                try:
+                    value = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    info[_REPLICA_DEPTH] -= 1
+                yield value
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        info = self.db.info
+        info[_REPLICA_DEPTH] = info.get(_REPLICA_DEPTH, 0) + 1
+        try:
+            return method(self, *args, **kwargs)
+        except DBAPIError as e:
+            if not info.get(_USED_REPLICA) or info[_REPLICA_DEPTH] > 1:
+                raise
+            global _replica_down_until
+            _replica_down_until = time.monotonic() + REPLICA_RETRY_SECONDS
+            logger.warning(f"Read replica failed, falling back to primary for {REPLICA_RETRY_SECONDS:.0f}s: {e}")
+            # 복제본 트랜잭션만 사용 중이었으므로 (쓰기가 있었다면 주 DB로 갔음) 롤백해도 잃는 변경 없음
+            self.db.rollback()
+            info[_FORCE_PRIMARY] = True
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                info.pop(_FORCE_PRIMARY, None)
+        finally:
+            info[_REPLICA_DEPTH] -= 1
+    return wrapper
+
+
+def _check_engine(target, replica: bool = False) -> dict:
+    """엔진 하나의 연결 상태와 지연 시간 (PostgreSQL 복제본은 마지막 재생 트랜잭션 이후 경과 시간 포함)"""
+    started = time.perf_counter()
+    try:
+        with target.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            result = {"status": "healthy", "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+            if replica and target.dialect.name == "postgresql":
+                lag = conn.execute(text("""
+                    SELECT CASE WHEN pg_is_in_recovery()
+                        THEN EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END
+                """)).scalar()
+                result["replay_lag_seconds"] = round(float(lag), 3) if lag is not None else None
+            return result
+    except Exception as e:
+        return {"status": f"unhealthy: {str(e)}"}
+
+
+def database_health() -> dict:
+    """주 DB와 읽기 복제본의 상태 (헬스 체크용)"""
+    health = {"primary": _check_engine(engine)}
+    if read_engine is None:
+        health["replica"] = {"status": "not configured"}
+    else:
+        health["replica"] = _check_engine(read_engine, replica=True)
+        health["replica"]["routing"] = (
+            "primary (read-your-writes)" if read_your_writes_active()
+            else "replica" if replica_available() else "primary (replica retry pending)"
+        )
+    return health
+
+
+# 세션 팩토리 (replica_read 메서드의 조회만 복제본으로 라우팅)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+# PostgreSQL에서 news_articles를 발행월 기준 파티션 테이블로 생성할지 여부 (신규 테이블에만 적용)
+ENABLE_PARTITIONING = os.getenv("ENABLE_PARTITIONING", "false").lower() == "true"
 
 # 베이스 클래스
 Base = declarative_base()
 
+class Source(Base):
+    """기사 출처 차원 테이블 (news_articles.source_id)"""
+    __tablename__ = "sources"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), unique=True, nullable=False)
+
+class Section(Base):
+    """섹션 차원 테이블 (news_articles.section_id)"""
+    __tablename__ = "sections"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(50), unique=True, nullable=False)
+
 class NewsArticle(Base):
-    """뉴스 기사 모델"""
+    """뉴스 기사 모델 (출처/섹션은 차원 테이블 ID로 저장, app/dimensions.py에서 이름으로 변환)"""
     __tablename__ = "news_articles"
+    __table_args__ = (
+        Index("ix_news_articles_section_published", "section_id", "published"),
+        Index("ix_news_articles_source_id", "source_id"),
+        Index("ix_news_articles_cluster_id", "cluster_id"),
+    )
     
     id = Column(String(32), primary_key=True)  # URL의 MD5 해시
     title = Column(String(500), nullable=False)
     url = Column(String(1000), unique=True, nullable=False)
-    source = Column(String(100), nullable=False)
-    published = Column(DateTime, nullable=False)
+    source_id = Column(Integer, nullable=False)  # sources.id
+    published = Column(DateTime, nullable=False)  # UTC
     summary = Column(Text)
-    section = Column(String(50))  # 섹션 분류 (politics, business, technology, etc.)
+    section_id = Column(SmallInteger)  # sections.id (politics, business, technology, etc.)
     country = Column(String(2), nullable=False)  # 'US' 또는 'KR'
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone(timedelta(hours=9))))
+    created_at = Column(DateTime, default=lambda: utc_now().replace(tzinfo=None))  # UTC
+    analysis_text = Column(Text)  # AI 분석용 텍스트 블록 (수집 시점에 미리 생성)
+    simhash = Column(BigInteger)  # 유사 기사 판별용 SimHash 시그니처
+    cluster_id = Column(String(32))  # 같은 사건으로 묶인 기사들의 대표 기사 ID
+    section_from_feed = Column(SmallInteger)  # 1: 섹션 피드가 정한 섹션(분류 모델 학습 라벨), 0: 분류기로 정한 섹션
     
     def __repr__(self):
         return f"<NewsArticle(title='{self.title[:30]}...', country='{self.country}')>"
 
+class NewsArticleArchive(Base):
+    """보관 기간(RETENTION_DAYS)이 지난 뉴스 기사 보관 테이블"""
+    __tablename__ = "news_articles_archive"
+    
+    id = Column(String(32), primary_key=True)
+    title = Column(String(500), nullable=False)
+    url = Column(String(1000), nullable=False)
+    source = Column(String(100), nullable=False)
+    published = Column(DateTime, nullable=False, index=True)
+    summary = Column(Text)
+    section = Column(String(50))
+    country = Column(String(2), nullable=False)
+    created_at = Column(DateTime)
+    cluster_id = Column(String(32))
+    archived_at = Column(DateTime)
+    
+    def __repr__(self):
+        return f"<NewsArticleArchive(title='{self.title[:30]}...', country='{self.country}')>"
+
+class Story(Base):
+    """클러스터(사건)별 중요도 점수 (app/ranking.py가 수집 시 갱신)"""
+    __tablename__ = "stories"
+    
+    cluster_id = Column(String(32), primary_key=True)
+    country = Column(String(2), nullable=False)
+    section_id = Column(SmallInteger)  # 대표 기사(가장 최근 기사)의 섹션
+    article_id = Column(String(32), nullable=False)  # 대표 기사 ID
+    source_count = Column(Integer, nullable=False)  # 보도한 서로 다른 출처 수
+    feed_hits = Column(Integer, nullable=False)  # 한 번의 새로고침에서 이 사건을 실은 피드 수 (최댓값)
+    article_count = Column(Integer, nullable=False)
+    last_published = Column(DateTime, nullable=False, index=True)  # UTC
+    story_score = Column(Float, nullable=False)  # log 공간 점수 (시간이 지나도 순위가 변하지 않는 형태)
+    updated_at = Column(DateTime)
+
+class TopStory(Base):
+    """국가/섹션별 미리 계산한 상위 N개 사건 (section_id 0은 전체 섹션)"""
+    __tablename__ = "top_stories"
+    
+    country = Column(String(2), primary_key=True)
+    section_id = Column(SmallInteger, primary_key=True)
+    rank = Column(SmallInteger, primary_key=True)
+    cluster_id = Column(String(32), nullable=False)
+    article_id = Column(String(32), nullable=False)
+    story_score = Column(Float, nullable=False)
+    last_published = Column(DateTime, nullable=False)
+
+class TrendingBucket(Base):
+    """국가별 시간 버킷의 키워드 빈도 요약 (Count-Min Sketch + 상위 키워드, app/trending.py)"""
+    __tablename__ = "trending_buckets"
+    
+    country = Column(String(2), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)  # UTC, 시간/일 단위로 내림
+    bucket_hours = Column(SmallInteger, nullable=False)  # 1: 시간 버킷, 24: 일 버킷 (오래된 시간 버킷을 합친 것)
+    article_count = Column(Integer, nullable=False, default=0)
+    sketch = Column(LargeBinary)  # zlib 압축한 Count-Min Sketch 카운터 배열
+    heavy_hitters = Column(Text)  # Space-Saving 상위 키워드 (JSON: {키워드: [개수, 오차]})
+    updated_at = Column(DateTime)
+
+class SectionModel(Base):
+    """학습한 섹션 분류 모델 (app/section_classifier.py)"""
+    __tablename__ = "section_models"
+
+    name = Column(String(50), primary_key=True)
+    trained_at = Column(DateTime, nullable=False)  # UTC, 프로세스별 캐시 갱신 판단용
+    model = Column(LargeBinary, nullable=False)  # 클래스별 특징 개수 (np.savez_compressed)
+    metrics = Column(Text)  # 학습 행 수, 시간순 검증 정확도 등 (JSON)
+
+class ArticleNeighbor(Base):
+    """기사별 미리 계산한 관련 기사 상위 k개 (TF-IDF 코사인 유사도, app/related.py)"""
+    __tablename__ = "article_neighbors"
+
+    article_id = Column(String(32), primary_key=True)
+    rank = Column(SmallInteger, primary_key=True)
+    neighbor_id = Column(String(32), nullable=False)
+    score = Column(Float, nullable=False)  # 계산 시점의 코사인 유사도
+
+class UrlAlias(Base):
+    """구글 뉴스 래퍼 URL → 원문(정규화) URL 캐시 (app/url_resolver.py)"""
+    __tablename__ = "url_aliases"
+
+    wrapper_url = Column(String(1000), primary_key=True)  # 쿼리를 뗀 news.google.com/rss/articles/... 경로 (news_articles.url과 같은 길이)
+    canonical_url = Column(String(1000))  # 추적 파라미터를 제거한 원문 URL (해석 실패 시 NULL)
+    resolved_at = Column(DateTime, nullable=False)  # UTC, 마지막 해석 시도 시각 (실패 항목 재시도 판단용)
+
+class DailyDigest(Base):
+    """날짜별로 미리 만들어 둔 경제/정치 뉴스 Slack 요약 (app/digest.py가 새로고침 직후 생성)"""
+    __tablename__ = "daily_digests"
+
+    digest_date = Column(String(10), primary_key=True)  # KST 날짜 (YYYY-MM-DD)
+    message = Column(Text, nullable=False)  # Slack으로 그대로 보낼 메시지
+    article_counts = Column(Text, nullable=False)  # 국가별 기사 수 (JSON: {"KR": 20, "US": 20})
+    total_articles = Column(Integer, nullable=False)
+    created_at = Column(DateTime)  # UTC, 마지막으로 다시 만든 시각
+
+class DigestDelivery(Base):
+    """요약 전송 기록 - 날짜+채널 멱등 키로 같은 요약이 한 채널에 두 번 전송되지 않게 함"""
+    __tablename__ = "digest_deliveries"
+
+    idempotency_key = Column(String(200), primary_key=True)  # "{digest_date}:{channel}"
+    digest_date = Column(String(10), nullable=False, index=True)
+    channel = Column(String(100), nullable=False)
+    status = Column(String(10), nullable=False)  # sending / sent / failed
+    attempts = Column(Integer, nullable=False, default=1)
+    claimed_at = Column(DateTime)  # UTC, 마지막 전송 시도 시작 시각 (sending 임대 만료 판단용)
+    sent_at = Column(DateTime)
+
+class RefreshRun(Base):
+    """피드 새로고침 실행 기록 (피드별 수집 프로파일 리포트)"""
+    __tablename__ = "refresh_runs"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    started_at = Column(DateTime, nullable=False, index=True)
+    finished_at = Column(DateTime)
+    duration_ms = Column(Integer)
+    total_feeds = Column(Integer)
+    failed_feeds = Column(Integer)
+    fetched_entries = Column(Integer)
+    new_articles = Column(Integer)
+    report = Column(Text)  # 피드별 상세 리포트 (JSON)
+    
+    def __repr__(self):
+        return f"<RefreshRun(id={self.id}, started_at='{self.started_at}', new_articles={self.new_articles})>"
+
+class SchemaMigration(Base):
+    """한 번만 실행하는 데이터 마이그레이션 적용 기록"""
+    __tablename__ = "schema_migrations"
+    
+    name = Column(String(100), primary_key=True)
+    applied_at = Column(DateTime)
+
 def get_db():
     """데이터베이스 세션을 반환합니다."""
     db = SessionLocal()
@@ -63,10 +403,275 @@ def get_db():
     finally:
         db.close()
 
+def _add_missing_columns():
+    """기존 테이블에 모델에 새로 추가된 컬럼을 추가합니다. (create_all은 컬럼을 추가하지 않음)"""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                logger.info(f"Added column {table.name}.{column.name}")
+
+def _migrate_published_to_utc(conn):
+    """
+    published를 UTC로 통일합니다.
+    - PostgreSQL: 기존 세션 시간대(Asia/Seoul)로 변환되어 KST 시각으로 저장된 값 → 9시간 빼기
+    - SQLite: 오프셋이 붙은 문자열('...+09:00') → datetime()으로 UTC 문자열
+    """
+    for table in ("news_articles", "news_articles_archive"):
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(f"UPDATE {table} SET published = published - INTERVAL '9 hours'"))
+        else:
+            conn.execute(text(f"UPDATE {table} SET published = datetime(published) WHERE published IS NOT NULL"))
+
+def _migrate_normalize_source_section(conn):
+    """
+    news_articles의 source/section 문자열을 sources/sections 차원 테이블 ID로 옮기고 문자열 컬럼을 삭제합니다.
+    (source_id/section_id 컬럼은 _add_missing_columns가 먼저 추가, 보관 테이블은 문자열 그대로 유지)
+    삭제된 공간은 VACUUM(PostgreSQL: VACUUM FULL news_articles) 후 반환됩니다.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("news_articles")}
+    for column, table in (("source", "sources"), ("section", "sections")):
+        if column not in columns:
+            continue
+        conn.execute(text(f"""
+            INSERT INTO {table} (name)
+            SELECT DISTINCT {column} FROM news_articles WHERE {column} IS NOT NULL
+            ON CONFLICT (name) DO NOTHING
+        """))
+        conn.execute(text(f"""
+            UPDATE news_articles
+            SET {column}_id = (SELECT d.id FROM {table} d WHERE d.name = news_articles.{column})
+        """))
+        conn.execute(text(f"ALTER TABLE news_articles DROP COLUMN {column}"))
+    # 기존 테이블에는 create_all이 인덱스를 만들지 않으므로 직접 생성
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_news_articles_section_published ON news_articles (section_id, published)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_news_articles_source_id ON news_articles (source_id)"))
+
+def _migrate_cluster_id_index(conn):
+    """사건(클러스터)별 기사 조회용 cluster_id 인덱스 (기존 테이블에는 create_all이 만들지 않음)"""
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_news_articles_cluster_id ON news_articles (cluster_id)"))
+
+def _migrate_url_alias_width(conn):
+    """url_aliases.wrapper_url을 news_articles.url과 같은 길이로 넓힙니다. (SQLite는 길이를 검사하지 않음)"""
+    if engine.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE url_aliases ALTER COLUMN wrapper_url TYPE VARCHAR(1000)"))
+
+# 이름 → 함수 (순서대로 한 번씩 실행)
+DATA_MIGRATIONS = (
+    ("published_utc", _migrate_published_to_utc),
+    ("normalize_source_section", _migrate_normalize_source_section),
+    ("cluster_id_index", _migrate_cluster_id_index),
+    ("url_alias_width", _migrate_url_alias_width),
+)
+
+def _apply_data_migrations():
+    """
+    적용되지 않은 데이터 마이그레이션을 실행합니다.
+    적용 기록을 먼저 INSERT하므로 여러 인스턴스가 동시에 시작해도 한 번만 적용됩니다. (PK 충돌 시 롤백)
+    """
+    with engine.connect() as conn:
+        applied = {row.name for row in conn.execute(text("SELECT name FROM schema_migrations"))}
+    
+    for name, migrate in DATA_MIGRATIONS:
+        if name in applied:
+            continue
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("INSERT INTO schema_migrations (name, applied_at) VALUES (:name, :applied_at)"),
+                             {'name': name, 'applied_at': utc_now().replace(tzinfo=None)})
+                migrate(conn)
+            logger.info(f"Applied data migration {name}")
+        except Exception as e:
+            logger.warning(f"Data migration {name} skipped: {e}")
+
+def _init_postgres_search_index(conn):
+    """
+    PostgreSQL 전문 검색 인덱스 (tsvector 생성 컬럼 + GIN)
+    한국어는 형태소 분석 사전이 없으므로 'simple' 설정으로 토큰을 그대로 색인하고,
+    검색 시 접두사 매칭(term:*)으로 조사가 붙은 어절('대통령이' 등)까지 찾습니다.
+    """
+    conn.execute(text("""
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(summary, ''))
+        ) STORED
+    """))
+    conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_news_articles_search_vector
+        ON news_articles USING GIN (search_vector)
+    """))
+
+def _init_sqlite_search_index(conn):
+    """
+    SQLite FTS5 전문 검색 인덱스 (contentless FTS 테이블 + 기사 id 매핑 테이블 + 동기화 트리거)
+
+    news_articles는 TEXT 기본 키라 rowid가 암시적이고 VACUUM 때 바뀔 수 있으므로 FTS rowid로 쓰지 않습니다.
+    news_articles_fts_ids의 INTEGER PRIMARY KEY(rowid 별칭, VACUUM에도 유지)를 FTS rowid로 쓰고
+    검색 결과는 article_id로 기사와 조인합니다. (이전의 content_rowid='rowid' 인덱스는 다시 만듦)
+    """
+    tables = {row.name for row in conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('news_articles_fts', 'news_articles_fts_ids')"
+    ))}
+    if tables == {"news_articles_fts", "news_articles_fts_ids"}:
+        return
+    
+    for trigger in ("news_articles_fts_ai", "news_articles_fts_ad", "news_articles_fts_au"):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    conn.execute(text("DROP TABLE IF EXISTS news_articles_fts"))
+    conn.execute(text("DROP TABLE IF EXISTS news_articles_fts_ids"))
+    
+    conn.execute(text("""
+        CREATE TABLE news_articles_fts_ids (
+            rowid INTEGER PRIMARY KEY,
+            article_id VARCHAR(32) NOT NULL UNIQUE
+        )
+    """))
+    conn.execute(text("""
+        CREATE VIRTUAL TABLE news_articles_fts USING fts5(
+            title, summary,
+            content='',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """))
+    conn.execute(text("""
+        CREATE TRIGGER news_articles_fts_ai AFTER INSERT ON news_articles BEGIN
+            INSERT INTO news_articles_fts_ids(article_id) VALUES (new.id);
+            INSERT INTO news_articles_fts(rowid, title, summary)
+            VALUES ((SELECT rowid FROM news_articles_fts_ids WHERE article_id = new.id), new.title, new.summary);
+        END
+    """))
+    conn.execute(text("""
+        CREATE TRIGGER news_articles_fts_ad AFTER DELETE ON news_articles BEGIN
+            INSERT INTO news_articles_fts(news_articles_fts, rowid, title, summary)
+            VALUES ('delete', (SELECT rowid FROM news_articles_fts_ids WHERE article_id = old.id), old.title, old.summary);
+            DELETE FROM news_articles_fts_ids WHERE article_id = old.id;
+        END
+    """))
+    conn.execute(text("""
+        CREATE TRIGGER news_articles_fts_au AFTER UPDATE OF title, summary ON news_articles BEGIN
+            INSERT INTO news_articles_fts(news_articles_fts, rowid, title, summary)
+            VALUES ('delete', (SELECT rowid FROM news_articles_fts_ids WHERE article_id = old.id), old.title, old.summary);
+            INSERT INTO news_articles_fts(rowid, title, summary)
+            VALUES ((SELECT rowid FROM news_articles_fts_ids WHERE article_id = new.id), new.title, new.summary);
+        END
+    """))
+    # 기존 기사 색인
+    conn.execute(text("INSERT INTO news_articles_fts_ids(article_id) SELECT id FROM news_articles"))
+    conn.execute(text("""
+        INSERT INTO news_articles_fts(rowid, title, summary)
+        SELECT m.rowid, a.title, a.summary
+        FROM news_articles_fts_ids m
+        JOIN news_articles a ON a.id = m.article_id
+    """))
+    logger.info("Created SQLite FTS5 search index")
+
+def _init_search_index():
+    """전문 검색 인덱스를 생성합니다. (실패해도 서비스는 LIKE 검색으로 동작)"""
+    try:
+        with engine.begin() as conn:
+            if engine.dialect.name == "postgresql":
+                _init_postgres_search_index(conn)
+            elif engine.dialect.name == "sqlite":
+                _init_sqlite_search_index(conn)
+    except Exception as e:
+        logger.warning(f"Full-text search index unavailable, falling back to LIKE search: {e}")
+
+_search_backend = None
+
+def get_search_backend() -> str:
+    """사용 가능한 검색 방식을 반환합니다: 'postgres', 'fts5' 또는 'like'"""
+    global _search_backend
+    if _search_backend is None:
+        backend = "like"
+        try:
+            with engine.connect() as conn:
+                if engine.dialect.name == "postgresql":
+                    found = conn.execute(text("""
+                        SELECT 1 FROM information_schema.columns
+                        WHERE table_name = 'news_articles' AND column_name = 'search_vector'
+                    """)).first()
+                    backend = "postgres" if found else "like"
+                elif engine.dialect.name == "sqlite":
+                    # id 매핑 테이블은 현재 구조의 인덱스에만 있음 (이전 rowid 기반 인덱스는 LIKE로 대체)
+                    found = conn.execute(text(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_articles_fts_ids'"
+                    )).first()
+                    backend = "fts5" if found else "like"
+        except Exception as e:
+            logger.warning(f"Failed to detect search backend: {e}")
+        _search_backend = backend
+    return _search_backend
+
+def partition_name(month: datetime) -> str:
+    """월별 파티션 테이블 이름 (news_articles_pYYYYMM)"""
+    return f"news_articles_p{month:%Y%m}"
+
+def month_start(value: datetime, offset: int = 0) -> datetime:
+    """value가 속한 달의 1일 (offset만큼 이동한 달)"""
+    month_index = value.year * 12 + value.month - 1 + offset
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+def ensure_monthly_partitions(conn, start: datetime, months_ahead: int = 1) -> None:
+    """start가 속한 달부터 months_ahead개월 뒤까지 월별 파티션을 생성합니다."""
+    month = month_start(start)
+    last = month_start(utc_now().replace(tzinfo=None), months_ahead)
+    while month <= last:
+        next_month = month_start(month, 1)
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {partition_name(month)}
+            PARTITION OF news_articles
+            FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')
+        """))
+        month = next_month
+
+def _create_partitioned_news_table():
+    """
+    PostgreSQL: news_articles를 published 기준 RANGE 파티션 테이블로 생성합니다.
+    파티션 테이블의 PK/UNIQUE는 파티션 키를 포함해야 하므로 PK는 (id, published)이며,
+    URL 중복 확인은 저장 시 조회(save_article)와 url 인덱스로 처리합니다.
+    """
+    table = NewsArticle.__table__
+    columns = []
+    for column in table.columns:
+        definition = f"{column.name} {column.type.compile(dialect=engine.dialect)}"
+        if not column.nullable:
+            definition += " NOT NULL"
+        columns.append(definition)
+    
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            CREATE TABLE news_articles (
+                {', '.join(columns)},
+                PRIMARY KEY (id, published)
+            ) PARTITION BY RANGE (published)
+        """))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_news_articles_url ON news_articles (url)"))
+        conn.execute(text("CREATE TABLE IF NOT EXISTS news_articles_default PARTITION OF news_articles DEFAULT"))
+        ensure_monthly_partitions(conn, utc_now().replace(tzinfo=None) - timedelta(days=31))
+    logger.info("Created partitioned news_articles table")
+
 def init_db():
     """데이터베이스 테이블을 생성합니다."""
+    global _search_backend
     try:
+        if ENABLE_PARTITIONING and engine.dialect.name == "postgresql":
+            if not inspect(engine).has_table("news_articles"):
+                _create_partitioned_news_table()
+        
         Base.metadata.create_all(bind=engine)
+        _add_missing_columns()
+        _apply_data_migrations()
+        _init_search_index()
+        _search_backend = None
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Failed to create database tables: {e}")
@@ -0,0 +1,130 @@
+# app/digest.py
+"""
+일일 경제/정치 뉴스 Slack 요약 - 새로고침 직후 미리 생성, 알림 요청은 저장된 요약만 전송
+
+- 생성: refresh_all_feeds_with_report가 끝나면 오늘(KST) 요약을 daily_digests에 저장합니다.
+  DIGEST_BUILD_AFTER_HOUR(KST) 이전의 새로고침은 건너뛰므로 7:50 새로고침 결과가 8:00에 전송됩니다.
+  국가별로 따로 최신 DIGEST_ARTICLES_PER_COUNTRY개를 뽑아 한 국가가 다른 국가 몫을 차지하지 않습니다.
+  한 채널이라도 전송을 시작한 날짜의 요약은 다시 만들지 않습니다.
+- 전송: 날짜+채널 멱등 키("{digest_date}:{channel}")를 digest_deliveries에 먼저 선점한 요청만 게시합니다.
+  워크플로가 재시도해도 이미 sent인 채널은 건너뛰고, failed 채널만 다시 보냅니다.
+  sending 상태로 DIGEST_SEND_LEASE_SECONDS가 지난 키(게시 도중 중단된 요청)는 다시 선점할 수 있습니다.
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.article import Article
+from app.repositories.digest_repository import DigestRepository
+from app.repositories.news_repository import NewsRepository
+from app.slack_notifier import slack
+from app.timeutils import KST, utc_now
+
+logger = logging.getLogger(__name__)
+
+DIGEST_ARTICLES_PER_COUNTRY = int(os.getenv("DIGEST_ARTICLES_PER_COUNTRY", "20"))
+DIGEST_BUILD_AFTER_HOUR = int(os.getenv("DIGEST_BUILD_AFTER_HOUR", "7"))       # KST, 이 시각 이후 새로고침만 요약 생성
+DIGEST_SEND_LEASE_SECONDS = int(os.getenv("DIGEST_SEND_LEASE_SECONDS", "120"))  # 전송 중 상태 유지 시간
+
+# 요약에 싣는 국가 순서와 제목 (그 밖의 국가는 뒤에 국가 코드로 표시)
+DIGEST_COUNTRY_LABELS = {
+    "KR": "🇰🇷 *한국 경제·정치 기사",
+    "US": "🇺🇸 *미국 경제·정치 기사",
+}
+DIGEST_TITLE_LENGTH = 45
+NEWS_PAGE_URL = "https://lumina-next-picker.vercel.app/news"
+
+
+def digest_date_for(now: Optional[datetime] = None) -> str:
+    """요약 날짜 (KST 기준 YYYY-MM-DD)"""
+    return (now or utc_now()).astimezone(KST).date().isoformat()
+
+
+def format_digest(by_country: Dict[str, List[Article]]) -> str:
+    """국가별 기사로 Slack 메시지를 만듭니다."""
+    countries = list(DIGEST_COUNTRY_LABELS) + sorted(c for c in by_country if c not in DIGEST_COUNTRY_LABELS)
+    message = "📊 *경제·정치 뉴스 요약*\n"
+    for country in countries:
+        articles = by_country.get(country, [])
+        label = DIGEST_COUNTRY_LABELS.get(country, f"*{country} 경제·정치 기사")
+        message += f"\n{label} ({len(articles)}개)*\n"
+        for i, article in enumerate(articles, 1):
+            section_info = f"[{article.section}]" if article.section else ""
+            message += f"{i}. {section_info} <{article.url}|{article.title[:DIGEST_TITLE_LENGTH]}...>\n"
+    message += f"\n🔗 <{NEWS_PAGE_URL}|전체 뉴스 보기>"
+    return message
+
+
+def build_daily_digest(db: Session, now: Optional[datetime] = None, force: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    오늘(KST) 요약을 만들어 저장합니다. (DIGEST_BUILD_AFTER_HOUR 이전이면 force가 아닌 한 건너뜀)
+    이미 전송을 시작한 날짜면 저장된 요약을 그대로 두고 saved=False를 반환합니다.
+    """
+    now = now or utc_now()
+    if not force and now.astimezone(KST).hour < DIGEST_BUILD_AFTER_HOUR:
+        return None
+
+    by_country = NewsRepository(db).get_economy_politics_news_by_country(days=1, limit=DIGEST_ARTICLES_PER_COUNTRY)
+    counts = {country: len(by_country.get(country, [])) for country in DIGEST_COUNTRY_LABELS}
+    counts.update({country: len(articles) for country, articles in by_country.items()})
+    digest_date = digest_date_for(now)
+
+    repo = DigestRepository(db)
+    saved = repo.save_digest(
+        digest_date, format_digest(by_country), json.dumps(counts), sum(counts.values()),
+        now.replace(tzinfo=None)
+    )
+    repo.commit()
+    logger.info(f"{'Built' if saved else 'Kept already-sent'} daily digest for {digest_date}: {counts}")
+    return {'digest_date': digest_date, 'counts': counts, 'total': sum(counts.values()), 'saved': saved}
+
+
+def send_daily_digest(db: Session, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    오늘 요약을 설정된 Slack 채널마다 한 번씩 전송합니다.
+    채널별 결과: sent(이번에 전송), already_sent, in_progress(다른 요청이 전송 중), failed, disabled
+    """
+    now = now or utc_now()
+    digest_date = digest_date_for(now)
+    repo = DigestRepository(db)
+
+    digest = repo.get_digest(digest_date)
+    if digest is None:
+        # 새로고침이 실패했거나 수동 실행 등으로 미리 만든 요약이 없을 때만 여기서 생성
+        logger.warning(f"No prebuilt digest for {digest_date}, building it now")
+        build_daily_digest(db, now, force=True)
+        digest = repo.get_digest(digest_date)
+
+    channels: Dict[str, str] = {}
+    stored_now = now.replace(tzinfo=None)
+    stale_before = stored_now - timedelta(seconds=DIGEST_SEND_LEASE_SECONDS)
+    for channel in (c.strip() for c in slack.channels):
+        if not channel:
+            continue
+        if not slack.enabled:
+            channels[channel] = "disabled"
+            continue
+
+        key = f"{digest_date}:{channel}"
+        claimed = repo.claim_delivery(key, digest_date, channel, stored_now, stale_before)
+        repo.commit()
+        if not claimed:
+            status = repo.get_delivery_status(key)
+            channels[channel] = "already_sent" if status == "sent" else "in_progress"
+            continue
+
+        sent = slack.send_message(digest.message, channel)
+        repo.finish_delivery(key, sent, utc_now().replace(tzinfo=None))
+        repo.commit()
+        channels[channel] = "sent" if sent else "failed"
+
+    return {
+        'digest_date': digest_date,
+        'counts': json.loads(digest.article_counts),
+        'total': digest.total_articles,
+        'channels': channels,
+    }
@@ -0,0 +1,123 @@
+# app/dimensions.py
+"""
+출처/섹션 차원 테이블 intern 캐시
+
+news_articles는 출처와 섹션 문자열 대신 sources/sections 테이블의 작은 정수 ID(source_id, section_id)를
+저장합니다. 행과 인덱스가 작아지고 섹션 필터는 정수 비교가 됩니다.
+- 저장: intern(db, name)이 이름 → ID를 메모리에서 찾고, 처음 보는 이름만 같은 트랜잭션에서 INSERT
+- 조회: name(id)이 ID → 이름을 메모리에서 변환하므로 JOIN이 필요 없음 (모르는 ID면 테이블을 다시 읽음)
+- 필터: lookup(name)은 새 행을 만들지 않으며, 없는 이름은 MISSING_ID(-1)로 빈 결과를 돌려줌
+- 캐시에 없는 이름/ID로 인한 재조회는 DIMENSION_RELOAD_SECONDS에 한 번으로 제한합니다.
+  (아직 없는 섹션/출처로 필터하는 요청마다 테이블을 다시 읽지 않도록, 그동안은 없는 것으로 취급)
+테이블은 수천 행 이하로 작아 프로세스마다 통째로 캐시합니다.
+저장 트랜잭션이 롤백되면 캐시된 새 ID가 무효가 되므로 clear_dimension_caches()로 비웁니다.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 필터에 쓸 ID가 없을 때 (어떤 행과도 일치하지 않음)
+MISSING_ID = -1
+
+# 캐시에 없는 이름/ID로 테이블을 다시 읽는 최소 간격 (초, 다른 인스턴스가 추가한 행이 보이기까지의 최대 지연)
+DIMENSION_RELOAD_SECONDS = float(os.getenv("DIMENSION_RELOAD_SECONDS", "5"))
+
+
+class DimensionCache:
+    """차원 테이블(id, name) 하나의 양방향 메모리 캐시"""
+
+    def __init__(self, table: str, max_length: int):
+        self.table = table
+        self.max_length = max_length
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._reloaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _remember(self, rows: Iterable) -> None:
+        with self._lock:
+            for row_id, name in rows:
+                self._ids[name] = row_id
+                self._names[row_id] = name
+
+    def reload(self) -> None:
+        """테이블 전체를 다시 읽습니다. (다른 인스턴스가 추가한 행 반영)"""
+        db = SessionLocal()
+        try:
+            rows = db.execute(text(f"SELECT id, name FROM {self.table}")).fetchall()
+        finally:
+            db.close()
+        self._remember((row.id, row.name) for row in rows)
+
+    def _reload_on_miss(self) -> None:
+        """캐시에 없는 키를 만났을 때 - 마지막 재조회 후 DIMENSION_RELOAD_SECONDS가 지났을 때만 다시 읽음"""
+        now = time.monotonic()
+        with self._lock:
+            if self._reloaded_at is not None and now - self._reloaded_at < DIMENSION_RELOAD_SECONDS:
+                return
+            self._reloaded_at = now
+        self.reload()
+
+    def intern(self, db: Session, name: Optional[str]) -> Optional[int]:
+        """이름의 ID를 반환하고, 없으면 db 트랜잭션 안에서 새로 만듭니다."""
+        if name is None:
+            return None
+        name = name[:self.max_length]
+        row_id = self._ids.get(name)
+        if row_id is not None:
+            return row_id
+
+        # 동시에 같은 이름을 추가해도 UNIQUE 제약으로 한 행만 생성
+        db.execute(text(f"INSERT INTO {self.table} (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"), {'name': name})
+        row_id = db.execute(text(f"SELECT id FROM {self.table} WHERE name = :name"), {'name': name}).scalar()
+        self._remember([(row_id, name)])
+        return row_id
+
+    def lookup(self, name: Optional[str]) -> int:
+        """필터용 ID (행을 만들지 않음, 없으면 MISSING_ID)"""
+        if name is None:
+            return MISSING_ID
+        row_id = self._ids.get(name)
+        if row_id is None:
+            self._reload_on_miss()
+            row_id = self._ids.get(name, MISSING_ID)
+        return row_id
+
+    def lookup_many(self, names: Iterable[str]) -> List[int]:
+        return [self.lookup(name) for name in names]
+
+    def name(self, row_id: Optional[int]) -> Optional[str]:
+        """ID → 이름 (조회 결과 변환용)"""
+        if row_id is None:
+            return None
+        name = self._names.get(row_id)
+        if name is None:
+            self._reload_on_miss()
+            name = self._names.get(row_id)
+        return name
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+            self._reloaded_at = None
+
+
+# 전역 인스턴스
+source_cache = DimensionCache("sources", 100)
+section_cache = DimensionCache("sections", 50)
+
+
+def clear_dimension_caches() -> None:
+    """롤백되었거나 다른 DB로 바뀌었을 때 캐시를 비웁니다."""
+    source_cache.clear()
+    section_cache.clear()
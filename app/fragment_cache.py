@@ -0,0 +1,129 @@
+# app/fragment_cache.py
+"""
+뉴스 목록 HTML 조각 캐시
+
+/news, /news/us, /news/kr 페이지는 같은 US/KR 기사 카드 목록을 공유합니다.
+카드 목록(templates/_news_list.html)을 (국가, 기간, 개수, collapse)별로 한 번만 렌더링해
+기사 목록과 함께 메모리에 보관하고, 페이지는 셸(index.html)에 조각을 끼워 넣기만 하므로
+표시하는 기사 수와 무관하게 페이지 비용이 거의 일정합니다.
+
+무효화:
+- 새 기사가 저장되거나 정리/보관 작업으로 기사가 바뀌면 세대(generation)를 올려 전체 폐기
+- 다른 서버리스 인스턴스에서 새로고침된 경우와 조회 기간(최근 N일) 경계 이동은 TTL로 반영
+새로고침 직후에는 기본 페이지 조각을 미리 렌더링합니다(warm_news_fragments).
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+from app.article import Article
+from app.database import get_db
+from app.metrics import timed
+from app.repositories import NewsRepository
+from app.snapshots import invalidate_snapshots
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_CACHE_TTL = int(os.getenv("FRAGMENT_CACHE_TTL", "300"))
+FRAGMENT_CACHE_SIZE = int(os.getenv("FRAGMENT_CACHE_SIZE", "64"))
+
+# 새로고침 후 미리 렌더링할 기본 페이지 조각 (국가, 기간, 개수)
+DEFAULT_FRAGMENTS = (("US", 1, 30), ("KR", 1, 30))
+
+_env = Environment(loader=FileSystemLoader("templates"), autoescape=select_autoescape(["html"]))
+
+FragmentKey = Tuple[str, int, int, bool]
+
+
+class NewsFragment(NamedTuple):
+    """렌더링된 카드 목록과 원본 기사 (요약 정보 계산용)"""
+    articles: List[Article]
+    html: Markup
+
+
+class FragmentCache:
+    """(국가, 기간, 개수, collapse) → NewsFragment LRU 캐시 (세대 + TTL 무효화)"""
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_SIZE, ttl: int = FRAGMENT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: "OrderedDict[FragmentKey, Tuple[float, NewsFragment]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: FragmentKey) -> Optional[NewsFragment]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, fragment = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return fragment
+
+    def put(self, key: FragmentKey, fragment: NewsFragment, generation: int) -> None:
+        """렌더링을 시작한 세대가 아직 유효할 때만 저장합니다. (렌더링 중 무효화된 조각은 버림)"""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, fragment)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+# 전역 인스턴스
+fragment_cache = FragmentCache()
+
+
+def render_news_list(articles: List[Article]) -> Markup:
+    """기사 카드 목록 조각을 렌더링합니다."""
+    with timed("template"):
+        return Markup(_env.get_template("_news_list.html").render(articles=articles))
+
+
+def get_news_fragment(country: str, days: int = 1, limit: int = 30, collapse: bool = False) -> NewsFragment:
+    """캐시된 카드 목록 조각을 반환합니다. (없으면 조회 후 렌더링해 저장)"""
+    key = (country.upper(), days, limit, collapse)
+    fragment = fragment_cache.get(key)
+    if fragment is not None:
+        return fragment
+
+    generation = fragment_cache.generation
+    db = next(get_db())
+    try:
+        articles = NewsRepository(db).get_recent_news(country, days, limit, collapse=collapse)
+    finally:
+        db.close()
+
+    fragment = NewsFragment(articles, render_news_list(articles))
+    fragment_cache.put(key, fragment, generation)
+    return fragment
+
+
+def invalidate_news_fragments() -> None:
+    """기사 데이터가 바뀌었을 때 모든 조각과 정적 스냅샷을 폐기합니다."""
+    fragment_cache.invalidate()
+    invalidate_snapshots()
+
+
+def warm_news_fragments() -> None:
+    """기본 페이지 조각을 미리 렌더링합니다. (새로고침 직후)"""
+    for country, days, limit in DEFAULT_FRAGMENTS:
+        try:
+            get_news_fragment(country, days, limit)
+        except Exception as e:
+            logger.error(f"Error warming news fragment for {country}: {e}")
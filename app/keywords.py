@@ -0,0 +1,81 @@
+# app/keywords.py
+"""
+섹션별 키워드 목록
+
+수집 시 섹션이 없는 종합 피드 기사의 키워드 분류(classify_news_section)와
+트렌드 키워드 토큰화(app/trending.py의 시드 어휘)에서 함께 사용합니다.
+목록은 불용어 없이 주제어만 담고 있으며, 중복 항목은 분류 점수에 그대로 반영됩니다.
+"""
+
+# 정치 관련 키워드
+POLITICS_KEYWORDS = [
+    'politics', 'political', 'election', 'president', 'congress', 'senate', 'government',
+    'democrat', 'republican', 'campaign', 'vote', 'voting', 'poll', 'polls',
+    'white house', 'capitol', 'legislation', 'bill', 'law', 'policy',
+    'minister', 'parliament', 'election', 'vote', 'campaign', 'political party',
+    '정치', '대선', '선거', '국회', '정부', '여당', '야당', '정책', '법안', '대통령', '총리', '장관',
+    '의회', '검찰', '법무부', '국정감사', '여야', '여당', '야당', '정당', '투표'
+]
+
+# 경제/비즈니스 관련 키워드
+BUSINESS_KEYWORDS = [
+    'business', 'economy', 'economic', 'finance', 'financial', 'market', 'stock',
+    'trade', 'commerce', 'investment', 'investor', 'bank', 'banking', 'money',
+    'dollar', 'euro', 'currency', 'inflation', 'recession', 'gdp', 'unemployment',
+    'company', 'corporation', 'ceo', 'executive', 'profit', 'revenue', 'earnings',
+    '경제', '금융', '주식', '투자', '은행', '기업', '매출', '수익', '인플레이션',
+    '부동산', '원화', '달러', '환율', '증시', '코스피', '코스닥', '채권', '금리'
+]
+
+# 기술 관련 키워드
+TECHNOLOGY_KEYWORDS = [
+    'technology', 'tech', 'digital', 'computer', 'software', 'hardware', 'internet',
+    'ai', 'artificial intelligence', 'machine learning', 'data', 'cyber', 'cybersecurity',
+    'app', 'application', 'mobile', 'smartphone', 'social media', 'online',
+    'startup', 'innovation', 'robot', 'automation', 'blockchain', 'crypto',
+    '기술', '디지털', '컴퓨터', '소프트웨어', '인공지능', '스마트폰', '앱'
+]
+
+# 스포츠 관련 키워드
+SPORTS_KEYWORDS = [
+    'sports', 'football', 'basketball', 'baseball', 'soccer', 'tennis', 'golf',
+    'nfl', 'nba', 'mlb', 'nhl', 'olympics', 'championship', 'tournament',
+    'player', 'team', 'coach', 'game', 'match', 'score', 'win', 'lose',
+    '스포츠', '축구', '야구', '농구', '골프', '테니스', '선수', '팀', '경기'
+]
+
+# 엔터테인먼트 관련 키워드
+ENTERTAINMENT_KEYWORDS = [
+    'entertainment', 'movie', 'film', 'tv', 'television', 'show', 'series',
+    'actor', 'actress', 'director', 'producer', 'celebrity', 'star', 'hollywood',
+    'music', 'song', 'album', 'artist', 'singer', 'concert', 'performance',
+    'game', 'gaming', 'video game', 'streaming', 'netflix', 'disney',
+    '엔터테인먼트', '영화', '드라마', '연예인', '가수', '음악', '게임', '요가원', '개원'
+]
+
+# 건강 관련 키워드
+HEALTH_KEYWORDS = [
+    'health', 'medical', 'medicine', 'doctor', 'hospital', 'patient', 'disease',
+    'covid', 'coronavirus', 'vaccine', 'vaccination', 'treatment', 'therapy',
+    'mental health', 'psychology', 'psychiatrist', 'therapy', 'wellness',
+    '건강', '의료', '병원', '의사', '질병', '코로나', '백신', '치료'
+]
+
+# 과학 관련 키워드
+SCIENCE_KEYWORDS = [
+    'science', 'scientific', 'research', 'study', 'discovery', 'experiment',
+    'space', 'nasa', 'astronomy', 'planet', 'earth', 'climate', 'environment',
+    'biology', 'chemistry', 'physics', 'mathematics', 'engineering',
+    '과학', '연구', '발견', '우주', '천문학', '지구', '환경', '생물학'
+]
+
+# 섹션 → 키워드 목록 (분류 시 동점이면 이 순서의 앞 섹션)
+SECTION_KEYWORDS = {
+    'politics': POLITICS_KEYWORDS,
+    'business': BUSINESS_KEYWORDS,
+    'technology': TECHNOLOGY_KEYWORDS,
+    'sports': SPORTS_KEYWORDS,
+    'entertainment': ENTERTAINMENT_KEYWORDS,
+    'health': HEALTH_KEYWORDS,
+    'science': SCIENCE_KEYWORDS,
+}
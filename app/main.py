@@ -6,12 +6,16 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from app.compression import CompressionMiddleware
 from app.database import init_db
-from app.news_service import get_recent_news, build_summary
+from app.metrics import MetricsMiddleware, timed
+from app.fragment_cache import get_news_fragment
+from app.snapshots import SnapshotMiddleware
+from app.news_service import build_summary
 from app.slack_notifier import slack
 
 # API 라우터 import
-from app.api import news, feeds, analysis, notifications, health, cleanup
+from app.api import news, feeds, analysis, notifications, health, cleanup, metrics
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -22,10 +26,24 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# 응답 압축 (brotli/gzip)
+app.add_middleware(CompressionMiddleware)
+
+# 정적 스냅샷 제공 (SNAPSHOT_MODE=true, 미리 압축된 파일이므로 압축 미들웨어 바깥)
+app.add_middleware(SnapshotMiddleware)
+
+# 라우트별 응답 시간 + Server-Timing 헤더 (가장 바깥에서 측정)
+app.add_middleware(MetricsMiddleware)
+
 # 정적 파일과 템플릿 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
+def render_template(name: str, context: dict) -> HTMLResponse:
+    """템플릿 렌더링 (렌더링 시간 측정)"""
+    with timed("template"):
+        return templates.TemplateResponse(name, context)
+
 # API 라우터 등록
 app.include_router(news.router)
 app.include_router(feeds.router)
@@ -33,6 +51,7 @@ app.include_router(analysis.router)
 app.include_router(notifications.router)
 app.include_router(health.router)
 app.include_router(cleanup.router)
+app.include_router(metrics.router)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -63,74 +82,75 @@ async def news_home(
     days_us: int = 1,
     days_kr: int = 1,
     limit: int = 30,
+    collapse: bool = False,
 ):
     """메인 뉴스 페이지 - 미국과 한국 뉴스를 모두 표시"""
     try:
-        # 데이터베이스에서 뉴스 가져오기
-        news_us = get_recent_news('US', days=days_us, limit=limit)
-        news_kr = get_recent_news('KR', days=days_kr, limit=limit)
+        # 캐시된 기사 카드 목록 조각 (없으면 조회 후 렌더링)
+        fragment_us = get_news_fragment('US', days=days_us, limit=limit, collapse=collapse)
+        fragment_kr = get_news_fragment('KR', days=days_kr, limit=limit, collapse=collapse)
         
         # 요약 정보 생성
-        summary = build_summary(news_us, news_kr, days_us, days_kr)
+        summary = build_summary(fragment_us.articles, fragment_kr.articles, days_us, days_kr)
         
-        return templates.TemplateResponse(
+        return render_template(
             "index.html",
             {
                 "request": request, 
-                "news_us": news_us, 
-                "news_kr": news_kr, 
+                "news_us_html": fragment_us.html, 
+                "news_kr_html": fragment_kr.html, 
                 "summary": summary
             },
         )
     except Exception as e:
         logger.error(f"Error loading news page: {e}")
         slack.notify_error(str(e), "뉴스 페이지 로딩 실패")
-        return templates.TemplateResponse(
+        return render_template(
             "index.html",
             {
                 "request": request, 
-                "news_us": [], 
-                "news_kr": [], 
+                "news_us_html": "", 
+                "news_kr_html": "", 
                 "summary": {"total": 0, "us": 0, "kr": 0, "error": str(e)}
             },
         )
 
 # 미국 뉴스만 보기
 @app.get("/news/us", response_class=HTMLResponse)
-async def news_us_page(request: Request, days: int = 1, limit: int = 30):
+async def news_us_page(request: Request, days: int = 1, limit: int = 30, collapse: bool = False):
     """미국 뉴스만 표시하는 페이지"""
     try:
-        news_us = get_recent_news('US', days=days, limit=limit)
-        summary = {"total": len(news_us), "us": len(news_us), "kr": 0}
+        fragment_us = get_news_fragment('US', days=days, limit=limit, collapse=collapse)
+        summary = {"total": len(fragment_us.articles), "us": len(fragment_us.articles), "kr": 0}
         
-        return templates.TemplateResponse(
+        return render_template(
             "index.html",
-            {"request": request, "news_us": news_us, "news_kr": [], "summary": summary},
+            {"request": request, "news_us_html": fragment_us.html, "news_kr_html": "", "summary": summary},
         )
     except Exception as e:
         logger.error(f"Error loading US news: {e}")
-        return templates.TemplateResponse(
+        return render_template(
             "index.html",
-            {"request": request, "news_us": [], "news_kr": [], "summary": {"total": 0, "us": 0, "kr": 0}},
+            {"request": request, "news_us_html": "", "news_kr_html": "", "summary": {"total": 0, "us": 0, "kr": 0}},
         )
 
 # 한국 뉴스만 보기
 @app.get("/news/kr", response_class=HTMLResponse)
-async def news_kr_page(request: Request, days: int = 1, limit: int = 30):
+async def news_kr_page(request: Request, days: int = 1, limit: int = 30, collapse: bool = False):
     """한국 뉴스만 표시하는 페이지"""
     try:
-        news_kr = get_recent_news('KR', days=days, limit=limit)
-        summary = {"total": len(news_kr), "us": 0, "kr": len(news_kr)}
+        fragment_kr = get_news_fragment('KR', days=days, limit=limit, collapse=collapse)
+        summary = {"total": len(fragment_kr.articles), "us": 0, "kr": len(fragment_kr.articles)}
         
-        return templates.TemplateResponse(
+        return render_template(
             "index.html",
-            {"request": request, "news_us": [], "news_kr": news_kr, "summary": summary},
+            {"request": request, "news_us_html": "", "news_kr_html": fragment_kr.html, "summary": summary},
         )
     except Exception as e:
         logger.error(f"Error loading KR news: {e}")
-        return templates.TemplateResponse(
+        return render_template(
             "index.html",
-            {"request": request, "news_us": [], "news_kr": [], "summary": {"total": 0, "us": 0, "kr": 0}},
+            {"request": request, "news_us_html": "", "news_kr_html": "", "summary": {"total": 0, "us": 0, "kr": 0}},
         )
 
 # 기존 API 엔드포인트들은 별도 라우터로 이동됨
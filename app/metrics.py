@@ -0,0 +1,239 @@
+# app/metrics.py
+"""
+요청/DB 쿼리/수집 단계 계측
+
+- MetricsMiddleware: 라우트별 응답 시간 히스토그램 + Server-Timing 응답 헤더
+- install_query_hooks: SQLAlchemy 이벤트로 모든 쿼리 시간을 측정 (NewsRepository 메서드명 기준)
+- stage_timer / timed: 수집 단계(fetch, parse, classify, save) 및 템플릿 렌더링, 슬랙 호출 시간
+- render_metrics: Prometheus 텍스트 형식 (GET /metrics)
+"""
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Prometheus 히스토그램 (라벨별 누적 버킷)"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...], buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # [버킷별 개수..., +Inf 개수, 합계]
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(self._series.items())
+        for labels, series in items:
+            label_str = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels))
+            prefix = f"{label_str}," if label_str else ""
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count:g}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[-2]:g}')
+            lines.append(f"{self.name}_sum{{{label_str}}} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{{{label_str}}} {series[-2]:g}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REQUEST_DURATION = Histogram(
+    "nextpicker_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route", "status"),
+)
+QUERY_DURATION = Histogram(
+    "nextpicker_db_query_duration_seconds",
+    "Database query latency by repository method",
+    ("operation",),
+)
+STAGE_DURATION = Histogram(
+    "nextpicker_ingestion_stage_duration_seconds",
+    "Ingestion stage latency (fetch, parse, classify, save)",
+    ("stage",),
+)
+OPERATION_DURATION = Histogram(
+    "nextpicker_operation_duration_seconds",
+    "Other timed operations (template rendering, Slack calls)",
+    ("operation",),
+)
+
+REGISTRY = (REQUEST_DURATION, QUERY_DURATION, STAGE_DURATION, OPERATION_DURATION)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 노출 형식"""
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ── 요청 단위 타이밍 (Server-Timing 헤더용) ───────────────────────────────
+# {이름: [누적 시간(초), 횟수]}
+_request_timings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar("request_timings", default=None)
+# 현재 실행 중인 Repository 메서드명 (쿼리 라벨)
+_query_operation: ContextVar[str] = ContextVar("query_operation", default="other")
+
+
+def _record_request_timing(name: str, elapsed: float) -> None:
+    timings = _request_timings.get()
+    if timings is not None:
+        entry = timings.setdefault(name, [0.0, 0])
+        entry[0] += elapsed
+        entry[1] += 1
+
+
+@contextmanager
+def timed(operation: str):
+    """임의 작업 시간 측정 (템플릿 렌더링, 슬랙 호출 등)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        OPERATION_DURATION.observe((operation,), elapsed)
+        _record_request_timing(operation, elapsed)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """수집 단계 시간 측정 (fetch, parse, classify, save)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def observe_stage(stage: str, elapsed: float) -> None:
+    """누적한 단계 시간을 한 번에 기록합니다. (기사별 분류처럼 잦은 작업용)"""
+    STAGE_DURATION.observe((stage,), elapsed)
+    _record_request_timing(stage, elapsed)
+
+
+# ── DB 쿼리 계측 ──────────────────────────────────────────────────────────
+def install_query_hooks(engine) -> None:
+    """엔진의 모든 쿼리 실행 시간을 현재 Repository 메서드명 기준으로 기록합니다."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start_time")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        QUERY_DURATION.observe((_query_operation.get(),), elapsed)
+        _record_request_timing("db", elapsed)
+
+
+def instrument_repository(cls):
+    """클래스 데코레이터: public 메서드 실행 중 발생한 쿼리에 메서드명 라벨을 붙입니다."""
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not callable(method):
+            continue
+        setattr(cls, name, _label_queries(f"{cls.__name__}.{name}", method))
+    return cls
+
+
+def _label_queries(operation: str, method):
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def generator_wrapper(*args, **kwargs):
+            generator = method(*args, **kwargs)
+            while True:
+                token = _query_operation.set(operation)
+                try:
+                    value = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    _query_operation.reset(token)
+                yield value
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        token = _query_operation.set(operation)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _query_operation.reset(token)
+    return wrapper
+
+
+# ── HTTP 미들웨어 ─────────────────────────────────────────────────────────
+class MetricsMiddleware:
+    """라우트별 응답 시간 기록 및 Server-Timing 헤더 추가"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        timings: Dict[str, List[float]] = {}
+        token = _request_timings.set(timings)
+        status = {"code": 500}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Server-Timing", _server_timing(timings, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_timings.reset(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            REQUEST_DURATION.observe(
+                (scope.get("method", ""), route_path, str(status["code"])),
+                time.perf_counter() - start,
+            )
+
+
+def _server_timing(timings: Dict[str, List[float]], total: float) -> str:
+    parts = [f"total;dur={total * 1000:.1f}"]
+    for name, (elapsed, count) in timings.items():
+        parts.append(f'{name};dur={elapsed * 1000:.1f};desc="{int(count)}x"')
+    return ", ".join(parts)
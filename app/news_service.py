@@ -1,60 +1,123 @@
 # app/news_service.py
 import hashlib
+import html
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+import re
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import feedparser
 import requests
 from dateutil import parser
-from bs4 import BeautifulSoup
+from app.article import Article
+from app.clustering import CLUSTER_WINDOW_DAYS, SimHashIndex, article_signature, to_signed, to_unsigned
 from app.database import get_db, NewsArticle
-from app.repositories import NewsRepository
-from app.rss_feeds import get_feeds_by_country, get_feeds_by_section, get_feed_info
+from app.digest import build_daily_digest
+from app.fragment_cache import invalidate_news_fragments, warm_news_fragments
+from app.keywords import SECTION_KEYWORDS
+from app.metrics import observe_stage, stage_timer
+from app.news_stream import publish_articles
+from app.ranking import update_story_rankings
+from app.refresh_report import RefreshReport
+from app.related import update_related_articles
+from app.section_classifier import predict_sections, train_section_model
+from app.snapshots import refresh_snapshots
+from app.trending import record_article_terms
+from app.url_resolver import RESOLVE_CANONICAL_URLS, resolve_canonical_urls
+from app.repositories import NewsRepository, RefreshRunRepository
+from app.rss_feeds import get_collection_feeds, get_countries
 
 from app.slack_notifier import slack
+from app.timeutils import format_kst, utc_now
 
 logger = logging.getLogger(__name__)
 
-# RSS 피드 목록은 rss_feeds.py에서 관리
+# RSS 피드 목록은 rss_feeds.py의 피드 레지스트리(app/feeds.json)에서 관리
+
+# RSS 피드 요청 타임아웃 (초)
+FEED_TIMEOUT = 10
 
 def get_article_id(url: str) -> str:
     """URL의 MD5 해시를 반환합니다."""
     return hashlib.md5(url.encode()).hexdigest()
 
-def extract_summary(content: str) -> str:
-    """HTML 콘텐츠에서 텍스트 요약을 추출합니다."""
+# HTML 정리용 정규식 (extract_summary와 DB 정리 작업에서 공통 사용)
+# 태그는 < 바로 뒤에 태그 이름, / 또는 !가 오는 경우만 (본문의 "a < b"는 유지)
+HTML_TAG_RE = re.compile(r'<[a-zA-Z/!][^>]*>')
+# URL은 따옴표/꺾쇠에서 끊어 태그 속성이나 뒤따르는 텍스트까지 지우지 않음
+URL_RE = re.compile(r'https?://[^\s"\'<>]+')
+# 여러 번 이스케이프된 마크업(&amp;lt;b&amp;gt;)까지 풀기 위한 최대 반복 횟수
+HTML_CLEAN_MAX_PASSES = 5
+
+def clean_html_text(content: str) -> str:
+    """
+    HTML 엔티티 디코딩, 태그/URL 제거, 공백 정리를 수행합니다.
+
+    구글 뉴스 설명은 마크업이 엔티티로 이스케이프되어 오기도 하므로 디코딩 → 태그 제거를
+    결과가 바뀌지 않을 때까지 반복합니다. (한 번 더 적용해도 결과가 같음)
+    예: '&lt;a href="https://x.com/a"&gt;Title here&lt;/a&gt;&amp;nbsp;&lt;font color="#6f6f6f"&gt;CNN&lt;/font&gt;'
+        → 'Title here CNN'
+    """
     if not content:
         return ""
     
+    text = content
+    for _ in range(HTML_CLEAN_MAX_PASSES):
+        cleaned = HTML_TAG_RE.sub('', html.unescape(text))
+        if cleaned == text:
+            break
+        text = cleaned
+    text = URL_RE.sub('', text)
+    
+    # 공백 정리
+    return ' '.join(text.split())
+
+def extract_summary(content: str) -> str:
+    """HTML 콘텐츠에서 텍스트 요약을 추출합니다."""
+    text = clean_html_text(content)
+    
+    # 200자로 제한
+    return text[:200] + "..." if len(text) > 200 else text
+
+def fetch_rss_feed(feed_url: str, country: str = None, section: str = None, feed_report: Optional[Dict[str, Any]] = None,
+                   classify: bool = True) -> List[Article]:
+    """
+    RSS 피드에서 뉴스를 가져옵니다.
+    feed_report(RefreshReport.add_feed)가 주어지면 요청/파싱/분류 시간, 응답 크기, 항목 수, 오류를 기록합니다.
+    classify=False면 섹션 피드가 아닌 기사의 섹션을 None으로 두어 호출하는 쪽이 모아서 분류합니다. (classify_articles)
+    """
+    report = feed_report if feed_report is not None else {}
     try:
-        # HTML 태그 제거
-        soup = BeautifulSoup(content, 'html.parser')
-        text = soup.get_text()
+        # 네트워크 요청과 파싱 시간을 따로 측정하기 위해 직접 가져온 뒤 파싱
+        fetch_start = time.perf_counter()
+        try:
+            response = requests.get(feed_url, timeout=FEED_TIMEOUT)
+        finally:
+            fetch_time = time.perf_counter() - fetch_start
+            observe_stage("fetch", fetch_time)
+            report['fetch_ms'] = round(fetch_time * 1000, 1)
+        report['status'] = response.status_code
+        report['bytes'] = len(response.content)
+        response.raise_for_status()
         
-        # 공백 정리
-        text = ' '.join(text.split())
+        parse_start = time.perf_counter()
+        feed = feedparser.parse(response.content)
+        parse_time = time.perf_counter() - parse_start
+        observe_stage("parse", parse_time)
+        report['parse_ms'] = round(parse_time * 1000, 1)
         
-        # 200자로 제한
-        return text[:200] + "..." if len(text) > 200 else text
-    except:
-        return content[:200] + "..." if len(content) > 200 else content
-
-def fetch_rss_feed(feed_url: str, country: str = None, section: str = None) -> List[Dict[str, Any]]:
-    """RSS 피드에서 뉴스를 가져옵니다."""
-    try:
-        feed = feedparser.parse(feed_url)
         articles = []
+        classify_time = 0.0
         
         for entry in feed.entries:
-            # 발행일 파싱 (모든 뉴스는 UTC로 제공되므로 한국 시각으로 변환)
+            # 발행일 파싱 (feedparser의 published_parsed는 UTC 기준, 현지 시각 표시는 조회 시 계산)
             published = getattr(entry, 'published_parsed', None)
             if published:
-                # 모든 뉴스: UTC를 한국 시각으로 변환
-                published = datetime(*published[:6]).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=9)))
+                published = datetime(*published[:6], tzinfo=timezone.utc)
             else:
-                published = datetime.now(timezone(timedelta(hours=9)))
+                published = utc_now()
             
             # 요약 추출
             summary = ""
@@ -72,50 +135,93 @@ def fetch_rss_feed(feed_url: str, country: str = None, section: str = None) -> L
                     source = entry.source.title
             
             # 섹션 분류 - 섹션이 제공되면 사용, 아니면 키워드 분류
-            if section:
+            if section or not classify:
                 article_section = section
             else:
+                classify_start = time.perf_counter()
                 article_section = classify_news_section(entry.title, summary)
+                classify_time += time.perf_counter() - classify_start
             
-            articles.append({
-                'title': entry.title,
-                'url': entry.link,
-                'source': source,
-                'published': published,
-                'summary': summary,
-                'section': article_section
-            })
+            articles.append(Article(
+                id=get_article_id(entry.link),
+                title=entry.title,
+                url=entry.link,
+                source=source,
+                published=published,
+                summary=summary,
+                section=article_section,
+                country=country.upper() if country else None
+            ))
         
+        # classify=False면 분류는 국가별 일괄 분류에서 측정 (피드별 값은 None)
+        if not section and classify:
+            observe_stage("classify", classify_time)
+            report['classify_ms'] = round(classify_time * 1000, 1)
+        report['entries'] = len(articles)
         logger.info(f"Fetched {len(articles)} articles from {feed_url} (section: {section or 'auto-classified'})")
         return articles
         
     except Exception as e:
         logger.error(f"Error fetching {feed_url}: {e}")
+        report['error'] = str(e)
         slack.notify_error(str(e), f"RSS 피드 가져오기 실패: {feed_url}")
         return []
 
-def save_articles_to_db(articles: List[Dict[str, Any]], country: str, db: Session) -> int:
-    """뉴스 기사들을 데이터베이스에 저장합니다."""
+def save_articles_to_db(articles: List[Article], country: str, db: Session, saved_ids: Optional[List[str]] = None,
+                        labelled_ids: Optional[set] = None) -> int:
+    """
+    뉴스 기사들을 데이터베이스에 저장합니다. (saved_ids가 주어지면 새로 저장된 기사 ID를 추가)
+    labelled_ids가 주어지면 그 기사는 섹션 피드가 섹션을 정한 기사로 표시합니다. (분류 모델 학습 라벨)
+    """
     repo = NewsRepository(db)
     saved_count = 0
+    saved_articles = []
+    
+    # 최근 기사 시그니처로 유사 기사 클러스터 인덱스 구성
+    cluster_index = SimHashIndex()
+    try:
+        for signature, cluster_id in repo.get_cluster_signatures(country, CLUSTER_WINDOW_DAYS):
+            cluster_index.add(to_unsigned(signature), cluster_id)
+    except Exception as e:
+        logger.error(f"Error loading cluster index for {country}: {e}")
     
-    for article_data in articles:
+    for article in articles:
         try:
-            # 기사 데이터 준비
-            article_data['id'] = get_article_id(article_data['url'])
-            article_data['country'] = country
+            # 같은 사건의 기존 기사가 있으면 그 클러스터에, 없으면 새 클러스터로 배정
+            signature = article_signature(article.title, article.summary, article.source)
+            cluster_id = cluster_index.find(signature) or article.id
+            article = article._replace(country=country, cluster_id=cluster_id)
             
             # 저장 시도
-            if repo.save_article(article_data):
+            section_from_feed = None if labelled_ids is None else article.id in labelled_ids
+            if repo.save_article(article, simhash=to_signed(signature), section_from_feed=section_from_feed):
+                cluster_index.add(signature, cluster_id)
                 saved_count += 1
+                saved_articles.append(article)
+                if saved_ids is not None:
+                    saved_ids.append(article.id)
             
         except Exception as e:
-            logger.error(f"Error saving article {article_data.get('url', 'unknown')}: {e}")
+            logger.error(f"Error saving article {article.url or 'unknown'}: {e}")
     
     try:
         repo.commit()
         logger.info(f"Saved {saved_count} new articles for {country}")
         
+        # 페이지 조각 캐시 무효화 (새 기사 반영)
+        if saved_count > 0:
+            invalidate_news_fragments()
+        
+        # 트렌드 키워드 시간 버킷 갱신 (실패해도 저장된 기사는 유지)
+        try:
+            record_article_terms(db, saved_articles)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error recording trending terms for {country}: {e}")
+        
+        # SSE 스트림 구독자에게 신규 기사 발행
+        publish_articles(saved_articles)
+        
         # 슬랙 알림: 데이터 저장 완료
         if saved_count > 0:
             slack.notify_data_saved(country, saved_count)
@@ -126,134 +232,232 @@ def save_articles_to_db(articles: List[Dict[str, Any]], country: str, db: Sessio
     
     return saved_count
 
-def collect_news(country: str, days: int = 3) -> List[Dict[str, Any]]:
-    """지정된 국가의 뉴스를 섹션별로 수집하고 저장합니다."""
-    # 섹션별 피드 사용 (SECTION_FEEDS의 키와 매핑)
-    section_mapping = {
-        'business': 'business',
-        'politics': 'nation',  # politics는 nation으로 매핑
-        'technology': 'technology',
-        'sports': 'sports',
-        'entertainment': 'entertainment',
-        'health': 'health',
-        'science': 'science'
-    }
-    
+def classify_articles(db: Session, articles: List[Article]) -> List[Article]:
+    """
+    섹션이 없는 기사를 학습한 분류 모델로 한 번에 분류합니다.
+    모델이 없거나 확신도가 낮은 기사, 모델 오류 시에는 키워드 분류(classify_news_section)를 사용합니다.
+    """
+    pending = [i for i, article in enumerate(articles) if not article.section]
+    if not pending:
+        return articles
+    try:
+        predicted = predict_sections(db, [(articles[i].title, articles[i].summary, articles[i].source) for i in pending])
+    except Exception as e:
+        logger.error(f"Error classifying articles with the section model: {e}")
+        predicted = [None] * len(pending)
+    articles = list(articles)
+    for i, section in zip(pending, predicted):
+        article = articles[i]
+        articles[i] = article._replace(section=section or classify_news_section(article.title, article.summary))
+    return articles
+
+def apply_canonical_urls(articles: List[Article], canonical_urls: Dict[str, str],
+                         article_feeds: Dict[str, set], feed_entries: Dict[str, Any]) -> List[Article]:
+    """
+    기사의 URL/ID를 원문 URL 기준으로 바꾸고, 기사 ID로 모아 둔 피드 집합/피드 리포트 항목도 새 ID로 합칩니다.
+    (여러 피드의 다른 래퍼가 같은 원문이면 한 기사로 합쳐져 피드 수 신호에 반영됨)
+    """
+    id_map = {}
+    updated = []
+    for article in articles:
+        url = canonical_urls.get(article.url, article.url)
+        if url != article.url:
+            new_id = get_article_id(url)
+            id_map[article.id] = new_id
+            article = article._replace(id=new_id, url=url)
+        updated.append(article)
+    if id_map:
+        feeds = {}
+        for article_id, urls in article_feeds.items():
+            feeds.setdefault(id_map.get(article_id, article_id), set()).update(urls)
+        entries = {}
+        for article_id, entry in feed_entries.items():
+            entries.setdefault(id_map.get(article_id, article_id), entry)
+        article_feeds.clear()
+        article_feeds.update(feeds)
+        feed_entries.clear()
+        feed_entries.update(entries)
+    return updated
+
+def collect_news(country: str, days: int = 3, report: Optional[RefreshReport] = None) -> List[Article]:
+    """지정된 국가의 뉴스를 섹션별로 수집하고 저장합니다. (report가 주어지면 피드별 프로파일 기록)"""
     all_articles = []
     total_saved = 0
+    # 기사 ID → 처음 가져온 피드의 리포트 항목 (피드별 신규/중복 집계용)
+    feed_entries = {}
+    # 기사 ID → 기사가 실린 피드 URL 집합 (사건 순위의 피드 수 신호)
+    article_feeds = {}
+    
+    def fetch(feed_url: str, feed_section: Optional[str] = None) -> None:
+        feed_report = report.add_feed(feed_url, country, feed_section) if report else None
+        articles = fetch_rss_feed(feed_url, country, feed_section, feed_report=feed_report, classify=False)
+        for article in articles:
+            article_feeds.setdefault(article.id, set()).add(feed_url)
+        if feed_report is not None:
+            for article in articles:
+                feed_entries.setdefault(article.id, feed_report)
+        all_articles.extend(articles)
+    
+    # 피드 레지스트리의 수집 대상 (섹션 피드 → 종합 피드 순, 종합 피드는 섹션 없이 키워드 분류)
+    feeds = get_collection_feeds(country)
+    logger.info(f"Collecting {country} news from {len(feeds)} feeds")
     
-    # 각 섹션별로 뉴스 수집
-    for section, feed_key in section_mapping.items():
+    for feed in feeds:
         try:
-            feeds = get_feeds_by_section(feed_key, country)
-            logger.info(f"Collecting {section} news for {country} from {len(feeds)} feeds")
-            
-            for feed_url in feeds:
-                articles = fetch_rss_feed(feed_url, country, section)
-                all_articles.extend(articles)
-                
+            fetch(feed.url, feed.section)
         except Exception as e:
-            logger.error(f"Error collecting {section} news for {country}: {e}")
-            slack.notify_error(str(e), f"{section} 뉴스 수집 실패: {country}")
-            continue
-    
-    # 일반 피드도 추가로 수집 (fallback)
-    try:
-        general_feeds = get_feeds_by_country(country)
-        logger.info(f"Collecting general news for {country} from {len(general_feeds)} feeds")
-        
-        for feed_url in general_feeds:
-            articles = fetch_rss_feed(feed_url, country)  # 섹션 없이 자동 분류
-            all_articles.extend(articles)
-            
-    except Exception as e:
-        logger.error(f"Error collecting general news for {country}: {e}")
-        slack.notify_error(str(e), f"일반 뉴스 수집 실패: {country}")
+            label = feed.section or "일반"
+            logger.error(f"Error collecting {feed.section or 'general'} news for {country}: {e}")
+            slack.notify_error(str(e), f"{label} 뉴스 수집 실패: {country}")
     
     # 데이터베이스에 저장
     db = next(get_db())
+    saved_ids = []
     try:
-        total_saved = save_articles_to_db(all_articles, country, db)
+        # 구글 뉴스 래퍼 URL을 원문 URL로 바꿔 기사 ID를 원문 기준으로 (실패하면 래퍼 URL 그대로 저장)
+        if RESOLVE_CANONICAL_URLS:
+            try:
+                with stage_timer("resolve"):
+                    canonical_urls = resolve_canonical_urls(db, (article.url for article in all_articles))
+                all_articles = apply_canonical_urls(all_articles, canonical_urls, article_feeds, feed_entries)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Error resolving canonical URLs for {country}: {e}")
+        
+        # 종합 피드 기사는 모아서 한 번에 섹션 분류 (섹션 피드 기사는 피드의 섹션이 학습 라벨)
+        labelled_ids = {article.id for article in all_articles if article.section}
+        classify_start = time.perf_counter()
+        all_articles = classify_articles(db, all_articles)
+        classify_elapsed = time.perf_counter() - classify_start
+        observe_stage("classify", classify_elapsed)
+        
+        save_start = time.perf_counter()
+        with stage_timer("save"):
+            total_saved = save_articles_to_db(all_articles, country, db, saved_ids=saved_ids, labelled_ids=labelled_ids)
+        save_elapsed = time.perf_counter() - save_start
+        
+        # 사건 점수와 국가/섹션별 상위 목록 갱신 (실패해도 수집 결과는 유지)
+        try:
+            with stage_timer("rank"):
+                update_story_rankings(db, country, article_feeds)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error updating story rankings for {country}: {e}")
+        
+        # 새 기사의 관련 기사 목록 계산 (실패해도 수집 결과는 유지)
+        try:
+            with stage_timer("related"):
+                update_related_articles(db, country, saved_ids)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error updating related articles for {country}: {e}")
     finally:
         db.close()
     
+    if report:
+        report.record_save(country, feed_entries, saved_ids, save_elapsed, classify_elapsed)
+    
     logger.info(f"Collected {len(all_articles)} total articles for {country}, saved {total_saved} new articles")
     return all_articles
 
-def get_news_by_section(section: str, country: str = None, days: int = 3, limit: int = 50) -> List[Dict[str, Any]]:
+def get_news_by_section(section: str, country: str = None, days: int = 3, limit: int = 50, collapse: bool = False) -> List[Article]:
     """특정 섹션의 뉴스를 가져옵니다."""
     db = next(get_db())
     try:
         repo = NewsRepository(db)
-        return repo.get_news_by_section(section, country, days, limit)
+        return repo.get_news_by_section(section, country, days, limit, collapse=collapse)
     finally:
         db.close()
 
-def get_recent_news(country: str, days: int = 3, limit: int = 50) -> List[Dict[str, Any]]:
+def get_recent_news(country: str, days: int = 3, limit: int = 50, collapse: bool = False) -> List[Article]:
     """데이터베이스에서 최근 뉴스를 가져옵니다."""
     db = next(get_db())
     try:
         repo = NewsRepository(db)
-        return repo.get_recent_news(country, days, limit)
+        return repo.get_recent_news(country, days, limit, collapse=collapse)
     finally:
         db.close()
 
 def refresh_all_feeds() -> Dict[str, int]:
-    """모든 피드를 새로고침합니다."""
+    """모든 피드를 새로고침합니다. (국가별 수집 기사 수)"""
+    results, _ = refresh_all_feeds_with_report()
+    return results
+
+def refresh_all_feeds_with_report() -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """모든 피드를 새로고침하고 피드별 프로파일 리포트를 refresh_runs에 저장합니다."""
     logger.info("Starting feed refresh...")
     
     results = {}
+    report = RefreshReport()
+    
+    # 레지스트리에 등록된 국가별 뉴스 수집
+    countries = get_countries()
+    for country in countries:
+        try:
+            articles = collect_news(country, days=3, report=report)
+            results[country] = len(articles)
+        except Exception as e:
+            logger.error(f"Error collecting {country} news: {e}")
+            slack.notify_error(str(e), f"{country} 뉴스 수집 실패")
+            results[country] = 0
+    
+    # 슬랙 알림: 피드 새로고침 완료
+    total_success = sum(results.values())
+    # 실제 사용된 피드 개수 계산
+    total_feeds = sum(len(get_collection_feeds(country)) for country in countries)
+    slack.notify_feed_refresh(total_success, total_feeds)
     
-    # 미국 뉴스 수집
+    # 오늘의 경제/정치 Slack 요약 미리 생성 (알림 요청은 저장된 요약만 전송)
+    db = next(get_db())
     try:
-        us_articles = collect_news('US', days=3)
-        results['US'] = len(us_articles)
+        with stage_timer("digest"):
+            build_daily_digest(db)
     except Exception as e:
-        logger.error(f"Error collecting US news: {e}")
-        slack.notify_error(str(e), "미국 뉴스 수집 실패")
-        results['US'] = 0
+        db.rollback()
+        logger.error(f"Error building daily digest: {e}")
+    finally:
+        db.close()
     
-    # 한국 뉴스 수집
+    # 섹션 분류 모델 재학습 (CLASSIFIER_RETRAIN_HOURS마다, 다음 새로고침부터 사용)
+    db = next(get_db())
     try:
-        kr_articles = collect_news('KR', days=3)
-        results['KR'] = len(kr_articles)
+        with stage_timer("train"):
+            train_section_model(db)
     except Exception as e:
-        logger.error(f"Error collecting KR news: {e}")
-        slack.notify_error(str(e), "한국 뉴스 수집 실패")
-        results['KR'] = 0
+        db.rollback()
+        logger.error(f"Error training section model: {e}")
+    finally:
+        db.close()
     
-    # 슬랙 알림: 피드 새로고침 완료
-    total_success = sum(results.values())
-    # 실제 사용된 피드 개수 계산
-    us_feeds = get_feeds_by_country('US')
-    kr_feeds = get_feeds_by_country('KR')
-    total_feeds = len(us_feeds) + len(kr_feeds)
-    slack.notify_feed_refresh(total_success, total_feeds)
+    # 기본 페이지 조각 미리 렌더링
+    warm_news_fragments()
     
-    logger.info(f"Feed refresh completed: {results}")
-    return results
+    # 기본 페이지/JSON 정적 스냅샷 생성 (SNAPSHOT_MODE=true일 때)
+    refresh_snapshots()
+    
+    # 피드별 프로파일 리포트 저장 (실패해도 새로고침 결과는 반환)
+    report.results = results
+    run = report.to_dict()
+    db = next(get_db())
+    try:
+        run['id'] = RefreshRunRepository(db).save_run(run)
+    except Exception as e:
+        logger.error(f"Error saving refresh report: {e}")
+    finally:
+        db.close()
+    
+    slowest = run['feeds'][0] if run['feeds'] else None
+    logger.info(
+        f"Feed refresh completed in {run['duration_ms']}ms: {results}"
+        + (f" (slowest feed {slowest['url']}: {slowest['fetch_ms']}ms)" if slowest else "")
+    )
+    return results, run
 
-def build_summary(us_news: List[Dict], kr_news: List[Dict], days_us: int = 3, days_kr: int = 3) -> Dict[str, Any]:
+def build_summary(us_news: List[Article], kr_news: List[Article], days_us: int = 3, days_kr: int = 3) -> Dict[str, Any]:
     """뉴스 요약 정보를 생성합니다."""
-    # 최종 업데이트 시간 계산 (가장 최근 created_at)
-    all_news = us_news + kr_news
-    last_update = "알 수 없음"
-    
-    if all_news:
-        # created_at이 있는 뉴스들 중 가장 최근 시간 찾기
-        valid_news = [n for n in all_news if n.get('created_at')]
-        if valid_news:
-            latest_news = max(valid_news, key=lambda x: x['created_at'])
-            if hasattr(latest_news['created_at'], 'strftime'):
-                # 한국 시간으로 변환
-                if latest_news['created_at'].tzinfo is None:
-                    # UTC로 가정하고 한국 시간으로 변환
-                    kst_time = latest_news['created_at'].replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=9)))
-                else:
-                    kst_time = latest_news['created_at'].astimezone(timezone(timedelta(hours=9)))
-                last_update = kst_time.strftime("%Y-%m-%d %H:%M:%S KST")
-            else:
-                last_update = str(latest_news['created_at'])
+    # 최종 업데이트 시간 계산 (가장 최근 created_at, 조회 시 UTC로 정규화됨)
+    created = [n.created_at for n in us_news + kr_news if n.created_at]
+    last_update = format_kst(max(created)) if created else "알 수 없음"
     
     return {
         'total': len(us_news) + len(kr_news),
@@ -270,82 +474,9 @@ def classify_news_section(title: str, summary: str = "") -> str:
     """
     text = (title + " " + summary).lower()
     
-    # 정치 관련 키워드
-    politics_keywords = [
-        'politics', 'political', 'election', 'president', 'congress', 'senate', 'government',
-        'democrat', 'republican', 'campaign', 'vote', 'voting', 'poll', 'polls',
-        'white house', 'capitol', 'legislation', 'bill', 'law', 'policy',
-        'minister', 'parliament', 'election', 'vote', 'campaign', 'political party',
-        '정치', '대선', '선거', '국회', '정부', '여당', '야당', '정책', '법안', '대통령', '총리', '장관',
-        '의회', '검찰', '법무부', '국정감사', '여야', '여당', '야당', '정당', '투표'
-    ]
-    
-    # 경제/비즈니스 관련 키워드
-    business_keywords = [
-        'business', 'economy', 'economic', 'finance', 'financial', 'market', 'stock',
-        'trade', 'commerce', 'investment', 'investor', 'bank', 'banking', 'money',
-        'dollar', 'euro', 'currency', 'inflation', 'recession', 'gdp', 'unemployment',
-        'company', 'corporation', 'ceo', 'executive', 'profit', 'revenue', 'earnings',
-        '경제', '금융', '주식', '투자', '은행', '기업', '매출', '수익', '인플레이션',
-        '부동산', '원화', '달러', '환율', '증시', '코스피', '코스닥', '채권', '금리'
-    ]
-    
-    # 기술 관련 키워드
-    technology_keywords = [
-        'technology', 'tech', 'digital', 'computer', 'software', 'hardware', 'internet',
-        'ai', 'artificial intelligence', 'machine learning', 'data', 'cyber', 'cybersecurity',
-        'app', 'application', 'mobile', 'smartphone', 'social media', 'online',
-        'startup', 'innovation', 'robot', 'automation', 'blockchain', 'crypto',
-        '기술', '디지털', '컴퓨터', '소프트웨어', '인공지능', '스마트폰', '앱'
-    ]
-    
-    # 스포츠 관련 키워드
-    sports_keywords = [
-        'sports', 'football', 'basketball', 'baseball', 'soccer', 'tennis', 'golf',
-        'nfl', 'nba', 'mlb', 'nhl', 'olympics', 'championship', 'tournament',
-        'player', 'team', 'coach', 'game', 'match', 'score', 'win', 'lose',
-        '스포츠', '축구', '야구', '농구', '골프', '테니스', '선수', '팀', '경기'
-    ]
-    
-    # 엔터테인먼트 관련 키워드
-    entertainment_keywords = [
-        'entertainment', 'movie', 'film', 'tv', 'television', 'show', 'series',
-        'actor', 'actress', 'director', 'producer', 'celebrity', 'star', 'hollywood',
-        'music', 'song', 'album', 'artist', 'singer', 'concert', 'performance',
-        'game', 'gaming', 'video game', 'streaming', 'netflix', 'disney',
-        '엔터테인먼트', '영화', '드라마', '연예인', '가수', '음악', '게임', '요가원', '개원'
-    ]
-    
-    # 건강 관련 키워드
-    health_keywords = [
-        'health', 'medical', 'medicine', 'doctor', 'hospital', 'patient', 'disease',
-        'covid', 'coronavirus', 'vaccine', 'vaccination', 'treatment', 'therapy',
-        'mental health', 'psychology', 'psychiatrist', 'therapy', 'wellness',
-        '건강', '의료', '병원', '의사', '질병', '코로나', '백신', '치료'
-    ]
-    
-    # 과학 관련 키워드
-    science_keywords = [
-        'science', 'scientific', 'research', 'study', 'discovery', 'experiment',
-        'space', 'nasa', 'astronomy', 'planet', 'earth', 'climate', 'environment',
-        'biology', 'chemistry', 'physics', 'mathematics', 'engineering',
-        '과학', '연구', '발견', '우주', '천문학', '지구', '환경', '생물학'
-    ]
-    
-    # 각 섹션별 키워드 매칭
-    sections = {
-        'politics': politics_keywords,
-        'business': business_keywords,
-        'technology': technology_keywords,
-        'sports': sports_keywords,
-        'entertainment': entertainment_keywords,
-        'health': health_keywords,
-        'science': science_keywords
-    }
-    
-    # 키워드 매칭 점수 계산
+    # 키워드 매칭 점수 계산 (키워드 목록은 app/keywords.py)
     scores = {}
-    for section, keywords in sections.items():
+    for section, keywords in SECTION_KEYWORDS.items():
         score = sum(1 for keyword in keywords if keyword in text)
         scores[section] = score
     
@@ -0,0 +1,185 @@
+# app/news_stream.py
+"""
+신규 기사 실시간 스트림 (Server-Sent Events)
+
+대시보드가 /api/v1/news/{country}를 몇 초마다 폴링하는 대신 GET /api/v1/news/stream에 연결해
+save_articles_to_db가 방금 저장한 기사만 받습니다. DB 조회 없이 메모리에서 전달합니다.
+- 프로세스 내 브로드캐스트 허브: 저장 직후 publish_articles()가 구독자별 큐에 이벤트를 넣음
+  (새로고침은 스레드풀이나 다른 스레드에서 실행될 수 있으므로 call_soon_threadsafe로 전달)
+- 구독자별 큐는 STREAM_CLIENT_BUFFER개로 제한: 넘치면(느린 클라이언트) 'reset' 이벤트 후 연결을 닫고,
+  클라이언트는 Last-Event-ID로 재연결해 링 버퍼(STREAM_HISTORY_SIZE)에서 놓친 이벤트를 이어 받음
+- 이벤트 ID는 프로세스 내 순번입니다. 서버리스 환경에서는 새로고침을 실행한 인스턴스에 연결된
+  클라이언트만 이벤트를 받으며, STREAM_MAX_DURATION 후 연결을 닫아 함수 최대 실행 시간을 넘지 않게 합니다.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from app.article import Article
+from app.timeutils import local_display, utc_now
+from app.utils import dumps_json
+
+logger = logging.getLogger(__name__)
+
+STREAM_HISTORY_SIZE = int(os.getenv("STREAM_HISTORY_SIZE", "500"))    # 재연결 시 이어 받을 수 있는 최근 이벤트 수
+STREAM_CLIENT_BUFFER = int(os.getenv("STREAM_CLIENT_BUFFER", "200"))  # 구독자별 미전송 이벤트 상한
+STREAM_HEARTBEAT = float(os.getenv("STREAM_HEARTBEAT", "15"))         # 초, 프록시 연결 유지용 주석 전송 간격
+STREAM_MAX_DURATION = float(os.getenv("STREAM_MAX_DURATION", "0"))    # 초, 0이면 제한 없음 (Vercel: 25 권장)
+STREAM_RETRY_MS = 3000
+
+
+class StreamEvent(NamedTuple):
+    """브로드캐스트 이벤트 (id, 국가, 섹션, 직렬화된 기사 JSON)"""
+    id: int
+    country: Optional[str]
+    section: Optional[str]
+    data: bytes
+
+
+class Subscriber:
+    """연결된 클라이언트 하나의 필터와 제한된 이벤트 큐"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, country: Optional[str], section: Optional[str],
+                 max_buffer: int = STREAM_CLIENT_BUFFER):
+        self.loop = loop
+        self.country = country
+        self.section = section
+        self.queue: "asyncio.Queue[StreamEvent]" = asyncio.Queue(maxsize=max_buffer)
+        self.lagged = False
+
+    def matches(self, event: StreamEvent) -> bool:
+        return (self.country is None or event.country == self.country) and (
+            self.section is None or event.section == self.section
+        )
+
+    def offer(self, events: List[StreamEvent]) -> None:
+        """이벤트 루프 스레드에서 호출: 큐가 가득 차면 지연(lagged)으로 표시하고 이후 이벤트는 버림"""
+        for event in events:
+            if self.lagged:
+                return
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.lagged = True
+
+
+class NewsStreamHub:
+    """프로세스 내 신규 기사 브로드캐스트 허브 (최근 이벤트 링 버퍼 포함)"""
+
+    def __init__(self, history_size: int = STREAM_HISTORY_SIZE):
+        self._history: Deque[StreamEvent] = deque(maxlen=history_size)
+        self._subscribers: Set[Subscriber] = set()
+        self._last_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def subscribe(self, country: Optional[str] = None, section: Optional[str] = None,
+                  last_event_id: Optional[int] = None) -> Tuple[Subscriber, List[StreamEvent]]:
+        """구독을 등록하고 last_event_id 이후의 놓친 이벤트를 함께 반환합니다. (등록과 조회를 원자적으로)"""
+        subscriber = Subscriber(asyncio.get_running_loop(), country, section)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            backlog = []
+            if last_event_id is not None:
+                backlog = [e for e in self._history if e.id > last_event_id and subscriber.matches(e)]
+        return subscriber, backlog
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, articles: List[Article]) -> int:
+        """기사들을 이벤트로 만들어 링 버퍼에 넣고 구독자에게 전달합니다. (발행한 이벤트 수)"""
+        if not articles:
+            return 0
+        with self._lock:
+            events = []
+            for article in articles:
+                self._last_id += 1
+                event = StreamEvent(self._last_id, article.country, article.section, dumps_json(article.to_dict()))
+                self._history.append(event)
+                events.append(event)
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            matched = [e for e in events if subscriber.matches(e)]
+            if not matched:
+                continue
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, matched)
+            except RuntimeError:  # 이벤트 루프가 이미 종료된 구독자
+                self.unsubscribe(subscriber)
+        return len(events)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "last_event_id": self._last_id,
+                "history": len(self._history),
+            }
+
+
+# 전역 인스턴스
+news_stream_hub = NewsStreamHub()
+
+
+def publish_articles(articles: List[Article]) -> int:
+    """방금 저장된 기사를 스트림 구독자에게 발행합니다. (조회 API와 같은 형식으로 표시값 계산)"""
+    if not articles:
+        return 0
+    created_at = utc_now()
+    prepared = []
+    for article in articles:
+        published, local_str, tz_name = local_display(article.published, article.country)
+        prepared.append(article._replace(
+            published=published, created_at=created_at, published_local_str=local_str, local_tz=tz_name
+        ))
+    try:
+        return news_stream_hub.publish(prepared)
+    except Exception as e:
+        logger.error(f"Error publishing stream events: {e}")
+        return 0
+
+
+def format_event(event: StreamEvent) -> bytes:
+    return b"id: %d\nevent: article\ndata: %s\n\n" % (event.id, event.data)
+
+
+async def stream_events(country: Optional[str] = None, section: Optional[str] = None,
+                        last_event_id: Optional[int] = None, hub: NewsStreamHub = None) -> AsyncIterator[bytes]:
+    """SSE 본문 생성기 (놓친 이벤트 → 실시간 이벤트, 주기적 heartbeat)"""
+    hub = hub or news_stream_hub
+    subscriber, backlog = hub.subscribe(country, section, last_event_id)
+    deadline = time.monotonic() + STREAM_MAX_DURATION if STREAM_MAX_DURATION > 0 else None
+    try:
+        yield b"retry: %d\n: connected last_event_id=%d\n\n" % (STREAM_RETRY_MS, hub.last_id)
+        for event in backlog:
+            yield format_event(event)
+
+        while True:
+            timeout = STREAM_HEARTBEAT
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                timeout = min(timeout, remaining)
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                continue
+            yield format_event(event)
+            if subscriber.lagged and subscriber.queue.empty():
+                # 버퍼가 넘쳐 이벤트를 잃음: 클라이언트가 Last-Event-ID로 재연결해 링 버퍼에서 이어 받도록 종료
+                yield b"event: reset\ndata: {\"reason\":\"client buffer overflow\"}\n\n"
+                return
+    finally:
+        hub.unsubscribe(subscriber)
@@ -0,0 +1,163 @@
+# app/ranking.py
+"""
+사건(클러스터) 중요도 순위 - 수집 시 미리 계산
+
+story_score = ln(strength) + ln2 × t / half_life
+- strength = 보도한 서로 다른 출처 수 + STORY_FEED_WEIGHT × (이 사건을 실은 피드 수 - 1)
+  (피드 수: 한 번의 새로고침에서 같은 사건의 기사가 실린 섹션/종합 피드 수, 새로고침 간에는 최댓값 유지)
+- t = 사건의 가장 최근 기사 발행 시각 (epoch 초)
+지수 감쇠 strength × 0.5^(경과 시간 / half_life)의 로그에서 현재 시각 항만 뺀 형태라 두 사건의 순위는
+시간이 지나도 바뀌지 않습니다. 그래서 새로고침마다 새 기사가 들어온 사건만 점수를 다시 계산하고,
+국가/섹션별 상위 N개(top_stories)는 기존 목록과 갱신된 사건을 병합해 유지합니다.
+조회(/api/v1/news/top)는 top_stories를 순위 순으로 읽기만 하며, 응답의 점수는 현재 시각 기준 감쇠값입니다.
+"""
+import logging
+import math
+import os
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set
+
+from sqlalchemy.orm import Session
+
+from app.clustering import CLUSTER_WINDOW_DAYS
+from app.repositories.story_repository import ALL_SECTIONS, StoryRepository
+from app.timeutils import to_storage_utc, to_utc, utc_cutoff, utc_now
+
+logger = logging.getLogger(__name__)
+
+STORY_HALF_LIFE_HOURS = float(os.getenv("STORY_HALF_LIFE_HOURS", "12"))  # 점수가 절반이 되는 시간
+STORY_FEED_WEIGHT = float(os.getenv("STORY_FEED_WEIGHT", "0.5"))         # 추가 피드 1개당 가중치 (출처 1개 = 1)
+TOP_STORIES_SIZE = int(os.getenv("TOP_STORIES_SIZE", "50"))             # 국가/섹션별로 유지할 상위 사건 수
+TOP_STORIES_MAX_AGE_HOURS = float(os.getenv("TOP_STORIES_MAX_AGE_HOURS", str(CLUSTER_WINDOW_DAYS * 24)))
+
+_DECAY_RATE = math.log(2) / (STORY_HALF_LIFE_HOURS * 3600)
+
+
+def story_strength(source_count: int, feed_hits: int) -> float:
+    return max(source_count, 1) + STORY_FEED_WEIGHT * max(feed_hits - 1, 0)
+
+
+def story_score(source_count: int, feed_hits: int, last_published) -> float:
+    """시간에 따라 순위가 변하지 않는 log 공간 점수"""
+    return math.log(story_strength(source_count, feed_hits)) + _DECAY_RATE * to_utc(last_published).timestamp()
+
+
+def current_story_score(score: float, now=None) -> float:
+    """현재 시각 기준 감쇠된 strength (응답 표시용)"""
+    now = now or utc_now()
+    return math.exp(score - _DECAY_RATE * now.timestamp())
+
+
+def _rank_key(entry: Dict[str, Any]):
+    return (-entry['story_score'], -to_utc(entry['last_published']).timestamp())
+
+
+def _score_clusters(repo: StoryRepository, country: str, cluster_ids: Iterable[str],
+                    cluster_feeds: Dict[str, Set[str]], states: Dict[str, Any], cutoff) -> List[Dict[str, Any]]:
+    """사건별 기사에서 출처 수/최신 발행일/대표 기사를 구해 점수를 계산합니다. (기간이 지난 사건 제외)"""
+    grouped = defaultdict(list)
+    for row in repo.get_cluster_articles(list(cluster_ids)):
+        grouped[row.story_id].append(row)
+
+    updated_at = utc_now().replace(tzinfo=None)
+    stories = []
+    for cluster_id, rows in grouped.items():
+        latest = max(rows, key=lambda row: to_utc(row.published))
+        last_published = to_storage_utc(latest.published)
+        if last_published < cutoff:
+            continue
+        previous_hits = states[cluster_id][2] if cluster_id in states else 0
+        feed_hits = max(len(cluster_feeds.get(cluster_id, ())), previous_hits, 1)
+        source_count = len({row.source_id for row in rows})
+        stories.append({
+            'cluster_id': cluster_id,
+            'country': country,
+            'section_id': latest.section_id,
+            'article_id': latest.id,
+            'source_count': source_count,
+            'feed_hits': feed_hits,
+            'article_count': len(rows),
+            'last_published': last_published,
+            'story_score': story_score(source_count, feed_hits, last_published),
+            'updated_at': updated_at,
+        })
+    return stories
+
+
+def _merge_top(repo: StoryRepository, country: str, section_id: int, stories: List[Dict[str, Any]],
+               updated_ids: Set[str], cutoff) -> None:
+    """저장된 상위 목록 + 갱신된 사건으로 새 상위 목록을 만듭니다.
+
+    갱신되지 않은 사건의 점수는 그대로이고 갱신된 사건의 점수는 오르기만 하므로 병합 결과가 정확합니다.
+    다만 꽉 찬 목록에서 기간 만료/섹션 변경으로 빠진 항목이 있으면 목록 밖 후보가 올라와야 하므로
+    그때만 stories에서 다시 계산합니다.
+    """
+    stored = repo.get_top_entries(country, section_id)
+    kept = [
+        entry for entry in stored
+        if entry['cluster_id'] not in updated_ids and to_storage_utc(entry['last_published']) >= cutoff
+    ]
+    fresh = [
+        story for story in stories
+        if section_id == ALL_SECTIONS or story['section_id'] == section_id
+    ]
+    stored_ids = {entry['cluster_id'] for entry in stored}
+    dropped = len(stored) - len(kept) - sum(1 for story in fresh if story['cluster_id'] in stored_ids)
+    if dropped > 0 and len(stored) >= TOP_STORIES_SIZE:
+        top = repo.get_ranked_stories(country, section_id, cutoff, TOP_STORIES_SIZE)
+    else:
+        top = sorted(kept + fresh, key=_rank_key)[:TOP_STORIES_SIZE]
+    repo.replace_top(country, section_id, top)
+
+
+def update_story_rankings(db: Session, country: str, article_feeds: Dict[str, Set[str]]) -> int:
+    """
+    새로고침에서 가져온 기사(기사 ID → 실린 피드 URL 집합)가 속한 사건의 점수와
+    국가/섹션별 상위 목록을 갱신합니다. (갱신한 사건 수)
+    국가의 사건 점수가 아직 없으면 최근 기간의 모든 사건으로 처음 구축합니다.
+    """
+    repo = StoryRepository(db)
+    country = country.upper()
+    cutoff = utc_cutoff(TOP_STORIES_MAX_AGE_HOURS / 24)
+
+    cluster_ids: Set[str] = set()
+    if not repo.has_stories(country):
+        cluster_ids.update(repo.get_recent_cluster_ids(country, cutoff))
+
+    cluster_feeds: Dict[str, Set[str]] = defaultdict(set)
+    for article_id, cluster_id in repo.get_article_clusters(list(article_feeds)).items():
+        cluster_feeds[cluster_id].update(article_feeds[article_id])
+    cluster_ids.update(cluster_feeds)
+    if not cluster_ids:
+        return 0
+
+    states = repo.get_story_states(list(cluster_ids))
+    stories = _score_clusters(repo, country, cluster_ids, cluster_feeds, states, cutoff)
+    repo.upsert_stories(stories)
+    repo.prune_stories(cutoff)
+
+    # 전체 순위 + 갱신된 사건의 현재/이전 섹션 순위만 다시 계산
+    section_ids = {ALL_SECTIONS}
+    section_ids.update(story['section_id'] for story in stories if story['section_id'] is not None)
+    section_ids.update(
+        state[1] for state in states.values() if state[0] == country and state[1] is not None
+    )
+    updated_ids = {story['cluster_id'] for story in stories}
+    for section_id in section_ids:
+        _merge_top(repo, country, section_id, stories, updated_ids, cutoff)
+
+    repo.commit()
+    logger.info(f"Updated {len(stories)} story scores and {len(section_ids)} top lists for {country}")
+    return len(stories)
+
+
+def top_story_entry(article, story: Dict[str, Any], now=None) -> Dict[str, Any]:
+    """/api/v1/news/top 응답 항목 (기사 + 순위/점수 정보)"""
+    return {
+        **article.to_dict(),
+        'rank': story['rank'],
+        'story_score': round(current_story_score(story['story_score'], now), 4),
+        'source_count': story['source_count'],
+        'feed_hits': story['feed_hits'],
+        'article_count': story['article_count'],
+    }
@@ -0,0 +1,86 @@
+# app/refresh_report.py
+"""
+피드 새로고침 프로파일 리포트
+
+새로고침 1회마다 피드 URL별로 요청 시간, 응답 크기, 항목 수, 파싱 시간,
+신규/중복 기사 수, 오류를 기록하고 국가별 일괄 섹션 분류/저장 시간과 전체 소요 시간을 합쳐
+refresh_runs 테이블에 JSON으로 남깁니다. (어느 피드/단계가 느린지 추적용)
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+from app.timeutils import utc_now
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+class RefreshReport:
+    """새로고침 1회의 피드별 수집 프로파일"""
+
+    def __init__(self):
+        self.started_at = utc_now().replace(tzinfo=None)
+        self._start = time.perf_counter()
+        self.feeds: List[Dict[str, Any]] = []
+        self.countries: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, int] = {}
+
+    def add_feed(self, feed_url: str, country: str, section: Optional[str] = None) -> Dict[str, Any]:
+        """피드 항목을 추가하고 fetch_rss_feed가 채울 dict를 반환합니다."""
+        entry = {
+            "url": feed_url,
+            "country": country.upper(),
+            "section": section,
+            "status": None,
+            "fetch_ms": None,
+            "bytes": 0,
+            "entries": 0,
+            "parse_ms": None,
+            "classify_ms": None,  # 피드 단위로 분류할 때만 (수집은 국가별로 모아 분류 → countries[].classify_ms)
+            "new": 0,
+            "duplicates": 0,
+            "error": None,
+        }
+        self.feeds.append(entry)
+        return entry
+
+    def record_save(self, country: str, feed_entries: Dict[str, Dict[str, Any]], saved_ids: List[str], save_time: float,
+                    classify_time: float) -> None:
+        """
+        저장 결과를 피드별 신규/중복 수로 나눕니다.
+        feed_entries는 기사 ID → 그 기사를 처음 가져온 피드 항목 (같은 기사가 여러 피드에 있으면 첫 피드만 신규)
+        """
+        for article_id in saved_ids:
+            entry = feed_entries.get(article_id)
+            if entry is not None:
+                entry["new"] += 1
+
+        country_feeds = [feed for feed in self.feeds if feed["country"] == country.upper()]
+        for feed in country_feeds:
+            feed["duplicates"] = feed["entries"] - feed["new"]
+
+        self.countries[country.upper()] = {
+            "feeds": len(country_feeds),
+            "failed_feeds": sum(1 for feed in country_feeds if feed["error"]),
+            "entries": sum(feed["entries"] for feed in country_feeds),
+            "new": len(saved_ids),
+            "classify_ms": _ms(classify_time),
+            "save_ms": _ms(save_time),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저장/응답용 리포트 (피드는 요청 시간이 긴 순서)"""
+        feeds = sorted(self.feeds, key=lambda feed: feed["fetch_ms"] or 0, reverse=True)
+        return {
+            "started_at": self.started_at,
+            "finished_at": utc_now().replace(tzinfo=None),
+            "duration_ms": int((time.perf_counter() - self._start) * 1000),
+            "results": self.results,
+            "total_feeds": len(self.feeds),
+            "failed_feeds": sum(1 for feed in self.feeds if feed["error"]),
+            "fetched_entries": sum(feed["entries"] for feed in self.feeds),
+            "new_articles": sum(feed["new"] for feed in self.feeds),
+            "countries": self.countries,
+            "feeds": feeds,
+        }
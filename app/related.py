@@ -0,0 +1,141 @@
+# app/related.py
+"""
+관련 기사 - 수집 시 미리 계산
+
+새로고침에서 저장한 기사마다 같은 국가 최근 RELATED_WINDOW_DAYS일 기사와의 TF-IDF 코사인 유사도를 구해
+상위 RELATED_TOP_K개를 article_neighbors에 저장합니다. /api/v1/news/{id}/related는 PK 범위 조회만 합니다.
+- 벡터: app/text_features의 해시 특징(영어 단어, 한국어 문자 n-gram)에 구간 전체로 구한 IDF를 곱한 희소 행렬
+- 새 기사 × 구간 전체를 희소 행렬 곱 한 번(RELATED_QUERY_CHUNK개씩)으로 계산하므로 기사 쌍을 하나씩 비교하지 않습니다.
+- 새 기사가 기존 기사의 상위 k개에 들어가면 그 기사의 목록도 갱신합니다. (역방향 간선)
+- 같은 사건(클러스터)의 기사는 사실상 같은 기사라 관련 기사에서 뺍니다.
+- 국가의 목록이 아직 없으면 구간의 모든 기사로 처음 구축합니다.
+- 기사별 해시 특징 개수는 프로세스별로 캐시하고(WindowCache) 새로고침마다 새 기사만 토큰화합니다.
+  구간을 벗어난 기사는 빼고 IDF/정규화만 다시 계산합니다. (특징 행렬 크기에 비례, 토큰화보다 훨씬 쌈)
+  인스턴스가 새로 뜬 직후의 첫 새로고침만 구간 전체를 토큰화합니다.
+점수는 계산 시점의 IDF 기준이라 오래된 목록의 점수는 새 목록과 약간 다를 수 있습니다.
+"""
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.dimensions import source_cache
+from app.repositories.related_repository import RelatedRepository
+from app.text_features import VECTORS_AVAILABLE, SparseRows, article_tokens, hash_features, np, tfidf
+from app.timeutils import utc_cutoff
+
+logger = logging.getLogger(__name__)
+
+RELATED_TOP_K = int(os.getenv("RELATED_TOP_K", "10"))                  # 기사별로 저장하는 관련 기사 수
+RELATED_WINDOW_DAYS = float(os.getenv("RELATED_WINDOW_DAYS", "7"))     # 비교 대상 기간
+RELATED_MIN_SCORE = float(os.getenv("RELATED_MIN_SCORE", "0.2"))       # 이보다 낮은 유사도는 관련 기사로 보지 않음
+RELATED_QUERY_CHUNK = int(os.getenv("RELATED_QUERY_CHUNK", "256"))     # 한 번에 곱하는 새 기사 수 (메모리 상한)
+
+
+class WindowCache:
+    """국가별 구간 기사의 해시 특징 개수 행렬 캐시 (기사 ID 목록, 개수 행렬)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows: Dict[str, Tuple[List[str], SparseRows]] = {}
+
+    def counts(self, repo: RelatedRepository, country: str, ids: List[str]):
+        """ids 순서의 개수 행렬 - 캐시에 없는 기사만 조회해 토큰화합니다."""
+        with self._lock:
+            cached: Optional[Tuple[List[str], SparseRows]] = self._windows.get(country)
+        cached_ids, cached_counts = (list(cached[0]), cached[1]) if cached else ([], None)
+        cached_position = {article_id: i for i, article_id in enumerate(cached_ids)}
+
+        missing = [article_id for article_id in ids if article_id not in cached_position]
+        if missing:
+            documents = repo.get_documents(missing)
+            new_counts = hash_features(
+                article_tokens(doc.title, doc.summary, source_cache.name(doc.source_id)) for doc in documents
+            )
+            for article_id in (doc.id for doc in documents):
+                cached_position[article_id] = len(cached_ids)
+                cached_ids.append(article_id)
+            cached_counts = new_counts if cached_counts is None else SparseRows.stack([cached_counts, new_counts])
+            ids = [article_id for article_id in ids if article_id in cached_position]  # 그 사이 삭제된 기사 제외
+
+        # 구간 순서로 다시 배열 (구간을 벗어난 기사는 빠짐)
+        counts = cached_counts.take([cached_position[article_id] for article_id in ids])
+        with self._lock:
+            self._windows[country] = (ids, counts)
+        return ids, counts, len(missing)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._windows.clear()
+
+
+# 전역 인스턴스
+window_cache = WindowCache()
+
+
+def _top_neighbors(scores, ids: List[str]) -> List[Tuple[str, float]]:
+    """유사도 행 하나에서 RELATED_MIN_SCORE 이상인 상위 RELATED_TOP_K개"""
+    k = min(RELATED_TOP_K, len(scores))
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return [(ids[j], round(float(scores[j]), 4)) for j in candidates if scores[j] >= RELATED_MIN_SCORE]
+
+
+def update_related_articles(db: Session, country: str, article_ids: Iterable[str]) -> int:
+    """새로 저장한 기사의 관련 기사 목록을 계산해 저장합니다. (목록을 바꾼 기사 수)"""
+    if not VECTORS_AVAILABLE:
+        return 0
+    repo = RelatedRepository(db)
+    country = country.upper()
+    window = repo.get_window_articles(country, utc_cutoff(RELATED_WINDOW_DAYS))
+    if len(window) < 2:
+        return 0
+
+    story_of = {row.id: row.story_id for row in window}
+    ids, counts, tokenized = window_cache.counts(repo, country, [row.id for row in window])
+    position = {article_id: i for i, article_id in enumerate(ids)}
+    backfill = not repo.has_neighbors(country)
+    targets = list(range(len(ids))) if backfill else sorted({position[i] for i in article_ids if i in position})
+    if not targets:
+        return 0
+
+    vectors = tfidf(counts)
+    story_codes = {}
+    stories = np.array([story_codes.setdefault(story_of[article_id], len(story_codes)) for article_id in ids])
+    transposed = vectors.transpose()
+
+    lists: Dict[str, List[Tuple[str, float]]] = {}
+    reverse: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+    for start in range(0, len(targets), RELATED_QUERY_CHUNK):
+        rows = np.array(targets[start:start + RELATED_QUERY_CHUNK])
+        scores = vectors.take(rows).dot_transposed(transposed)
+        # 자기 자신과 같은 사건의 기사 제외
+        scores[stories[rows][:, None] == stories[None, :]] = 0.0
+        for offset, row in enumerate(rows):
+            neighbors = _top_neighbors(scores[offset], ids)
+            lists[ids[row]] = neighbors
+            for neighbor_id, score in neighbors:
+                reverse[neighbor_id].append((ids[row], score))
+
+    # 새 기사가 기존 기사의 상위 목록에 들어가는 경우 그 기사의 목록도 갱신
+    affected = [article_id for article_id in reverse if article_id not in lists]
+    existing = repo.get_neighbor_lists(affected)
+    for article_id in affected:
+        current = existing.get(article_id, [])
+        merged = dict(current)
+        for neighbor_id, score in reverse[article_id]:
+            merged[neighbor_id] = max(score, merged.get(neighbor_id, 0.0))
+        top = sorted(merged.items(), key=lambda item: -item[1])[:RELATED_TOP_K]
+        if top != current:
+            lists[article_id] = top
+
+    repo.replace_neighbors(lists)
+    repo.commit()
+    logger.info(
+        f"Updated related articles for {len(lists)} {country} articles "
+        f"({len(targets)} new{' backfill' if backfill else ''}, window {len(ids)}, tokenized {tokenized})"
+    )
+    return len(lists)
@@ -1,4 +1,10 @@
 # app/repositories/__init__.py
+from .classifier_repository import ClassifierRepository
+from .digest_repository import DigestRepository
 from .news_repository import NewsRepository
+from .refresh_run_repository import RefreshRunRepository
+from .related_repository import RelatedRepository
+from .story_repository import StoryRepository
+from .url_alias_repository import UrlAliasRepository
 
-__all__ = ['NewsRepository']
+__all__ = ['ClassifierRepository', 'DigestRepository', 'NewsRepository', 'RefreshRunRepository', 'RelatedRepository', 'StoryRepository', 'UrlAliasRepository']
@@ -0,0 +1,12 @@
+# app/repositories/chunks.py
+from typing import Iterable, List, Sequence
+
+# IN 목록 한 번에 넣을 ID 수 (SQLite 바인드 변수 제한 고려)
+IN_CHUNK_SIZE = 500
+
+
+def in_chunks(values: Sequence[str]) -> Iterable[List[str]]:
+    """IN :ids (expanding) 조회용으로 값을 IN_CHUNK_SIZE개씩 나눕니다."""
+    values = list(values)
+    for start in range(0, len(values), IN_CHUNK_SIZE):
+        yield values[start:start + IN_CHUNK_SIZE]
@@ -0,0 +1,58 @@
+# app/repositories/classifier_repository.py
+import logging
+from datetime import datetime
+from typing import Any, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class ClassifierRepository:
+    """섹션 분류 모델(section_models)과 학습 데이터 조회 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_training_rows(self, cutoff) -> List[Any]:
+        """섹션 피드에서 수집해 섹션 라벨이 있는 기사 (발행 시각 순)"""
+        query = text("""
+            SELECT title, summary, source_id, section_id
+            FROM news_articles
+            WHERE section_from_feed = 1 AND published >= :cutoff AND section_id IS NOT NULL
+            ORDER BY published
+        """)
+        return self.db.execute(query, {'cutoff': cutoff}).fetchall()
+
+    def get_trained_at(self, name: str) -> Optional[datetime]:
+        """모델 학습 시각 (캐시 갱신 판단용, 모델 본문은 읽지 않음)"""
+        query = text("SELECT trained_at FROM section_models WHERE name = :name")
+        return self.db.execute(query, {'name': name}).scalar()
+
+    def get_model(self, name: str) -> Optional[Any]:
+        query = text("SELECT name, trained_at, model, metrics FROM section_models WHERE name = :name")
+        return self.db.execute(query, {'name': name}).fetchone()
+
+    def save_model(self, name: str, trained_at: datetime, model: bytes, metrics: str) -> None:
+        """모델을 저장합니다. (있으면 교체)"""
+        query = text("""
+            INSERT INTO section_models (name, trained_at, model, metrics)
+            VALUES (:name, :trained_at, :model, :metrics)
+            ON CONFLICT (name) DO UPDATE SET
+                trained_at = excluded.trained_at,
+                model = excluded.model,
+                metrics = excluded.metrics
+        """)
+        self.db.execute(query, {'name': name, 'trained_at': trained_at, 'model': model, 'metrics': metrics})
+
+    def commit(self):
+        """변경사항을 커밋합니다."""
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Section model commit failed: {e}")
+            raise
@@ -0,0 +1,98 @@
+# app/repositories/digest_repository.py
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+DIGEST_COLUMNS = "digest_date, message, article_counts, total_articles, created_at"
+
+
+@instrument_repository
+class DigestRepository:
+    """일일 요약(daily_digests)과 채널별 전송 기록(digest_deliveries) 데이터 접근 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_digest(self, digest_date: str) -> Optional[Any]:
+        """저장된 요약 (PK 조회)"""
+        query = text(f"SELECT {DIGEST_COLUMNS} FROM daily_digests WHERE digest_date = :digest_date")
+        return self.db.execute(query, {'digest_date': digest_date}).fetchone()
+
+    def save_digest(self, digest_date: str, message: str, article_counts: str, total_articles: int,
+                    created_at: datetime) -> bool:
+        """
+        요약을 저장합니다. (있으면 교체, 저장 여부 반환)
+        이미 한 채널이라도 전송을 시작한 날짜의 요약은 바꾸지 않아 재시도해도 같은 내용이 전송됩니다.
+        """
+        query = text(f"""
+            INSERT INTO daily_digests ({DIGEST_COLUMNS})
+            VALUES (:digest_date, :message, :article_counts, :total_articles, :created_at)
+            ON CONFLICT (digest_date) DO UPDATE SET
+                message = excluded.message,
+                article_counts = excluded.article_counts,
+                total_articles = excluded.total_articles,
+                created_at = excluded.created_at
+            WHERE NOT EXISTS (
+                SELECT 1 FROM digest_deliveries WHERE digest_deliveries.digest_date = excluded.digest_date
+            )
+        """)
+        result = self.db.execute(query, {
+            'digest_date': digest_date, 'message': message, 'article_counts': article_counts,
+            'total_articles': total_articles, 'created_at': created_at,
+        })
+        return result.rowcount > 0
+
+    def claim_delivery(self, idempotency_key: str, digest_date: str, channel: str,
+                       now: datetime, stale_before: datetime) -> bool:
+        """
+        멱등 키의 전송 권한을 얻습니다. (처음이거나, 이전 시도가 실패했거나, sending 임대가 만료된 경우만 True)
+        이미 sent인 키나 다른 요청이 전송 중인 키는 충돌 시 갱신 조건에 걸려 행이 반환되지 않습니다.
+        """
+        query = text("""
+            INSERT INTO digest_deliveries (idempotency_key, digest_date, channel, status, attempts, claimed_at)
+            VALUES (:idempotency_key, :digest_date, :channel, 'sending', 1, :now)
+            ON CONFLICT (idempotency_key) DO UPDATE SET
+                status = 'sending',
+                attempts = digest_deliveries.attempts + 1,
+                claimed_at = excluded.claimed_at
+            WHERE digest_deliveries.status = 'failed'
+               OR (digest_deliveries.status = 'sending' AND digest_deliveries.claimed_at < :stale_before)
+            RETURNING idempotency_key
+        """)
+        row = self.db.execute(query, {
+            'idempotency_key': idempotency_key, 'digest_date': digest_date, 'channel': channel,
+            'now': now, 'stale_before': stale_before,
+        }).fetchone()
+        return row is not None
+
+    def get_delivery_status(self, idempotency_key: str) -> Optional[str]:
+        query = text("SELECT status FROM digest_deliveries WHERE idempotency_key = :idempotency_key")
+        return self.db.execute(query, {'idempotency_key': idempotency_key}).scalar()
+
+    def finish_delivery(self, idempotency_key: str, sent: bool, now: datetime) -> None:
+        """전송 결과를 기록합니다."""
+        query = text("""
+            UPDATE digest_deliveries
+            SET status = :status, sent_at = :sent_at
+            WHERE idempotency_key = :idempotency_key
+        """)
+        self.db.execute(query, {
+            'idempotency_key': idempotency_key,
+            'status': 'sent' if sent else 'failed',
+            'sent_at': now if sent else None,
+        })
+
+    def commit(self):
+        """변경사항을 커밋합니다."""
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Digest commit failed: {e}")
+            raise
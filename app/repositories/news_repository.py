@@ -1,17 +1,25 @@
 # app/repositories/news_repository.py
 import os
+import re
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from app.database import NewsArticle
+from app.article import Article, article_from_row, articles_from_rows, ARTICLE_COLUMNS, ARTICLE_COLUMNS_NO_URL, article_columns, format_analysis_text
+from app.database import NewsArticle, get_search_backend, replica_read
+from app.dimensions import clear_dimension_caches, section_cache, source_cache
+from app.metrics import instrument_repository
+from app.timeutils import to_storage_utc, utc_cutoff, utc_now
 
 logger = logging.getLogger(__name__)
 
+# 검색어 토큰 (영문/숫자/한글 등 단어 문자)
+SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+@instrument_repository
 class NewsRepository:
-    """뉴스 데이터 접근을 담당하는 Repository 클래스"""
+    """뉴스 데이터 접근을 담당하는 Repository 클래스 (@replica_read 메서드는 읽기 복제본에서 조회)"""
     
     def __init__(self, db: Session):
         self.db = db
@@ -19,14 +27,22 @@ class NewsRepository:
         database_url = os.getenv("DATABASE_URL", "")
         self.is_postgresql = database_url and "postgresql" in database_url
     
-    def get_recent_news(self, country: str, days: int = 3, limit: int = 50) -> List[Dict[str, Any]]:
-        """데이터베이스에서 최근 뉴스를 가져옵니다."""
+    @replica_read
+    def get_recent_news(self, country: str, days: int = 3, limit: int = 50, collapse: bool = False) -> List[Article]:
+        """데이터베이스에서 최근 뉴스를 가져옵니다. (collapse=True면 같은 사건은 대표 기사 1개만)"""
         try:
+            if collapse:
+                return self._get_collapsed_news(
+                    "country = :country AND published >= :cutoff_date",
+                    {'country': country.upper(), 'cutoff_date': utc_cutoff(days)},
+                    limit
+                )
+            
             if self.is_postgresql:
                 # PostgreSQL용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
-                query = text("""
-                    SELECT id, title, url, source, published, summary, section, country, created_at
+                cutoff_date = utc_cutoff(days)
+                query = text(f"""
+                    SELECT {ARTICLE_COLUMNS}
                     FROM news_articles 
                     WHERE country = :country 
                       AND published >= :cutoff_date
@@ -40,9 +56,9 @@ class NewsRepository:
                 })
             else:
                 # SQLite용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
-                query = text("""
-                    SELECT id, title, url, source, published, summary, section, country, created_at
+                cutoff_date = utc_cutoff(days)
+                query = text(f"""
+                    SELECT {ARTICLE_COLUMNS}
                     FROM news_articles 
                     WHERE country = :country 
                       AND published >= :cutoff_date
@@ -55,218 +71,264 @@ class NewsRepository:
                     'limit': limit
                 })
             
-            # 결과를 딕셔너리로 변환
-            articles = []
-            for row in result.fetchall():
-                articles.append({
-                    'title': row.title,
-                    'url': row.url,
-                    'source': row.source,
-                    'published': row.published,
-                    'summary': row.summary,
-                    'section': row.section,
-                    'country': row.country,
-                    'created_at': row.created_at
-                })
-            
-            return articles
+            # 결과를 Article 레코드로 변환
+            return articles_from_rows(result)
         except Exception as e:
             logger.error(f"Error getting recent news for {country}: {e}")
             raise
     
-    def get_news_by_section(self, section: str, country: Optional[str] = None, days: int = 3, limit: int = 50, include_url: bool = True) -> List[Dict[str, Any]]:
-        """특정 섹션의 뉴스를 가져옵니다."""
+    @replica_read
+    def get_news_by_section(self, section: str, country: Optional[str] = None, days: int = 3, limit: int = 50, include_url: bool = True, collapse: bool = False) -> List[Article]:
+        """특정 섹션의 뉴스를 가져옵니다. (collapse=True면 같은 사건은 대표 기사 1개만)"""
         try:
+            if collapse:
+                where = "section_id = :section_id AND published >= :cutoff_date"
+                params = {'section_id': section_cache.lookup(section), 'cutoff_date': utc_cutoff(days)}
+                if country:
+                    where += " AND country = :country"
+                    params['country'] = country.upper()
+                return self._get_collapsed_news(where, params, limit, include_url)
+            
             if self.is_postgresql:
                 # PostgreSQL용 Raw SQL
                 # PostgreSQL용 Raw SQL - cutoff_date 계산
-                cutoff_date = datetime.now() - timedelta(days=days)
+                cutoff_date = utc_cutoff(days)
                 if country:
                     if include_url:
-                        query = text("""
-                            SELECT id, title, url, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND country = :country
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     else:
-                        query = text("""
-                            SELECT id, title, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS_NO_URL}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND country = :country
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     result = self.db.execute(query, {
-                        'section': section,
+                        'section_id': section_cache.lookup(section),
                         'country': country.upper(),
                         'cutoff_date': cutoff_date,
                         'limit': limit
                     })
                 else:
                     if include_url:
-                        query = text("""
-                            SELECT id, title, url, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     else:
-                        query = text("""
-                            SELECT id, title, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS_NO_URL}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     result = self.db.execute(query, {
-                        'section': section,
+                        'section_id': section_cache.lookup(section),
                         'cutoff_date': cutoff_date,
                         'limit': limit
                     })
             else:
                 # SQLite용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
+                cutoff_date = utc_cutoff(days)
                 if country:
                     if include_url:
-                        query = text("""
-                            SELECT id, title, url, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND country = :country
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     else:
-                        query = text("""
-                            SELECT id, title, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS_NO_URL}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND country = :country
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     result = self.db.execute(query, {
-                        'section': section,
+                        'section_id': section_cache.lookup(section),
                         'country': country.upper(),
                         'cutoff_date': cutoff_date,
                         'limit': limit
                     })
                 else:
                     if include_url:
-                        query = text("""
-                            SELECT id, title, url, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     else:
-                        query = text("""
-                            SELECT id, title, source, published, summary, section, country, created_at
+                        query = text(f"""
+                            SELECT {ARTICLE_COLUMNS_NO_URL}
                             FROM news_articles 
-                            WHERE section = :section 
+                            WHERE section_id = :section_id 
                               AND published >= :cutoff_date
                             ORDER BY published DESC 
                             LIMIT :limit
                         """)
                     result = self.db.execute(query, {
-                        'section': section,
+                        'section_id': section_cache.lookup(section),
                         'cutoff_date': cutoff_date,
                         'limit': limit
                     })
             
-            # 결과를 딕셔너리로 변환
-            articles = []
-            for row in result.fetchall():
-                article = {
-                    'title': row.title,
-                    'source': row.source,
-                    'published': row.published,
-                    'summary': row.summary,
-                    'section': row.section,
-                    'country': row.country
-                }
-                if include_url:
-                    article['url'] = row.url
-                articles.append(article)
-            
-            return articles
+            # 결과를 Article 레코드로 변환
+            return articles_from_rows(result)
         except Exception as e:
             logger.error(f"Error getting news by section {section}: {e}")
             raise
     
-    def get_economy_politics_news(self, days: int = 1, limit: int = 20) -> List[Dict[str, Any]]:
+    def _get_collapsed_news(self, where: str, params: dict, limit: int, include_url: bool = True) -> List[Article]:
+        """클러스터(cluster_id)별 최신 기사 1개씩, 발행일 역순으로 가져옵니다."""
+        columns = ARTICLE_COLUMNS if include_url else ARTICLE_COLUMNS_NO_URL
+        query = text(f"""
+            SELECT {ARTICLE_COLUMNS}
+            FROM (
+                SELECT {columns},
+                       ROW_NUMBER() OVER (
+                           PARTITION BY COALESCE(cluster_id, id) ORDER BY published DESC
+                       ) AS cluster_rank
+                FROM news_articles
+                WHERE {where}
+            ) clustered
+            WHERE cluster_rank = 1
+            ORDER BY published DESC
+            LIMIT :limit
+        """)
+        result = self.db.execute(query, {**params, 'limit': limit})
+        return articles_from_rows(result)
+    
+    def get_cluster_signatures(self, country: str, days: int) -> List[Tuple[int, str]]:
+        """최근 기사들의 (simhash, cluster_id) 목록을 가져옵니다. (클러스터 인덱스 구성용, 수집 경로라 주 DB 조회)"""
+        try:
+            cutoff_date = utc_cutoff(days)
+            query = text("""
+                SELECT simhash, COALESCE(cluster_id, id) AS cluster_id
+                FROM news_articles
+                WHERE country = :country
+                  AND published >= :cutoff_date
+                  AND simhash IS NOT NULL
+            """)
+            result = self.db.execute(query, {
+                'country': country.upper(),
+                'cutoff_date': cutoff_date
+            })
+            return [(row.simhash, row.cluster_id) for row in result]
+        except Exception as e:
+            logger.error(f"Error getting cluster signatures for {country}: {e}")
+            raise
+    
+    @replica_read
+    def get_economy_politics_news(self, days: int = 1, limit: int = 20) -> List[Article]:
         """경제/정치 뉴스를 가져옵니다."""
         try:
             if self.is_postgresql:
                 # PostgreSQL용 Raw SQL - cutoff_date 계산
-                cutoff_date = datetime.now() - timedelta(days=days)
-                query = text("""
-                    SELECT id, title, url, source, published, summary, section, country, created_at
+                cutoff_date = utc_cutoff(days)
+                query = text(f"""
+                    SELECT {ARTICLE_COLUMNS}
                     FROM news_articles 
                     WHERE published >= :cutoff_date
-                      AND section IN ('business', 'politics')
+                      AND section_id IN (:business_id, :politics_id)
                     ORDER BY published DESC 
                     LIMIT :limit
                 """)
                 result = self.db.execute(query, {
                     'cutoff_date': cutoff_date,
+                    'business_id': section_cache.lookup('business'),
+                    'politics_id': section_cache.lookup('politics'),
                     'limit': limit * 2
                 })
             else:
                 # SQLite용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
-                query = text("""
-                    SELECT id, title, url, source, published, summary, section, country, created_at
+                cutoff_date = utc_cutoff(days)
+                query = text(f"""
+                    SELECT {ARTICLE_COLUMNS}
                     FROM news_articles 
                     WHERE published >= :cutoff_date
-                      AND section IN ('business', 'politics')
+                      AND section_id IN (:business_id, :politics_id)
                     ORDER BY published DESC 
                     LIMIT :limit
                 """)
                 result = self.db.execute(query, {
                     'cutoff_date': cutoff_date,
+                    'business_id': section_cache.lookup('business'),
+                    'politics_id': section_cache.lookup('politics'),
                     'limit': limit * 2
                 })
             
-            # 결과를 딕셔너리로 변환
-            all_articles = []
-            for row in result.fetchall():
-                all_articles.append({
-                    'title': row.title,
-                    'url': row.url,
-                    'source': row.source,
-                    'published': row.published,
-                    'summary': row.summary,
-                    'section': row.section,
-                    'country': row.country
-                })
-            
-            return all_articles
+            # 결과를 Article 레코드로 변환
+            return articles_from_rows(result)
         except Exception as e:
             logger.error(f"Error getting economy/politics news: {e}")
             raise
+
+    @replica_read
+    def get_economy_politics_news_by_country(self, days: int = 1, limit: int = 20) -> Dict[str, List[Article]]:
+        """국가별 최신 경제/정치 뉴스 limit개씩 (한 국가가 다른 국가 몫을 차지하지 않도록 국가별로 자름)"""
+        try:
+            query = text(f"""
+                SELECT {ARTICLE_COLUMNS}
+                FROM (
+                    SELECT {ARTICLE_COLUMNS},
+                           ROW_NUMBER() OVER (PARTITION BY country ORDER BY published DESC, id) AS country_rank
+                    FROM news_articles
+                    WHERE published >= :cutoff_date
+                      AND section_id IN (:business_id, :politics_id)
+                ) ranked
+                WHERE country_rank <= :limit
+                ORDER BY country, country_rank
+            """)
+            result = self.db.execute(query, {
+                'cutoff_date': utc_cutoff(days),
+                'business_id': section_cache.lookup('business'),
+                'politics_id': section_cache.lookup('politics'),
+                'limit': limit
+            })
+            by_country: Dict[str, List[Article]] = {}
+            for article in articles_from_rows(result):
+                by_country.setdefault(article.country, []).append(article)
+            return by_country
+        except Exception as e:
+            logger.error(f"Error getting economy/politics news by country: {e}")
+            raise
     
-    def get_us_news_for_analysis(self, days: int = 1, limit: int = 50) -> List[Dict[str, Any]]:
+    @replica_read
+    def get_us_news_for_analysis(self, days: int = 1, limit: int = 50) -> List[Article]:
         """AI 분석용 US 뉴스를 가져옵니다."""
         try:
             if self.is_postgresql:
                 # PostgreSQL용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
-                query = text("""
-                    SELECT id, title, source, published, summary, section, country, created_at
+                cutoff_date = utc_cutoff(days)
+                query = text(f"""
+                    SELECT {ARTICLE_COLUMNS_NO_URL}
                     FROM news_articles 
                     WHERE country = 'US' 
                       AND published >= :cutoff_date
@@ -279,9 +341,9 @@ class NewsRepository:
                 })
             else:
                 # SQLite용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
-                query = text("""
-                    SELECT id, title, source, published, summary, section, country, created_at
+                cutoff_date = utc_cutoff(days)
+                query = text(f"""
+                    SELECT {ARTICLE_COLUMNS_NO_URL}
                     FROM news_articles 
                     WHERE country = 'US' 
                       AND published >= :cutoff_date
@@ -293,28 +355,150 @@ class NewsRepository:
                     'limit': limit
                 })
             
-            # 결과를 딕셔너리로 변환
-            articles = []
-            for row in result.fetchall():
-                articles.append({
-                    'title': row.title,
-                    'source': row.source,
-                    'published': row.published,
-                    'summary': row.summary,
-                    'section': row.section,
-                    'country': row.country
-                })
-            
-            return articles
+            # 결과를 Article 레코드로 변환
+            return articles_from_rows(result)
         except Exception as e:
             logger.error(f"Error getting US news for analysis: {e}")
             raise
     
-    def get_article_by_url(self, url: str) -> Optional[Dict[str, Any]]:
-        """URL로 기사를 조회합니다."""
+    def _analysis_corpus_query(self, country: str, sections: List[str], days: int, limit: int):
+        """
+        AI 분석용 코퍼스 조회 쿼리를 생성합니다.
+        섹션별 최신 limit개를 한 번의 쿼리로 가져오며, sections 순서 → 발행일 역순으로 정렬됩니다.
+        """
+        cutoff_date = utc_cutoff(days)
+        params = {
+            'country': country.upper(),
+            'cutoff_date': cutoff_date,
+            'limit': limit
+        }
+        section_params = []
+        order_cases = []
+        for i, section in enumerate(sections):
+            params[f'section_{i}'] = section_cache.lookup(section)
+            section_params.append(f':section_{i}')
+            order_cases.append(f'WHEN :section_{i} THEN {i}')
+        
+        query = text(f"""
+            SELECT analysis_text, title, source_id, summary, section_id, country
+            FROM (
+                SELECT analysis_text, title, source_id, summary, section_id, country, published,
+                       ROW_NUMBER() OVER (PARTITION BY section_id ORDER BY published DESC) AS rn
+                FROM news_articles
+                WHERE country = :country
+                  AND section_id IN ({', '.join(section_params)})
+                  AND published >= :cutoff_date
+            ) ranked
+            WHERE rn <= :limit
+            ORDER BY CASE section_id {' '.join(order_cases)} END, published DESC
+        """)
+        return query, params
+    
+    @staticmethod
+    def _analysis_text(row) -> str:
+        # 컬럼 추가 이전에 저장된 기사는 조회 시 형식화
+        if row.analysis_text:
+            return row.analysis_text
+        return format_analysis_text(
+            row.title, source_cache.name(row.source_id), row.summary, section_cache.name(row.section_id), row.country
+        )
+    
+    @replica_read
+    def get_analysis_corpus(self, country: str, sections: List[str], days: int = 1, limit: int = 50) -> List[str]:
+        """AI 분석용으로 미리 만들어 둔 텍스트 블록을 섹션 순서대로 가져옵니다."""
         try:
-            query = text("""
-                SELECT id, title, url, source, published, summary, section, country, created_at
+            query, params = self._analysis_corpus_query(country, sections, days, limit)
+            result = self.db.execute(query, params)
+            return [self._analysis_text(row) for row in result]
+        except Exception as e:
+            logger.error(f"Error getting analysis corpus for {country}: {e}")
+            raise
+    
+    @replica_read
+    def iter_analysis_corpus(self, country: str, sections: List[str], days: int = 1, limit: int = 50, batch_size: int = 200) -> Iterator[str]:
+        """get_analysis_corpus의 스트리밍 버전 (서버 사이드 커서로 batch_size씩 읽음)"""
+        try:
+            query, params = self._analysis_corpus_query(country, sections, days, limit)
+            result = self.db.execute(query.execution_options(stream_results=True), params)
+            for rows in result.partitions(batch_size):
+                for row in rows:
+                    yield self._analysis_text(row)
+        except Exception as e:
+            logger.error(f"Error streaming analysis corpus for {country}: {e}")
+            raise
+    
+    @replica_read
+    def search_news(self, query: str, country: Optional[str] = None, section: Optional[str] = None, days: int = 1, limit: int = 30) -> List[Article]:
+        """
+        제목/요약 전문 검색
+
+        PostgreSQL은 tsvector + GIN, SQLite는 FTS5 인덱스를 사용하며 각 토큰을 접두사로
+        매칭합니다. (한국어 조사 대응) 인덱스가 없으면 LIKE 검색으로 동작합니다.
+        """
+        try:
+            tokens = SEARCH_TOKEN_RE.findall(query.lower())
+            if not tokens:
+                return []
+            
+            cutoff_date = utc_cutoff(days)
+            params = {
+                'cutoff_date': cutoff_date,
+                'limit': limit
+            }
+            filters = ["a.published >= :cutoff_date"]
+            if country:
+                filters.append("a.country = :country")
+                params['country'] = country.upper()
+            if section:
+                filters.append("a.section_id = :section_id")
+                params['section_id'] = section_cache.lookup(section)
+            
+            backend = get_search_backend()
+            if backend == "postgres":
+                params['query'] = " & ".join(f"{token}:*" for token in tokens)
+                sql = text(f"""
+                    SELECT {article_columns('a')}
+                    FROM news_articles a, to_tsquery('simple', :query) q
+                    WHERE a.search_vector @@ q
+                      AND {' AND '.join(filters)}
+                    ORDER BY ts_rank_cd(a.search_vector, q) DESC, a.published DESC
+                    LIMIT :limit
+                """)
+            elif backend == "fts5":
+                params['query'] = " ".join(f'"{token}"*' for token in tokens)
+                sql = text(f"""
+                    SELECT {article_columns('a')}
+                    FROM news_articles_fts f
+                    JOIN news_articles_fts_ids m ON m.rowid = f.rowid
+                    JOIN news_articles a ON a.id = m.article_id
+                    WHERE news_articles_fts MATCH :query
+                      AND {' AND '.join(filters)}
+                    ORDER BY bm25(news_articles_fts), a.published DESC
+                    LIMIT :limit
+                """)
+            else:
+                for i, token in enumerate(tokens):
+                    params[f'token_{i}'] = f"%{token}%"
+                    filters.append(f"(LOWER(a.title) LIKE :token_{i} OR LOWER(a.summary) LIKE :token_{i})")
+                sql = text(f"""
+                    SELECT {article_columns('a')}
+                    FROM news_articles a
+                    WHERE {' AND '.join(filters)}
+                    ORDER BY a.published DESC
+                    LIMIT :limit
+                """)
+            
+            result = self.db.execute(sql, params)
+            return articles_from_rows(result)
+        except Exception as e:
+            logger.error(f"Error searching news for '{query}': {e}")
+            raise
+    
+    def get_article_by_url(self, url: str) -> Optional[Article]:
+        """URL로 기사를 조회합니다. (저장 전 중복 확인용, 같은 배치의 미커밋 행도 보이도록 주 DB 조회)"""
+        try:
+            query = text(f"""
+                SELECT {ARTICLE_COLUMNS}
                 FROM news_articles 
                 WHERE url = :url
                 LIMIT 1
@@ -322,52 +506,41 @@ class NewsRepository:
             result = self.db.execute(query, {'url': url})
             row = result.fetchone()
             
-            if row:
-                return {
-                    'id': row.id,
-                    'title': row.title,
-                    'url': row.url,
-                    'source': row.source,
-                    'published': row.published,
-                    'summary': row.summary,
-                    'section': row.section,
-                    'country': row.country,
-                    'created_at': row.created_at
-                }
-            return None
+            return article_from_row(row) if row else None
         except Exception as e:
             logger.error(f"Error getting article by URL {url}: {e}")
             raise
     
-    def save_article(self, article_data: Dict[str, Any]) -> bool:
-        """기사를 데이터베이스에 저장합니다."""
+    def save_article(self, article: Article, simhash: Optional[int] = None, section_from_feed: Optional[bool] = None) -> bool:
+        """기사를 데이터베이스에 저장합니다. (section_from_feed: 섹션 피드가 섹션을 정했는지, 모르면 None)"""
         try:
             # 기존 기사 확인
-            existing = self.get_article_by_url(article_data['url'])
+            existing = self.get_article_by_url(article.url)
             if existing:
                 return False  # 이미 존재
             
             # 새 기사 저장
             query = text("""
-                INSERT INTO news_articles (id, title, url, source, published, summary, section, country, created_at)
-                VALUES (:id, :title, :url, :source, :published, :summary, :section, :country, :created_at)
+                INSERT INTO news_articles (id, title, url, source_id, published, summary, section_id, country, created_at, cluster_id, analysis_text, simhash, section_from_feed)
+                VALUES (:id, :title, :url, :source_id, :published, :summary, :section_id, :country, :created_at, :cluster_id, :analysis_text, :simhash, :section_from_feed)
             """)
             
-            self.db.execute(query, {
-                'id': article_data['id'],
-                'title': article_data['title'],
-                'url': article_data['url'],
-                'source': article_data['source'],
-                'published': article_data['published'],
-                'summary': article_data['summary'],
-                'section': article_data.get('section', 'general'),
-                'country': article_data['country'],
-                'created_at': datetime.now()
-            })
+            params = article._asdict()
+            params['section'] = article.section or 'general'
+            params['source_id'] = source_cache.intern(self.db, article.source)
+            params['section_id'] = section_cache.intern(self.db, params['section'])
+            params['published'] = to_storage_utc(article.published)
+            params['created_at'] = to_storage_utc(utc_now())
+            params['analysis_text'] = format_analysis_text(
+                article.title, article.source, article.summary, params['section'], article.country
+            )
+            params['simhash'] = simhash
+            params['section_from_feed'] = None if section_from_feed is None else int(section_from_feed)
+            self.db.execute(query, params)
             
             return True
         except Exception as e:
-            logger.error(f"Error saving article {article_data.get('url', 'unknown')}: {e}")
+            logger.error(f"Error saving article {article.url or 'unknown'}: {e}")
             raise
     
     def commit(self):
@@ -376,9 +549,12 @@ class NewsRepository:
             self.db.commit()
         except Exception as e:
             self.db.rollback()
+            # 롤백된 트랜잭션에서 새로 만든 출처/섹션 ID가 캐시에 남지 않도록
+            clear_dimension_caches()
             logger.error(f"Database commit failed: {e}")
             raise
     
+    @replica_read
     def get_news_count_by_country(self, country: str, days: int = 1) -> int:
         """국가별 뉴스 개수를 조회합니다."""
         try:
@@ -396,7 +572,7 @@ class NewsRepository:
                 })
             else:
                 # SQLite용 Raw SQL
-                cutoff_date = datetime.now() - timedelta(days=days)
+                cutoff_date = utc_cutoff(days)
                 query = text("""
                     SELECT COUNT(*) as count
                     FROM news_articles 
@@ -0,0 +1,75 @@
+# app/repositories/refresh_run_repository.py
+import json
+import logging
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+RUN_SUMMARY_COLUMNS = "id, started_at, finished_at, duration_ms, total_feeds, failed_feeds, fetched_entries, new_articles"
+
+@instrument_repository
+class RefreshRunRepository:
+    """피드 새로고침 실행 기록(refresh_runs) 데이터 접근 Repository"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def save_run(self, report: Dict[str, Any]) -> int:
+        """새로고침 리포트를 저장하고 실행 ID를 반환합니다."""
+        try:
+            query = text("""
+                INSERT INTO refresh_runs (started_at, finished_at, duration_ms, total_feeds, failed_feeds, fetched_entries, new_articles, report)
+                VALUES (:started_at, :finished_at, :duration_ms, :total_feeds, :failed_feeds, :fetched_entries, :new_articles, :report)
+                RETURNING id
+            """)
+            run_id = self.db.execute(query, {
+                'started_at': report['started_at'],
+                'finished_at': report['finished_at'],
+                'duration_ms': report['duration_ms'],
+                'total_feeds': report['total_feeds'],
+                'failed_feeds': report['failed_feeds'],
+                'fetched_entries': report['fetched_entries'],
+                'new_articles': report['new_articles'],
+                'report': json.dumps(report, ensure_ascii=False, default=str)
+            }).scalar()
+            self.db.commit()
+            return run_id
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error saving refresh run: {e}")
+            raise
+    
+    def get_recent_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 실행 요약 목록 (피드별 상세 제외)"""
+        try:
+            query = text(f"""
+                SELECT {RUN_SUMMARY_COLUMNS}
+                FROM refresh_runs
+                ORDER BY started_at DESC
+                LIMIT :limit
+            """)
+            return [dict(row._mapping) for row in self.db.execute(query, {'limit': limit})]
+        except Exception as e:
+            logger.error(f"Error getting refresh runs: {e}")
+            raise
+    
+    def get_run(self, run_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """실행 리포트 전체를 조회합니다. (run_id가 없으면 가장 최근 실행)"""
+        try:
+            if run_id is None:
+                query = text("SELECT id, report FROM refresh_runs ORDER BY started_at DESC LIMIT 1")
+                row = self.db.execute(query).fetchone()
+            else:
+                query = text("SELECT id, report FROM refresh_runs WHERE id = :id")
+                row = self.db.execute(query, {'id': run_id}).fetchone()
+            
+            if not row:
+                return None
+            return {'id': row.id, **json.loads(row.report)}
+        except Exception as e:
+            logger.error(f"Error getting refresh run {run_id}: {e}")
+            raise
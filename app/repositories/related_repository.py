@@ -0,0 +1,112 @@
+# app/repositories/related_repository.py
+import logging
+from typing import Any, Dict, List, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, text
+
+from app.article import Article, article_columns, article_from_row
+from app.database import replica_read
+from app.metrics import instrument_repository
+from app.repositories.chunks import in_chunks
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class RelatedRepository:
+    """기사별 관련 기사 목록(article_neighbors) 데이터 접근 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_window_articles(self, country: str, cutoff) -> List[Any]:
+        """유사도 계산 대상 기사 ID와 사건 ID (본문은 캐시에 없는 기사만 get_documents로 조회)"""
+        query = text("""
+            SELECT id, COALESCE(cluster_id, id) AS story_id
+            FROM news_articles
+            WHERE country = :country AND published >= :cutoff
+            ORDER BY published DESC
+        """)
+        return self.db.execute(query, {'country': country, 'cutoff': cutoff}).fetchall()
+
+    def get_documents(self, article_ids: List[str]) -> List[Any]:
+        """벡터화할 기사 본문 (ID, 제목, 요약, 출처)"""
+        query = text("""
+            SELECT id, title, summary, source_id FROM news_articles WHERE id IN :ids
+        """).bindparams(bindparam("ids", expanding=True))
+        documents = []
+        for chunk in in_chunks(article_ids):
+            documents.extend(self.db.execute(query, {'ids': chunk}))
+        return documents
+
+    def has_neighbors(self, country: str) -> bool:
+        query = text("""
+            SELECT 1 FROM article_neighbors n JOIN news_articles a ON a.id = n.article_id
+            WHERE a.country = :country LIMIT 1
+        """)
+        return self.db.execute(query, {'country': country}).first() is not None
+
+    def get_neighbor_lists(self, article_ids: List[str]) -> Dict[str, List[Tuple[str, float]]]:
+        """저장된 관련 기사 목록 (기사 ID → [(관련 기사 ID, 점수)], 순위 순)"""
+        query = text("""
+            SELECT article_id, neighbor_id, score FROM article_neighbors
+            WHERE article_id IN :ids
+            ORDER BY article_id, rank
+        """).bindparams(bindparam("ids", expanding=True))
+        lists: Dict[str, List[Tuple[str, float]]] = {}
+        for chunk in in_chunks(article_ids):
+            for row in self.db.execute(query, {'ids': chunk}):
+                lists.setdefault(row.article_id, []).append((row.neighbor_id, row.score))
+        return lists
+
+    def replace_neighbors(self, lists: Dict[str, List[Tuple[str, float]]]) -> None:
+        """기사별 관련 기사 목록을 교체합니다."""
+        if not lists:
+            return
+        delete = text("DELETE FROM article_neighbors WHERE article_id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        )
+        for chunk in in_chunks(lists):
+            self.db.execute(delete, {'ids': chunk})
+        rows = [
+            {'article_id': article_id, 'rank': rank, 'neighbor_id': neighbor_id, 'score': score}
+            for article_id, neighbors in lists.items()
+            for rank, (neighbor_id, score) in enumerate(neighbors, start=1)
+        ]
+        if rows:
+            self.db.execute(text("""
+                INSERT INTO article_neighbors (article_id, rank, neighbor_id, score)
+                VALUES (:article_id, :rank, :neighbor_id, :score)
+            """), rows)
+
+    @replica_read
+    def get_related(self, article_id: str, limit: int) -> List[Tuple[Article, float]]:
+        """미리 계산한 관련 기사 (article_neighbors PK 범위 조회 + 기사 PK 조회)"""
+        try:
+            query = text(f"""
+                SELECT {article_columns('a')}, n.score
+                FROM article_neighbors n
+                JOIN news_articles a ON a.id = n.neighbor_id
+                WHERE n.article_id = :article_id
+                ORDER BY n.rank
+                LIMIT :limit
+            """)
+            result = self.db.execute(query, {'article_id': article_id, 'limit': limit})
+            return [(article_from_row(row), row.score) for row in result]
+        except Exception as e:
+            logger.error(f"Error getting related articles for {article_id}: {e}")
+            raise
+
+    @replica_read
+    def article_exists(self, article_id: str) -> bool:
+        query = text("SELECT 1 FROM news_articles WHERE id = :id")
+        return self.db.execute(query, {'id': article_id}).first() is not None
+
+    def commit(self):
+        """변경사항을 커밋합니다."""
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Related articles commit failed: {e}")
+            raise
@@ -0,0 +1,181 @@
+# app/repositories/story_repository.py
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, text
+
+from app.article import Article, article_columns, article_from_row
+from app.database import replica_read
+from app.metrics import instrument_repository
+from app.repositories.chunks import in_chunks
+
+logger = logging.getLogger(__name__)
+
+# top_stories.section_id: 전체 섹션 순위
+ALL_SECTIONS = 0
+
+STORY_COLUMNS = "cluster_id, country, section_id, article_id, source_count, feed_hits, article_count, last_published, story_score"
+
+
+@instrument_repository
+class StoryRepository:
+    """사건(클러스터) 점수(stories)와 미리 계산한 상위 목록(top_stories) 데이터 접근 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_article_clusters(self, article_ids: List[str]) -> Dict[str, str]:
+        """기사 ID → 사건 ID (cluster_id가 없는 예전 기사는 자기 ID)"""
+        query = text("""
+            SELECT id, COALESCE(cluster_id, id) AS story_id FROM news_articles WHERE id IN :ids
+        """).bindparams(bindparam("ids", expanding=True))
+        clusters = {}
+        for chunk in in_chunks(article_ids):
+            for row in self.db.execute(query, {'ids': chunk}):
+                clusters[row.id] = row.story_id
+        return clusters
+
+    def get_recent_cluster_ids(self, country: str, cutoff) -> List[str]:
+        """기준 시각 이후 기사가 있는 사건 ID 목록 (초기 구축용)"""
+        query = text("""
+            SELECT DISTINCT COALESCE(cluster_id, id) AS story_id
+            FROM news_articles
+            WHERE country = :country AND published >= :cutoff
+        """)
+        return [row.story_id for row in self.db.execute(query, {'country': country, 'cutoff': cutoff})]
+
+    def get_cluster_articles(self, cluster_ids: List[str]) -> List[Any]:
+        """사건별 기사 목록 (사건 ID, 기사 ID, 출처, 섹션, 발행일)"""
+        query = text("""
+            SELECT COALESCE(cluster_id, id) AS story_id, id, source_id, section_id, published
+            FROM news_articles
+            WHERE cluster_id IN :ids OR (cluster_id IS NULL AND id IN :ids)
+        """).bindparams(bindparam("ids", expanding=True))
+        rows = []
+        for chunk in in_chunks(cluster_ids):
+            rows.extend(self.db.execute(query, {'ids': chunk}).fetchall())
+        return rows
+
+    def get_story_states(self, cluster_ids: List[str]) -> Dict[str, Tuple[str, Optional[int], int]]:
+        """저장된 사건별 (국가, 섹션, feed_hits) - 섹션이 바뀐 사건을 이전 섹션 순위에서 빼고 feed_hits를 누적하기 위함"""
+        query = text("SELECT cluster_id, country, section_id, feed_hits FROM stories WHERE cluster_id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        )
+        states = {}
+        for chunk in in_chunks(cluster_ids):
+            for row in self.db.execute(query, {'ids': chunk}):
+                states[row.cluster_id] = (row.country, row.section_id, row.feed_hits)
+        return states
+
+    def has_stories(self, country: str) -> bool:
+        query = text("SELECT 1 FROM stories WHERE country = :country LIMIT 1")
+        return self.db.execute(query, {'country': country}).first() is not None
+
+    def upsert_stories(self, stories: List[Dict[str, Any]]) -> None:
+        """사건 점수를 저장합니다. (있으면 갱신)"""
+        if not stories:
+            return
+        query = text(f"""
+            INSERT INTO stories ({STORY_COLUMNS}, updated_at)
+            VALUES (:cluster_id, :country, :section_id, :article_id, :source_count, :feed_hits,
+                    :article_count, :last_published, :story_score, :updated_at)
+            ON CONFLICT (cluster_id) DO UPDATE SET
+                country = excluded.country,
+                section_id = excluded.section_id,
+                article_id = excluded.article_id,
+                source_count = excluded.source_count,
+                feed_hits = excluded.feed_hits,
+                article_count = excluded.article_count,
+                last_published = excluded.last_published,
+                story_score = excluded.story_score,
+                updated_at = excluded.updated_at
+        """)
+        self.db.execute(query, stories)
+
+    def prune_stories(self, cutoff) -> int:
+        """순위 대상 기간이 지난 사건을 삭제합니다."""
+        query = text("DELETE FROM stories WHERE last_published < :cutoff")
+        return self.db.execute(query, {'cutoff': cutoff}).rowcount
+
+    def get_ranked_stories(self, country: str, section_id: int, cutoff, limit: int) -> List[Dict[str, Any]]:
+        """stories에서 국가/섹션의 상위 사건을 직접 계산합니다. (상위 목록이 모자랄 때 재구축용)"""
+        where = "country = :country AND last_published >= :cutoff"
+        params = {'country': country, 'cutoff': cutoff, 'limit': limit}
+        if section_id != ALL_SECTIONS:
+            where += " AND section_id = :section_id"
+            params['section_id'] = section_id
+        query = text(f"""
+            SELECT {STORY_COLUMNS} FROM stories
+            WHERE {where}
+            ORDER BY story_score DESC, last_published DESC
+            LIMIT :limit
+        """)
+        return [dict(row._mapping) for row in self.db.execute(query, params)]
+
+    def get_top_entries(self, country: str, section_id: int) -> List[Dict[str, Any]]:
+        """현재 저장된 상위 목록 (갱신용)"""
+        query = text("""
+            SELECT cluster_id, article_id, story_score, last_published
+            FROM top_stories
+            WHERE country = :country AND section_id = :section_id
+            ORDER BY rank
+        """)
+        return [dict(row._mapping) for row in self.db.execute(query, {'country': country, 'section_id': section_id})]
+
+    def replace_top(self, country: str, section_id: int, entries: List[Dict[str, Any]]) -> None:
+        """국가/섹션의 상위 목록을 교체합니다."""
+        self.db.execute(
+            text("DELETE FROM top_stories WHERE country = :country AND section_id = :section_id"),
+            {'country': country, 'section_id': section_id}
+        )
+        if not entries:
+            return
+        self.db.execute(text("""
+            INSERT INTO top_stories (country, section_id, rank, cluster_id, article_id, story_score, last_published)
+            VALUES (:country, :section_id, :rank, :cluster_id, :article_id, :story_score, :last_published)
+        """), [
+            {
+                'country': country, 'section_id': section_id, 'rank': rank,
+                'cluster_id': entry['cluster_id'], 'article_id': entry['article_id'],
+                'story_score': entry['story_score'], 'last_published': entry['last_published'],
+            }
+            for rank, entry in enumerate(entries, start=1)
+        ])
+
+    @replica_read
+    def get_top_stories(self, country: str, section_id: int, limit: int) -> List[Tuple[Article, Dict[str, Any]]]:
+        """미리 계산한 상위 사건의 대표 기사와 점수 정보 (순위 PK 범위 조회 + 기사 PK 조회)"""
+        try:
+            query = text(f"""
+                SELECT {article_columns('a')},
+                       t.rank, t.story_score, s.source_count, s.feed_hits, s.article_count
+                FROM top_stories t
+                JOIN news_articles a ON a.id = t.article_id
+                LEFT JOIN stories s ON s.cluster_id = t.cluster_id
+                WHERE t.country = :country AND t.section_id = :section_id
+                ORDER BY t.rank
+                LIMIT :limit
+            """)
+            result = self.db.execute(query, {'country': country, 'section_id': section_id, 'limit': limit})
+            return [
+                (article_from_row(row), {
+                    'rank': row.rank,
+                    'story_score': row.story_score,
+                    'source_count': row.source_count,
+                    'feed_hits': row.feed_hits,
+                    'article_count': row.article_count,
+                })
+                for row in result
+            ]
+        except Exception as e:
+            logger.error(f"Error getting top stories for {country}: {e}")
+            raise
+
+    def commit(self):
+        """변경사항을 커밋합니다."""
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Story ranking commit failed: {e}")
+            raise
@@ -0,0 +1,108 @@
+# app/repositories/trend_repository.py
+import logging
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.database import engine, replica_read
+from app.metrics import instrument_repository
+from app.timeutils import to_storage_utc
+
+logger = logging.getLogger(__name__)
+
+BUCKET_COLUMNS = "country, bucket_start, bucket_hours, article_count, sketch, heavy_hitters"
+
+
+@instrument_repository
+class TrendRepository:
+    """트렌드 키워드 시간 버킷(trending_buckets) 데이터 접근 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.is_postgresql = engine.dialect.name == "postgresql"
+
+    def lock_buckets(self, country: str, buckets: Dict[datetime, int]) -> Dict[datetime, Any]:
+        """
+        갱신할 버킷 행을 (없으면 빈 행으로 만든 뒤) 잠그고 반환합니다. (bucket_start → row)
+        PostgreSQL은 FOR UPDATE로 여러 인스턴스의 동시 새로고침이 서로의 갱신을 덮어쓰지 않게 합니다.
+        """
+        if not buckets:
+            return {}
+        self.db.execute(text("""
+            INSERT INTO trending_buckets (country, bucket_start, bucket_hours, article_count)
+            VALUES (:country, :bucket_start, :bucket_hours, 0)
+            ON CONFLICT (country, bucket_start) DO NOTHING
+        """), [
+            {'country': country, 'bucket_start': start, 'bucket_hours': hours}
+            for start, hours in buckets.items()
+        ])
+        starts = sorted(buckets)
+        lock = " FOR UPDATE" if self.is_postgresql else ""
+        query = text(f"""
+            SELECT {BUCKET_COLUMNS} FROM trending_buckets
+            WHERE country = :country AND bucket_start >= :first AND bucket_start <= :last
+            ORDER BY bucket_start{lock}
+        """)
+        rows = self.db.execute(query, {'country': country, 'first': starts[0], 'last': starts[-1]})
+        # SQLite는 DATETIME을 문자열로 돌려주므로 naive UTC datetime으로 맞춰 비교
+        wanted = set(starts)
+        locked = {to_storage_utc(row.bucket_start): row for row in rows}
+        return {start: row for start, row in locked.items() if start in wanted}
+
+    def save_bucket(self, country: str, bucket_start: datetime, bucket_hours: int, article_count: int,
+                    sketch: bytes, heavy_hitters: str, updated_at: datetime) -> None:
+        query = text("""
+            UPDATE trending_buckets
+            SET bucket_hours = :bucket_hours, article_count = :article_count, sketch = :sketch,
+                heavy_hitters = :heavy_hitters, updated_at = :updated_at
+            WHERE country = :country AND bucket_start = :bucket_start
+        """)
+        self.db.execute(query, {
+            'country': country, 'bucket_start': bucket_start, 'bucket_hours': bucket_hours,
+            'article_count': article_count, 'sketch': sketch, 'heavy_hitters': heavy_hitters,
+            'updated_at': updated_at,
+        })
+
+    def get_hourly_buckets_before(self, cutoff: datetime) -> List[Any]:
+        """일 버킷으로 합칠 오래된 시간 버킷 (국가, 시작 시각 순)"""
+        query = text(f"""
+            SELECT {BUCKET_COLUMNS} FROM trending_buckets
+            WHERE bucket_hours = 1 AND bucket_start < :cutoff
+            ORDER BY country, bucket_start
+        """)
+        return self.db.execute(query, {'cutoff': cutoff}).fetchall()
+
+    def delete_bucket(self, country: str, bucket_start: datetime) -> None:
+        self.db.execute(
+            text("DELETE FROM trending_buckets WHERE country = :country AND bucket_start = :bucket_start"),
+            {'country': country, 'bucket_start': bucket_start}
+        )
+
+    def delete_buckets_before(self, cutoff: datetime) -> int:
+        """보관 기간이 지난 버킷을 삭제합니다."""
+        query = text("DELETE FROM trending_buckets WHERE bucket_start < :cutoff")
+        return self.db.execute(query, {'cutoff': cutoff}).rowcount
+
+    @replica_read
+    def get_buckets(self, country: str, since: datetime) -> List[Any]:
+        """조회 구간의 버킷 (시작 시각 순)"""
+        try:
+            query = text(f"""
+                SELECT {BUCKET_COLUMNS} FROM trending_buckets
+                WHERE country = :country AND bucket_start >= :since AND sketch IS NOT NULL
+                ORDER BY bucket_start
+            """)
+            return self.db.execute(query, {'country': country, 'since': since}).fetchall()
+        except Exception as e:
+            logger.error(f"Error getting trending buckets for {country}: {e}")
+            raise
+
+    def commit(self):
+        """변경사항을 커밋합니다."""
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Trending bucket commit failed: {e}")
+            raise
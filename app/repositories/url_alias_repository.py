@@ -0,0 +1,63 @@
+# app/repositories/url_alias_repository.py
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, text
+
+from app.metrics import instrument_repository
+from app.repositories.chunks import in_chunks
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class UrlAliasRepository:
+    """구글 뉴스 래퍼 URL → 원문 URL 캐시(url_aliases) 데이터 접근 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_aliases(self, wrapper_urls: Iterable[str]) -> Dict[str, Tuple[Optional[str], Any]]:
+        """래퍼 URL → (원문 URL 또는 None, 마지막 해석 시각)"""
+        query = text("""
+            SELECT wrapper_url, canonical_url, resolved_at FROM url_aliases WHERE wrapper_url IN :urls
+        """).bindparams(bindparam("urls", expanding=True))
+        aliases = {}
+        for chunk in in_chunks(wrapper_urls):
+            for row in self.db.execute(query, {'urls': chunk}):
+                aliases[row.wrapper_url] = (row.canonical_url, row.resolved_at)
+        return aliases
+
+    def get_stored_urls(self, urls: Iterable[str]) -> List[str]:
+        """news_articles에 이미 그대로 저장된 URL (예전 URL 그대로 저장된 기사는 ID를 바꾸지 않기 위함)"""
+        query = text("SELECT url FROM news_articles WHERE url IN :urls").bindparams(bindparam("urls", expanding=True))
+        stored = []
+        for chunk in in_chunks(urls):
+            stored.extend(row.url for row in self.db.execute(query, {'urls': chunk}))
+        return stored
+
+    def save_aliases(self, aliases: Dict[str, Optional[str]], resolved_at: datetime) -> None:
+        """해석 결과를 저장합니다. (실패는 canonical_url NULL, 있으면 갱신)"""
+        if not aliases:
+            return
+        query = text("""
+            INSERT INTO url_aliases (wrapper_url, canonical_url, resolved_at)
+            VALUES (:wrapper_url, :canonical_url, :resolved_at)
+            ON CONFLICT (wrapper_url) DO UPDATE SET
+                canonical_url = COALESCE(excluded.canonical_url, url_aliases.canonical_url),
+                resolved_at = excluded.resolved_at
+        """)
+        self.db.execute(query, [
+            {'wrapper_url': wrapper, 'canonical_url': canonical, 'resolved_at': resolved_at}
+            for wrapper, canonical in aliases.items()
+        ])
+
+    def commit(self):
+        """변경사항을 커밋합니다."""
+        try:
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"URL alias commit failed: {e}")
+            raise
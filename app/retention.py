@@ -0,0 +1,169 @@
+# app/retention.py
+"""
+뉴스 보관(retention) 및 아카이브
+
+조회 API는 최근 1~30일만 사용하므로, RETENTION_DAYS가 지난 기사는 news_articles(hot)에서
+배치 단위로 옮겨 테이블과 인덱스 크기를 일정하게 유지합니다.
+- ARCHIVE_MODE=table: news_articles_archive 테이블로 이동 (기본값)
+- ARCHIVE_MODE=jsonl: ARCHIVE_DIR 아래 월별 gzip JSONL 파일로 내보낸 뒤 삭제
+PostgreSQL 파티션 모드(ENABLE_PARTITIONING)에서는 다음 달 파티션을 미리 만들고,
+비워진 지난 월 파티션은 삭제합니다.
+"""
+import gzip
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import ENABLE_PARTITIONING, engine, ensure_monthly_partitions, month_start
+from app.dimensions import section_cache, source_cache
+from app.fragment_cache import invalidate_news_fragments
+from app.timeutils import utc_cutoff, utc_now
+
+logger = logging.getLogger(__name__)
+
+# 최근 기사(hot) 보관 기간 - 조회 API의 최대 기간(30일)보다 짧으면 안 됨
+RETENTION_DAYS = max(int(os.getenv("RETENTION_DAYS", "30")), 30)
+ARCHIVE_MODE = os.getenv("ARCHIVE_MODE", "table").lower()
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "./archive")
+RETENTION_BATCH_SIZE = 1000
+# API 요청 하나가 처리하는 최대 배치 수 (done=false면 다시 호출)
+RETENTION_MAX_BATCHES = 10
+
+# 보관 테이블/JSONL은 출처/섹션을 이름 그대로 저장 (news_articles는 차원 테이블 ID)
+ARCHIVE_COLUMNS = "id, title, url, source, published, summary, section, country, created_at, cluster_id"
+SELECT_COLUMNS = "id, title, url, source_id, published, summary, section_id, country, created_at, cluster_id"
+
+
+def _archive_record(row: Any) -> Dict[str, Any]:
+    """news_articles row → 보관용 레코드 (출처/섹션 ID를 이름으로)"""
+    record = row._asdict()
+    record['source'] = source_cache.name(record.pop('source_id'))
+    record['section'] = section_cache.name(record.pop('section_id'))
+    return record
+
+
+def _archive_to_table(db: Session, rows: List[Any]) -> None:
+    archived_at = utc_now().replace(tzinfo=None)
+    db.execute(text(f"""
+        INSERT INTO news_articles_archive ({ARCHIVE_COLUMNS}, archived_at)
+        VALUES (:id, :title, :url, :source, :published, :summary, :section, :country, :created_at, :cluster_id, :archived_at)
+        ON CONFLICT (id) DO NOTHING
+    """), [{**_archive_record(row), 'archived_at': archived_at} for row in rows])
+
+
+def _archive_to_jsonl(rows: List[Any]) -> None:
+    """발행월별 gzip JSONL 파일에 추가합니다. (gzip 멤버 이어붙이기)"""
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    by_month: Dict[str, List[str]] = {}
+    for row in rows:
+        record = _archive_record(row)
+        published = record['published']
+        month = published[:7] if isinstance(published, str) else f"{published:%Y-%m}"
+        by_month.setdefault(month, []).append(json.dumps(record, ensure_ascii=False, default=str))
+
+    for month, lines in by_month.items():
+        path = os.path.join(ARCHIVE_DIR, f"news_articles-{month}.jsonl.gz")
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def _drop_expired_partitions(db: Session, cutoff: datetime) -> List[str]:
+    """cutoff 이전 달의 비어 있는 월별 파티션을 삭제합니다."""
+    dropped = []
+    rows = db.execute(text("""
+        SELECT c.relname AS name
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = 'news_articles'
+    """)).fetchall()
+    cutoff_month = month_start(cutoff)
+    for row in rows:
+        name = row.name
+        if not name.startswith("news_articles_p"):
+            continue
+        month = datetime.strptime(name[len("news_articles_p"):], "%Y%m")
+        if month >= cutoff_month:
+            continue
+        if db.execute(text(f"SELECT 1 FROM {name} LIMIT 1")).first():
+            continue
+        db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        dropped.append(name)
+    db.commit()
+    return dropped
+
+
+def run_retention(
+    db: Session,
+    retention_days: int = RETENTION_DAYS,
+    batch_size: int = RETENTION_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """보관 기간이 지난 기사를 배치 단위로 아카이브하고 hot 테이블에서 삭제합니다."""
+    cutoff = utc_cutoff(retention_days)
+
+    if dry_run:
+        row = db.execute(text("""
+            SELECT COUNT(*) AS count FROM news_articles WHERE published < :cutoff
+        """), {'cutoff': cutoff}).fetchone()
+        return {"cutoff": cutoff, "mode": ARCHIVE_MODE, "pending_rows": row.count, "archived_rows": 0, "done": False}
+
+    select_query = text(f"""
+        SELECT {SELECT_COLUMNS}
+        FROM news_articles
+        WHERE published < :cutoff
+        ORDER BY published
+        LIMIT :batch_size
+    """)
+    delete_query = text("DELETE FROM news_articles WHERE id = :id")
+    delete_neighbors_query = text("DELETE FROM article_neighbors WHERE article_id = :id")
+
+    archived = 0
+    batches = 0
+    done = False
+    while max_batches is None or batches < max_batches:
+        rows = db.execute(select_query, {'cutoff': cutoff, 'batch_size': batch_size}).fetchall()
+        if not rows:
+            done = True
+            break
+
+        if ARCHIVE_MODE == "jsonl":
+            _archive_to_jsonl(rows)
+        else:
+            _archive_to_table(db, rows)
+        db.execute(delete_query, [{'id': row.id} for row in rows])
+        db.execute(delete_neighbors_query, [{'id': row.id} for row in rows])
+        db.commit()
+
+        batches += 1
+        archived += len(rows)
+        logger.info(f"Retention batch {batches}: archived {archived} articles older than {cutoff:%Y-%m-%d}")
+
+        if len(rows) < batch_size:
+            done = True
+            break
+
+    if archived:
+        invalidate_news_fragments()
+
+    dropped_partitions = []
+    if ENABLE_PARTITIONING and engine.dialect.name == "postgresql":
+        ensure_monthly_partitions(db, utc_now().replace(tzinfo=None))
+        db.commit()
+        if done:
+            dropped_partitions = _drop_expired_partitions(db, cutoff)
+
+    return {
+        "cutoff": cutoff,
+        "mode": ARCHIVE_MODE,
+        "archived_rows": archived,
+        "batches": batches,
+        "dropped_partitions": dropped_partitions,
+        "done": done
+    }
@@ -1,267 +1,218 @@
 # app/rss_feeds.py
 """
-RSS 피드 설정 파일
-Google News RSS(섹션별 토픽) 기반으로 일원화합니다.
-- 섹션별 토픽 코드:
-  WORLD, NATION, BUSINESS, TECHNOLOGY, ENTERTAINMENT, SPORTS, SCIENCE, HEALTH
-- 국가별 파라미터:
-  US: hl=en-US&gl=US&ceid=US:en
-  KR: hl=ko&gl=KR&ceid=KR:ko
+RSS 피드 레지스트리
+
+피드 목록은 설정 파일(app/feeds.json, FEED_REGISTRY_PATH로 변경 가능)에서 한 번만 읽고
+URL/국가/섹션/언어별 인덱스를 미리 만들어 모든 조회를 dict 한 번으로 처리합니다.
+- countries: 국가 코드별 언어, 표시 시간대, 구글 뉴스 에디션 파라미터
+  (구글 뉴스 에디션이 있으면 종합 피드 + sections의 토픽 피드를 자동 생성,
+  토픽 피드 설명은 google_news.section_descriptions로 국가 언어에 맞게 지정 가능)
+- sections: 구글 토픽 코드와 수집 시 기사에 붙일 섹션(collect_as, null이면 수집하지 않음)
+  사용 가능한 토픽: WORLD, NATION, BUSINESS, TECHNOLOGY, ENTERTAINMENT, SPORTS, SCIENCE, HEALTH
+- feeds: 구글 뉴스 외 피드 (id, name, url, country, category, section, language, description)
+- collection_order: 섹션 피드 수집 순서 (섹션 이름). 여러 피드에 실린 기사는 먼저 수집한 피드의 섹션으로
+  저장되므로 순서가 곧 섹션 우선순위입니다. (목록에 없는 섹션은 그 뒤, 종합 피드는 마지막)
+국가나 피드를 추가할 때는 설정 파일만 바꾸면 됩니다.
 - 참고: 섹션 URL은 리다이렉트가 발생할 수 있으므로 클라이언트에서 follow_redirects 권장(curl -L 등)
 """
 
-from typing import List, Dict, Optional
+import json
+import logging
+import os
+from typing import Any, Dict, List, NamedTuple, Optional
 
-# 공통 URL 빌더
-def _topic_url(topic: str, country: str) -> str:
-    country = country.upper()
-    if country == "US":
-        return f"https://news.google.com/rss/headlines/section/topic/{topic}?hl=en-US&gl=US&ceid=US:en"
-    elif country == "KR":
-        return f"https://news.google.com/rss/headlines/section/topic/{topic}?hl=ko&gl=KR&ceid=KR:ko"
-    else:
-        raise ValueError(f"Unsupported country: {country}")
-
-# ── 국가별 일반(종합) 피드 ───────────────────────────────────────────────
-US_FEEDS: Dict[str, Dict] = {
-    "Google": {
-        "name": "Google News",
-        "url": "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en",
-        "category": "general",
-        "language": "en",
-        "description": "Google News Top stories (US)"
-    }
-}
-
-KR_FEEDS: Dict[str, Dict] = {
-    "Google": {
-        "name": "Google News Korea",
-        "url": "https://news.google.com/rss?hl=ko&gl=KR&ceid=KR:ko",
-        "category": "general",
-        "language": "ko",
-        "description": "Google News 주요 뉴스 (한국)"
-    }
-}
-
-# ── 섹션별 피드(토픽 코드 기반) ──────────────────────────────────────────
-# 사용 가능한 토픽: WORLD, NATION, BUSINESS, TECHNOLOGY, ENTERTAINMENT, SPORTS, SCIENCE, HEALTH
-SECTION_FEEDS: Dict[str, Dict[str, Dict[str, Dict]]] = {
-    "world": {
-        "us": {
-            "google_world_us": {
-                "name": "Google News World (US)",
-                "url": _topic_url("WORLD", "US"),
-                "category": "world",
-                "language": "en",
-                "description": "World news (US edition)"
-            }
-        },
-        "kr": {
-            "google_world_kr": {
-                "name": "Google News World (KR)",
-                "url": _topic_url("WORLD", "KR"),
-                "category": "world",
-                "language": "ko",
-                "description": "세계 뉴스 (한국 에디션)"
-            }
-        }
-    },
-    "nation": {  # 국내/정치 포함 개념(구글 토픽명은 NATION)
-        "us": {
-            "google_nation_us": {
-                "name": "Google News Nation (US)",
-                "url": _topic_url("NATION", "US"),
-                "category": "nation",
-                "language": "en",
-                "description": "US nation news"
-            }
-        },
-        "kr": {
-            "google_nation_kr": {
-                "name": "Google News Nation (KR)",
-                "url": _topic_url("NATION", "KR"),
-                "category": "nation",
-                "language": "ko",
-                "description": "국내 뉴스 (한국 에디션)"
-            }
-        }
-    },
-    "business": {
-        "us": {
-            "google_business_us": {
-                "name": "Google News Business (US)",
-                "url": _topic_url("BUSINESS", "US"),
-                "category": "business",
-                "language": "en",
-                "description": "Business news (US edition)"
-            }
-        },
-        "kr": {
-            "google_business_kr": {
-                "name": "Google News Business (KR)",
-                "url": _topic_url("BUSINESS", "KR"),
-                "category": "business",
-                "language": "ko",
-                "description": "경제 뉴스 (한국 에디션)"
-            }
-        }
-    },
-    "technology": {
-        "us": {
-            "google_tech_us": {
-                "name": "Google News Technology (US)",
-                "url": _topic_url("TECHNOLOGY", "US"),
-                "category": "technology",
-                "language": "en",
-                "description": "Technology news (US edition)"
-            }
-        },
-        "kr": {
-            "google_tech_kr": {
-                "name": "Google News Technology (KR)",
-                "url": _topic_url("TECHNOLOGY", "KR"),
-                "category": "technology",
-                "language": "ko",
-                "description": "기술/IT 뉴스 (한국 에디션)"
-            }
-        }
-    },
-    "entertainment": {
-        "us": {
-            "google_ent_us": {
-                "name": "Google News Entertainment (US)",
-                "url": _topic_url("ENTERTAINMENT", "US"),
-                "category": "entertainment",
-                "language": "en",
-                "description": "Entertainment news (US edition)"
-            }
-        },
-        "kr": {
-            "google_ent_kr": {
-                "name": "Google News Entertainment (KR)",
-                "url": _topic_url("ENTERTAINMENT", "KR"),
-                "category": "entertainment",
-                "language": "ko",
-                "description": "연예 뉴스 (한국 에디션)"
-            }
-        }
-    },
-    "sports": {
-        "us": {
-            "google_sports_us": {
-                "name": "Google News Sports (US)",
-                "url": _topic_url("SPORTS", "US"),
-                "category": "sports",
-                "language": "en",
-                "description": "Sports news (US edition)"
-            }
-        },
-        "kr": {
-            "google_sports_kr": {
-                "name": "Google News Sports (KR)",
-                "url": _topic_url("SPORTS", "KR"),
-                "category": "sports",
-                "language": "ko",
-                "description": "스포츠 뉴스 (한국 에디션)"
-            }
-        }
-    },
-    "science": {
-        "us": {
-            "google_science_us": {
-                "name": "Google News Science (US)",
-                "url": _topic_url("SCIENCE", "US"),
-                "category": "science",
-                "language": "en",
-                "description": "Science news (US edition)"
-            }
-        },
-        "kr": {
-            "google_science_kr": {
-                "name": "Google News Science (KR)",
-                "url": _topic_url("SCIENCE", "KR"),
-                "category": "science",
-                "language": "ko",
-                "description": "과학 뉴스 (한국 에디션)"
-            }
+from app.timeutils import register_country_timezone
+
+logger = logging.getLogger(__name__)
+
+# 구글 뉴스 주소 (부하 테스트/벤치마크에서는 로컬 대역 서버로 교체)
+GOOGLE_NEWS_BASE_URL = os.getenv("GOOGLE_NEWS_BASE_URL", "https://news.google.com").rstrip("/")
+
+FEED_REGISTRY_PATH = os.getenv(
+    "FEED_REGISTRY_PATH", os.path.join(os.path.dirname(__file__), "feeds.json")
+)
+
+
+class FeedConfig(NamedTuple):
+    """피드 하나의 설정 (category: 피드 분류, section: 수집 시 기사에 붙일 섹션, None이면 키워드 분류)"""
+    id: str
+    name: str
+    url: str
+    country: str
+    category: str
+    section: Optional[str]
+    language: str
+    description: str = ""
+    collect: bool = True
+
+    def info(self) -> Dict[str, Any]:
+        """API 응답/조회용 피드 정보"""
+        return {
+            "name": self.name,
+            "url": self.url,
+            "category": self.category,
+            "language": self.language,
+            "description": self.description,
         }
-    },
-    "health": {
-        "us": {
-            "google_health_us": {
-                "name": "Google News Health (US)",
-                "url": _topic_url("HEALTH", "US"),
-                "category": "health",
-                "language": "en",
-                "description": "Health news (US edition)"
-            }
-        },
-        "kr": {
-            "google_health_kr": {
-                "name": "Google News Health (KR)",
-                "url": _topic_url("HEALTH", "KR"),
-                "category": "health",
-                "language": "ko",
-                "description": "건강 뉴스 (한국 에디션)"
-            }
+
+
+class FeedRegistry:
+    """설정에서 만든 피드 목록과 URL/국가/섹션/언어별 인덱스"""
+
+    def __init__(self, feeds: List[FeedConfig], countries: Dict[str, Dict[str, Any]],
+                 collection_order: Optional[List[str]] = None):
+        self.feeds = feeds
+        self.countries = countries
+        self.by_url: Dict[str, FeedConfig] = {}
+        self.by_country: Dict[str, List[FeedConfig]] = {code: [] for code in countries}
+        self.by_category: Dict[str, List[FeedConfig]] = {}
+        self.by_country_category: Dict[tuple, List[FeedConfig]] = {}
+        self.by_language: Dict[str, List[FeedConfig]] = {}
+        self.general_by_country: Dict[str, List[FeedConfig]] = {code: [] for code in countries}
+
+        for feed in feeds:
+            if feed.url in self.by_url:
+                logger.warning(f"Duplicate feed URL ignored: {feed.url}")
+                continue
+            self.by_url[feed.url] = feed
+            self.by_country.setdefault(feed.country, []).append(feed)
+            self.by_category.setdefault(feed.category, []).append(feed)
+            self.by_country_category.setdefault((feed.country, feed.category), []).append(feed)
+            self.by_language.setdefault(feed.language, []).append(feed)
+            if feed.category == "general":
+                self.general_by_country.setdefault(feed.country, []).append(feed)
+
+        # 수집 순서: 섹션 피드(collection_order 순) 먼저, 종합 피드는 마지막에 분류
+        priority = {section: i for i, section in enumerate(collection_order or [])}
+        self.collection_by_country: Dict[str, List[FeedConfig]] = {
+            code: sorted(
+                (f for f in feeds if f.collect),
+                key=lambda f: (f.section is None, priority.get(f.section, len(priority)))
+            )
+            for code, feeds in self.by_country.items()
         }
-    },
-}
 
-def get_feeds_by_country(country: str) -> List[str]:
-    """국가별 RSS 피드 URL 목록을 반환합니다."""
-    c = country.upper()
-    if c == 'US':
-        return [feed["url"] for feed in US_FEEDS.values()]
-    elif c == 'KR':
-        return [feed["url"] for feed in KR_FEEDS.values()]
-    else:
+    def has_country(self, country: str) -> bool:
+        return bool(country) and country.upper() in self.countries
+
+
+def _google_news_feeds(config: Dict[str, Any], code: str, country: Dict[str, Any]) -> List[FeedConfig]:
+    """국가의 구글 뉴스 에디션으로 종합 피드와 섹션별 토픽 피드를 생성합니다."""
+    google = country.get("google_news")
+    if not google:
         return []
+    templates = config["google_news"]
+    edition = google["edition"]
+    descriptions = google.get("section_descriptions", {})
+    language = country.get("language", "en")
+    suffix = code.lower()
+
+    feeds = [FeedConfig(
+        id=google.get("general_id", f"google_{suffix}"),
+        name=google.get("general_name", f"Google News ({code})"),
+        url=templates["general_url"].format(base_url=GOOGLE_NEWS_BASE_URL, edition=edition),
+        country=code,
+        category="general",
+        section=None,
+        language=language,
+        description=google.get("general_description", f"Google News Top stories ({code})"),
+    )]
+    for category, section in config.get("sections", {}).items():
+        feeds.append(FeedConfig(
+            id=f"google_{section.get('id', category)}_{suffix}",
+            name=f"Google News {section.get('label', category.title())} ({code})",
+            url=templates["topic_url"].format(base_url=GOOGLE_NEWS_BASE_URL, topic=section["topic"], edition=edition),
+            country=code,
+            category=category,
+            section=section.get("collect_as"),
+            language=language,
+            description=descriptions.get(category, f"{section.get('label', category.title())} news ({code} edition)"),
+            collect=section.get("collect_as") is not None,
+        ))
+    return feeds
+
+
+def load_feed_registry(path: str = FEED_REGISTRY_PATH) -> FeedRegistry:
+    """설정 파일을 읽어 피드 레지스트리를 만들고 국가별 표시 시간대를 등록합니다."""
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+
+    countries = {code.upper(): country for code, country in config.get("countries", {}).items()}
+    feeds: List[FeedConfig] = []
+    for code, country in countries.items():
+        if country.get("timezone"):
+            register_country_timezone(code, country["timezone"], country.get("timezone_label", code))
+        feeds.extend(_google_news_feeds(config, code, country))
+
+    for entry in config.get("feeds", []):
+        code = entry["country"].upper()
+        if code not in countries:
+            raise ValueError(f"Feed {entry.get('id')} references unknown country: {code}")
+        feeds.append(FeedConfig(
+            id=entry["id"],
+            name=entry.get("name", entry["id"]),
+            url=entry["url"],
+            country=code,
+            category=entry.get("category", "general"),
+            section=entry.get("section"),
+            language=entry.get("language", countries[code].get("language", "en")),
+            description=entry.get("description", ""),
+            collect=entry.get("collect", True),
+        ))
+
+    registry = FeedRegistry(feeds, countries, config.get("collection_order"))
+    logger.debug(f"Loaded {len(registry.by_url)} feeds for {len(countries)} countries from {path}")
+    return registry
+
+
+# 전역 인스턴스 (import 시 한 번 로드)
+feed_registry = load_feed_registry()
+
+
+def get_countries() -> List[str]:
+    """지원하는 국가 코드 목록 (설정 순서)"""
+    return list(feed_registry.countries)
+
+
+def get_feeds_by_country(country: str) -> List[str]:
+    """국가별 종합 RSS 피드 URL 목록을 반환합니다."""
+    return [feed.url for feed in feed_registry.general_by_country.get(country.upper(), [])]
 
 def get_feeds_by_section(section: str, country: Optional[str] = None) -> List[str]:
-    """섹션별 RSS 피드 URL 목록을 반환합니다."""
+    """섹션(피드 분류)별 RSS 피드 URL 목록을 반환합니다."""
     key = section.lower()
-    if key not in SECTION_FEEDS:
-        return []
-
     if country:
-        c_key = country.lower()  # <-- 대소문자 혼용 버그 수정
-        if c_key in SECTION_FEEDS[key]:
-            return [feed["url"] for feed in SECTION_FEEDS[key][c_key].values()]
-        else:
-            return []
+        feeds = feed_registry.by_country_category.get((country.upper(), key), [])
     else:
-        # 모든 국가의 해당 섹션 피드 반환
-        urls: List[str] = []
-        for country_feeds in SECTION_FEEDS[key].values():
-            urls.extend([feed["url"] for feed in country_feeds.values()])
-        return urls
+        feeds = feed_registry.by_category.get(key, [])
+    return [feed.url for feed in feeds]
+
+def get_feeds_by_language(language: str) -> List[str]:
+    """언어별 RSS 피드 URL 목록을 반환합니다."""
+    return [feed.url for feed in feed_registry.by_language.get(language.lower(), [])]
+
+def get_collection_feeds(country: str) -> List[FeedConfig]:
+    """수집할 국가별 피드 설정 목록 (섹션 피드 → 종합 피드 순)"""
+    return feed_registry.collection_by_country.get(country.upper(), [])
 
 def get_all_feeds() -> Dict[str, Dict]:
-    """모든 RSS 피드 정보를 반환합니다."""
-    return {
-        "us": US_FEEDS,
-        "kr": KR_FEEDS,
-        "sections": SECTION_FEEDS
-    }
+    """모든 RSS 피드 정보를 반환합니다. (국가 코드 소문자별 종합 피드 + 섹션별 피드)"""
+    result: Dict[str, Dict] = {code.lower(): {} for code in feed_registry.countries}
+    sections: Dict[str, Dict[str, Dict]] = {}
+    for feed in feed_registry.by_url.values():
+        if feed.category == "general":
+            result[feed.country.lower()][feed.id] = feed.info()
+        else:
+            sections.setdefault(feed.category, {}).setdefault(feed.country.lower(), {})[feed.id] = feed.info()
+    result["sections"] = sections
+    return result
 
 def get_feed_info(url: str) -> Optional[Dict]:
     """URL로 피드 정보를 찾아 반환합니다."""
-    # US 피드에서 검색
-    for feed_id, feed_info in US_FEEDS.items():
-        if feed_info["url"] == url:
-            return {"id": feed_id, "country": "US", **feed_info}
-
-    # KR 피드에서 검색
-    for feed_id, feed_info in KR_FEEDS.items():
-        if feed_info["url"] == url:
-            return {"id": feed_id, "country": "KR", **feed_info}
-
-    # 섹션 피드에서 검색
-    for section, countries in SECTION_FEEDS.items():
-        for country, feeds in countries.items():
-            for feed_id, feed_info in feeds.items():
-                if feed_info["url"] == url:
-                    return {"id": feed_id, "country": country.upper(), "section": section, **feed_info}
-
-    return None
+    feed = feed_registry.by_url.get(url)
+    if feed is None:
+        return None
+    info = {"id": feed.id, "country": feed.country, **feed.info()}
+    if feed.category != "general":
+        info["section"] = feed.category
+    return info
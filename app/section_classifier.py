@@ -0,0 +1,199 @@
+# app/section_classifier.py
+"""
+학습한 섹션 분류 모델 (다항 나이브 베이즈, 해시 특징)
+
+종합 피드 기사의 섹션을 키워드 투표(classify_news_section) 대신 모델로 정합니다.
+- 학습 데이터: 섹션 피드에서 수집해 피드가 섹션을 정해 준 기사 (news_articles.section_from_feed = 1)
+- 특징: app/text_features의 해시 특징 개수 (영어 단어, 한국어 문자 n-gram) - 어휘 사전 없이 한 모델이 두 언어를 처리
+- 학습: 새로고침이 끝날 때 모델이 없거나 CLASSIFIER_RETRAIN_HOURS보다 오래됐으면 최근 CLASSIFIER_TRAINING_DAYS일로 다시 학습해
+  section_models에 저장합니다. 마지막 CLASSIFIER_HOLDOUT_RATIO는 시간순 검증용으로 먼저 빼서 정확도를 기록합니다.
+- 추론: 국가별 새로고침의 섹션 없는 기사 전체를 (기사 × 특징) 희소 행렬 하나로 만들어 행렬 곱 한 번으로 분류합니다.
+  모델이 없거나(학습 데이터 부족, numpy 없음) 확률이 CLASSIFIER_MIN_CONFIDENCE 미만이면 None을 돌려주고,
+  호출하는 쪽(news_service)이 키워드 분류로 대신합니다.
+모델은 프로세스별로 캐시하고, 새로고침마다 trained_at만 조회해 다른 인스턴스가 새로 학습한 모델을 불러옵니다.
+"""
+import io
+import json
+import logging
+import os
+import threading
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.dimensions import section_cache, source_cache
+from app.repositories.classifier_repository import ClassifierRepository
+from app.text_features import FEATURE_HASH_DIM, VECTORS_AVAILABLE, SparseRows, article_tokens, hash_features, np
+from app.timeutils import to_utc, utc_cutoff, utc_now
+
+logger = logging.getLogger(__name__)
+
+CLASSIFIER_TRAINING_DAYS = float(os.getenv("CLASSIFIER_TRAINING_DAYS", "30"))
+CLASSIFIER_MIN_TRAINING_ROWS = int(os.getenv("CLASSIFIER_MIN_TRAINING_ROWS", "300"))
+CLASSIFIER_RETRAIN_HOURS = float(os.getenv("CLASSIFIER_RETRAIN_HOURS", "24"))
+CLASSIFIER_MIN_CONFIDENCE = float(os.getenv("CLASSIFIER_MIN_CONFIDENCE", "0.5"))  # 이보다 낮으면 키워드 분류
+CLASSIFIER_ALPHA = float(os.getenv("CLASSIFIER_ALPHA", "0.1"))                    # 라플라스 평활
+CLASSIFIER_HOLDOUT_RATIO = 0.1
+
+MODEL_NAME = "section_nb"
+
+
+class NaiveBayesModel:
+    """다항 나이브 베이즈 - 클래스별 특징 개수만 저장하고 로그 확률은 불러올 때 계산"""
+
+    def __init__(self, labels: List[str], class_counts, class_docs, alpha: float = CLASSIFIER_ALPHA):
+        self.labels = list(labels)
+        self.class_counts = np.asarray(class_counts, dtype=np.float64)  # 클래스 × 특징
+        self.class_docs = np.asarray(class_docs, dtype=np.float64)
+        self.alpha = alpha
+        totals = self.class_counts.sum(axis=1) + alpha * self.class_counts.shape[1]
+        # 특징 × 클래스 로그 확률 (본 적 없는 특징은 평활값)
+        self.feature_log_prob = np.log((self.class_counts.T + alpha) / totals).astype(np.float32)
+        self.log_prior = np.log(self.class_docs / self.class_docs.sum()).astype(np.float32)
+
+    @classmethod
+    def fit(cls, features: SparseRows, targets: Sequence[int], labels: List[str],
+            alpha: float = CLASSIFIER_ALPHA) -> "NaiveBayesModel":
+        targets = np.asarray(targets)
+        counts = SparseRows.from_entries(
+            targets[features.row_ids()], features.indices, features.data, len(labels), features.n_cols
+        )
+        class_counts = np.zeros((len(labels), features.n_cols))
+        class_counts[counts.row_ids(), counts.indices] = counts.data
+        return cls(labels, class_counts, np.bincount(targets, minlength=len(labels)), alpha)
+
+    def predict_proba(self, features: SparseRows):
+        """기사 × 클래스 사후 확률 (행렬 곱 한 번)"""
+        joint = features.dot_dense(self.feature_log_prob) + self.log_prior
+        joint -= joint.max(axis=1, keepdims=True)
+        proba = np.exp(joint)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def to_bytes(self) -> bytes:
+        """클래스별 0이 아닌 특징 개수만 CSR 배열로 저장"""
+        rows, cols = np.nonzero(self.class_counts)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(self.labels)))))
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer, data=self.class_counts[rows, cols].astype(np.float32), indices=cols.astype(np.int32), indptr=indptr,
+            shape=np.array(self.class_counts.shape), class_docs=self.class_docs,
+            labels=np.array(self.labels), alpha=np.array(self.alpha)
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "NaiveBayesModel":
+        stored = np.load(io.BytesIO(blob), allow_pickle=False)
+        shape = tuple(int(n) for n in stored["shape"])
+        if shape[1] != FEATURE_HASH_DIM:
+            raise ValueError(f"model feature dimension {shape[1]} != FEATURE_HASH_DIM {FEATURE_HASH_DIM}")
+        counts = SparseRows(stored["indptr"], stored["indices"], stored["data"], shape[1])
+        class_counts = np.zeros(shape)
+        class_counts[counts.row_ids(), counts.indices] = counts.data
+        return cls([str(label) for label in stored["labels"]], class_counts, stored["class_docs"], float(stored["alpha"]))
+
+
+class ModelCache:
+    """프로세스별 모델 캐시 (trained_at이 바뀌었을 때만 본문을 다시 읽음)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._model: Optional[NaiveBayesModel] = None
+        self._trained_at = None
+
+    def get(self, db: Session) -> Optional[NaiveBayesModel]:
+        repo = ClassifierRepository(db)
+        trained_at = repo.get_trained_at(MODEL_NAME)
+        if trained_at is None:
+            return None
+        trained_at = to_utc(trained_at)
+        with self._lock:
+            if trained_at == self._trained_at:
+                return self._model
+        row = repo.get_model(MODEL_NAME)
+        model = NaiveBayesModel.from_bytes(row.model)
+        self.put(model, to_utc(row.trained_at))
+        return model
+
+    def put(self, model: NaiveBayesModel, trained_at) -> None:
+        with self._lock:
+            self._model = model
+            self._trained_at = trained_at
+
+
+# 전역 인스턴스
+model_cache = ModelCache()
+
+
+def featurize(items: Sequence[Tuple[str, Optional[str], Optional[str]]]):
+    """(제목, 요약, 출처) 목록 → 기사 × 특징 개수 행렬"""
+    return hash_features(article_tokens(title, summary, source) for title, summary, source in items)
+
+
+def predict_sections(db: Session, items: Sequence[Tuple[str, Optional[str], Optional[str]]]) -> List[Optional[str]]:
+    """
+    (제목, 요약, 출처) 목록의 섹션을 한 번에 예측합니다.
+    모델이 없거나 확신도가 CLASSIFIER_MIN_CONFIDENCE 미만인 항목은 None (호출하는 쪽에서 키워드 분류)
+    """
+    if not items or not VECTORS_AVAILABLE:
+        return [None] * len(items)
+    try:
+        model = model_cache.get(db)
+    except Exception as e:
+        logger.error(f"Error loading section model: {e}")
+        model = None
+    if model is None:
+        return [None] * len(items)
+
+    proba = model.predict_proba(featurize(items))
+    best = proba.argmax(axis=1)
+    confidence = proba[np.arange(len(items)), best]
+    return [
+        model.labels[label] if score >= CLASSIFIER_MIN_CONFIDENCE else None
+        for label, score in zip(best, confidence)
+    ]
+
+
+def train_section_model(db: Session, force: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    라벨이 있는 최근 기사로 모델을 학습해 저장합니다. (학습 지표 반환)
+    모델이 CLASSIFIER_RETRAIN_HOURS 안에 학습됐거나 학습 데이터가 모자라면 건너뛰고 None을 반환합니다.
+    """
+    if not VECTORS_AVAILABLE:
+        return None
+    repo = ClassifierRepository(db)
+    now = utc_now()
+    trained_at = repo.get_trained_at(MODEL_NAME)
+    if not force and trained_at is not None and now - to_utc(trained_at) < timedelta(hours=CLASSIFIER_RETRAIN_HOURS):
+        return None
+
+    rows = repo.get_training_rows(utc_cutoff(CLASSIFIER_TRAINING_DAYS))
+    if len(rows) < CLASSIFIER_MIN_TRAINING_ROWS:
+        logger.info(f"Skipping section model training: {len(rows)} labelled articles (< {CLASSIFIER_MIN_TRAINING_ROWS})")
+        return None
+
+    names = [section_cache.name(row.section_id) for row in rows]
+    labels = sorted(set(names))
+    label_index = {label: i for i, label in enumerate(labels)}
+    targets = np.array([label_index[name] for name in names])
+    features = featurize([(row.title, row.summary, source_cache.name(row.source_id)) for row in rows])
+
+    # 시간순 검증: 가장 최근 기사로 정확도 측정 후 전체로 다시 학습
+    split = int(len(rows) * (1 - CLASSIFIER_HOLDOUT_RATIO))
+    holdout = NaiveBayesModel.fit(features.take(range(split)), targets[:split], labels)
+    predicted = holdout.predict_proba(features.take(range(split, len(rows)))).argmax(axis=1)
+    model = NaiveBayesModel.fit(features, targets, labels)
+
+    metrics = {
+        'rows': len(rows),
+        'holdout_rows': len(rows) - split,
+        'holdout_accuracy': round(float((predicted == targets[split:]).mean()), 4) if split < len(rows) else None,
+        'labels': {label: int(count) for label, count in zip(labels, model.class_docs)},
+    }
+    stored_at = now.replace(tzinfo=None)
+    repo.save_model(MODEL_NAME, stored_at, model.to_bytes(), json.dumps(metrics))
+    repo.commit()
+    model_cache.put(model, to_utc(stored_at))
+    logger.info(f"Trained section model on {len(rows)} articles: holdout accuracy {metrics['holdout_accuracy']}")
+    return metrics
@@ -4,6 +4,8 @@ import logging
 import requests
 from typing import Optional, Dict, Any
 
+from app.metrics import timed
+
 logger = logging.getLogger(__name__)
 
 class SlackNotifier:
@@ -13,6 +15,8 @@ class SlackNotifier:
         self.bot_token = os.getenv("SLACK_BOT_TOKEN")
         self.channels = os.getenv("SLACK_CHANNELS", "#general").split(",")
         self.enabled = os.getenv("ENABLE_SLACK_NOTIFICATIONS", "false").lower() == "true"
+        # 부하 테스트에서는 로컬 대역 서버로 교체
+        self.api_url = os.getenv("SLACK_API_URL", "https://slack.com/api/chat.postMessage")
         
         if not self.enabled:
             logger.info("Slack notifications are disabled")
@@ -51,12 +55,13 @@ class SlackNotifier:
                     "Content-type": "application/json"
                 }
                 
-                response = requests.post(
-                    "https://slack.com/api/chat.postMessage",
-                    json=payload,
-                    headers=headers,
-                    timeout=10
-                )
+                with timed("slack"):
+                    response = requests.post(
+                        self.api_url,
+                        json=payload,
+                        headers=headers,
+                        timeout=10
+                    )
                 response.raise_for_status()
                 
                 result = response.json()
@@ -0,0 +1,312 @@
+# app/snapshots.py
+"""
+정적 스냅샷 모드
+
+뉴스 페이지와 주요 JSON 응답은 새로고침 사이에 바뀌지 않으므로, 새로고침 직후 기본 파라미터
+요청의 응답을 한 번 렌더링해 파일로 저장하고 이후 요청은 파일을 그대로 내보냅니다.
+- 생성: refresh_all_feeds 끝에서 SNAPSHOT_PATHS를 앱에 직접(ASGI, 네트워크 없이) 요청해 본문을 받고
+  원본과 함께 .br/.gz 압축본(최고 압축률)을 SNAPSHOT_DIR에 기록합니다. manifest.json은 마지막에 교체합니다.
+- 제공: SnapshotMiddleware가 쿼리 스트링이 없는 GET/HEAD 요청을 Accept-Encoding에 맞는 파일로 응답하고
+  (ETag/304, Cache-Control s-maxage로 CDN 캐시 가능) 스냅샷이 없거나 오래됐으면 동적 앱으로 넘깁니다.
+- 무효화: 기사 데이터가 바뀌면(invalidate_news_fragments) manifest를 지워 다음 새로고침까지 동적 응답
+- SNAPSHOT_DIR을 static/snapshots로 두면 /static/snapshots/... 경로나 빌드 단계의 CDN 배포로도 제공됩니다.
+  (python -m app.snapshots 로 수동 생성)
+
+Vercel에서는 /tmp만 쓸 수 있고 인스턴스끼리 공유되지 않으므로, 새로고침한 인스턴스만 파일을 제공하고
+나머지는 동적 응답 + CDN 캐시(Cache-Control)로 처리됩니다.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.compression import choose_encoding, compress_body, supported_encodings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MODE = os.getenv("SNAPSHOT_MODE", "false").lower() == "true"
+SNAPSHOT_DIR = os.getenv(
+    "SNAPSHOT_DIR",
+    "/tmp/nextpicker-snapshots" if os.getenv("VERCEL") else "static/snapshots",
+)
+SNAPSHOT_MAX_AGE = int(os.getenv("SNAPSHOT_MAX_AGE", "21600"))  # 초, 이보다 오래된 스냅샷은 제공하지 않음
+SNAPSHOT_CACHE_CONTROL = os.getenv(
+    "SNAPSHOT_CACHE_CONTROL", "public, max-age=0, s-maxage=300, stale-while-revalidate=600"
+)
+
+# 스냅샷으로 만들 기본 파라미터 요청 경로
+SNAPSHOT_PATHS = (
+    "/news",
+    "/news/us",
+    "/news/kr",
+    "/api/v1/news/",
+    "/api/v1/news/US",
+    "/api/v1/news/KR",
+    "/api/v1/news/economy-politics",
+)
+
+MANIFEST_NAME = "manifest.json"
+# 스냅샷 생성 요청 표시 (미들웨어가 기존 스냅샷 대신 동적 앱으로 넘김)
+RENDER_HEADER = b"x-snapshot-render"
+
+_EXTENSIONS = {"text/html": ".html", "application/json": ".json"}
+_ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# If-None-Match의 엔티티 태그 하나 ("..."/W/"..." 또는 *, 따옴표 안의 쉼표도 태그의 일부)
+_ENTITY_TAG_RE = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+
+def snapshot_file_name(path: str, content_type: str) -> str:
+    """요청 경로 → SNAPSHOT_DIR 기준 상대 파일 경로 (/api/v1/news/ → api/v1/news/index.json)"""
+    name = path.lstrip("/")
+    if not name or name.endswith("/"):
+        name += "index"
+    return name + _EXTENSIONS.get(content_type.split(";")[0].strip(), ".txt")
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 목록의 태그 중 하나가 etag와 같은지 (약한 비교: W/ 무시, *는 항상 일치)"""
+    for tag in _ENTITY_TAG_RE.findall(if_none_match):
+        if tag == "*" or tag.replace("W/", "", 1) == etag:
+            return True
+    return False
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+async def _render(app: ASGIApp, path: str) -> Tuple[int, Dict[str, str], bytes]:
+    """앱에 GET 요청을 직접 보내 (상태, 헤더, 본문)을 받습니다."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"snapshot"), (RENDER_HEADER, b"1")],
+        "client": ("127.0.0.1", 0),
+        "server": ("snapshot", 80),
+    }
+    response: Dict[str, Any] = {"status": 500, "headers": {}, "body": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = Headers(raw=message["headers"])
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"], b"".join(response["body"])
+
+
+async def _render_all(paths: Tuple[str, ...]) -> List[Tuple[str, int, Dict[str, str], bytes]]:
+    from app.main import app  # app.main이 이 모듈을 import하므로 지연 import
+
+    results = []
+    for path in paths:
+        status, headers, body = await _render(app, path)
+        results.append((path, status, headers, body))
+    return results
+
+
+def build_snapshots(paths: Tuple[str, ...] = SNAPSHOT_PATHS, directory: str = None) -> Dict[str, Any]:
+    """SNAPSHOT_PATHS를 렌더링해 원본/압축본 파일과 manifest.json을 기록합니다."""
+    directory = directory or SNAPSHOT_DIR
+    start = time.perf_counter()
+
+    # 호출한 스레드에서 이벤트 루프가 돌고 있어도 동작하도록 별도 스레드의 이벤트 루프에서 렌더링
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        rendered = executor.submit(asyncio.run, _render_all(paths)).result()
+
+    pages = {}
+    for path, status, headers, body in rendered:
+        if status != 200:
+            logger.warning(f"Skipping snapshot for {path}: status {status}")
+            continue
+        content_type = headers.get("content-type", "application/octet-stream")
+        file_name = snapshot_file_name(path, content_type)
+        _write_atomic(os.path.join(directory, file_name), body)
+        encodings = []
+        for encoding in supported_encodings():
+            _write_atomic(
+                os.path.join(directory, file_name + _ENCODING_SUFFIXES[encoding]),
+                compress_body(body, encoding, best=True),
+            )
+            encodings.append(encoding)
+        pages[path] = {
+            "file": file_name,
+            "content_type": content_type,
+            "etag": '"' + hashlib.sha1(body).hexdigest()[:20] + '"',
+            "size": len(body),
+            "encodings": encodings,
+        }
+
+    manifest = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_ts": time.time(),
+        "pages": pages,
+    }
+    _write_atomic(os.path.join(directory, MANIFEST_NAME), json.dumps(manifest, indent=2).encode())
+    logger.info(f"Wrote {len(pages)} snapshots to {directory} in {(time.perf_counter() - start) * 1000:.0f}ms")
+    return manifest
+
+
+def refresh_snapshots() -> Optional[Dict[str, Any]]:
+    """스냅샷 모드일 때만 스냅샷을 다시 생성합니다. (새로고침 직후, 실패해도 새로고침에는 영향 없음)"""
+    if not SNAPSHOT_MODE:
+        return None
+    try:
+        return build_snapshots()
+    except Exception as e:
+        logger.error(f"Error building snapshots: {e}")
+        return None
+
+
+def invalidate_snapshots(directory: str = None) -> None:
+    """manifest를 지워 다음 생성 전까지 동적 앱이 응답하도록 합니다."""
+    if not SNAPSHOT_MODE:
+        return
+    try:
+        os.remove(os.path.join(directory or SNAPSHOT_DIR, MANIFEST_NAME))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Error invalidating snapshots: {e}")
+
+
+class SnapshotStore:
+    """manifest.json과 스냅샷 본문 메모리 캐시 (manifest가 바뀌면 다시 읽음)"""
+
+    def __init__(self, directory: str = None, max_age: int = SNAPSHOT_MAX_AGE):
+        self.directory = directory or SNAPSHOT_DIR
+        self.max_age = max_age
+        self._mtime: Optional[int] = None
+        self._manifest: Dict[str, Any] = {}
+        self._bodies: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            mtime = os.stat(os.path.join(self.directory, MANIFEST_NAME)).st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            if mtime != self._mtime:
+                self._mtime = mtime
+                self._bodies = {}
+                self._manifest = {}
+                if mtime is not None:
+                    try:
+                        with open(os.path.join(self.directory, MANIFEST_NAME), "rb") as f:
+                            self._manifest = json.load(f)
+                    except (OSError, ValueError) as e:
+                        logger.error(f"Error reading snapshot manifest: {e}")
+            return self._manifest
+
+    def lookup(self, path: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """(페이지 항목, 생성 시각) - 스냅샷이 없거나 max_age보다 오래되면 None"""
+        manifest = self._load_manifest()
+        page = manifest.get("pages", {}).get(path)
+        if page is None or time.time() - manifest.get("generated_ts", 0) > self.max_age:
+            return None
+        return page, manifest["generated_at"]
+
+    def read(self, file_name: str) -> Optional[bytes]:
+        body = self._bodies.get(file_name)
+        if body is None:
+            try:
+                with open(os.path.join(self.directory, file_name), "rb") as f:
+                    body = f.read()
+            except OSError:
+                return None
+            with self._lock:
+                self._bodies[file_name] = body
+        return body
+
+
+class SnapshotMiddleware:
+    """기본 파라미터 GET/HEAD 요청을 스냅샷 파일로 응답하는 ASGI 미들웨어 (없으면 동적 앱으로)"""
+
+    def __init__(self, app: ASGIApp, store: SnapshotStore = None, enabled: bool = None):
+        self.app = app
+        self.store = store or SnapshotStore()
+        self.enabled = SNAPSHOT_MODE if enabled is None else enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or scope.get("query_string")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        found = None if RENDER_HEADER.decode() in request_headers else self.store.lookup(scope["path"])
+        if found is None:
+            await self.app(scope, receive, send)
+            return
+
+        page, generated_at = found
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+        file_name = page["file"]
+        if encoding in page["encodings"]:
+            file_name += _ENCODING_SUFFIXES[encoding]
+        else:
+            encoding = None
+        body = self.store.read(file_name)
+        if body is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = [
+            (b"content-type", page["content_type"].encode()),
+            (b"etag", page["etag"].encode()),
+            (b"cache-control", SNAPSHOT_CACHE_CONTROL.encode()),
+            (b"vary", b"Accept-Encoding"),
+            (b"x-snapshot", generated_at.encode()),
+        ]
+        if etag_matches(request_headers.get("if-none-match", ""), page["etag"]):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+if __name__ == "__main__":
+    # 수동 생성: python -m app.snapshots [출력 디렉터리]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    from app.database import init_db
+
+    init_db()
+    build_snapshots(directory=sys.argv[1] if len(sys.argv) > 1 else None)
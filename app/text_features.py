@@ -0,0 +1,157 @@
+# app/text_features.py
+"""
+기사 텍스트 해시 특징 (관련 기사 TF-IDF, 섹션 분류 모델 공용)
+
+- 토큰: 영어는 소문자 단어(불용어 제외), 한국어는 띄어쓰기/조사 변형에 강하도록 한글 어절의 문자 2-gram/3-gram
+- 특징: 토큰을 crc32로 FEATURE_HASH_DIM 차원에 해시해 희소 행렬(문서 × 특징)의 개수로 만듭니다.
+  어휘 사전이 없어 새 단어가 들어와도 차원이 고정되고, 프로세스가 달라도 같은 토큰은 같은 열에 놓입니다.
+- 희소 행렬은 numpy 배열 세 개로 된 CSR(SparseRows)입니다. 필요한 연산(행 선택/쌓기, 전치, 밀집 행렬 곱,
+  희소 × 희소 내적)만 numpy로 구현해 scipy(~140MB)를 Vercel 함수 번들에 넣지 않습니다.
+numpy가 없는 환경에서는 VECTORS_AVAILABLE이 False이고 행렬 함수를 쓰는 기능은 건너뜁니다.
+"""
+import os
+import zlib
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence
+
+try:
+    import numpy as np
+    VECTORS_AVAILABLE = True
+except ImportError:  # numpy가 없으면 관련 기사/분류 모델 비활성화
+    np = None
+    VECTORS_AVAILABLE = False
+
+from app.trending import ENGLISH_STOPWORDS, TOKEN_RE, strip_source
+
+FEATURE_HASH_DIM = 1 << int(os.getenv("FEATURE_HASH_BITS", "18"))
+
+# 한글 어절 문자 n-gram 길이
+KOREAN_NGRAMS = (2, 3)
+
+
+def _is_hangul(token: str) -> bool:
+    return "가" <= token[0] <= "힣"
+
+
+def article_tokens(title: str, summary: Optional[str] = None, source: Optional[str] = None) -> List[str]:
+    """제목/요약의 특징 토큰 (기사 출처 이름은 제외, 중복 포함)"""
+    text = strip_source(title or "", source)
+    if summary:
+        # 구글 뉴스 요약은 '제목 출처'로 끝나므로 출처 이름을 지워 같은 출처끼리 비슷해지지 않게 함
+        text += " " + (summary.replace(source, " ") if source else summary)
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if _is_hangul(token):
+            if len(token) < KOREAN_NGRAMS[0]:
+                tokens.append(token)
+                continue
+            for n in KOREAN_NGRAMS:
+                tokens.extend(token[i:i + n] for i in range(len(token) - n + 1))
+        elif len(token) > 1 and token not in ENGLISH_STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def feature_index(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) % FEATURE_HASH_DIM
+
+
+def _spans(starts, lengths):
+    """[starts[i], starts[i] + lengths[i]) 구간들을 이어 붙인 위치 배열"""
+    total = int(lengths.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(starts, lengths) + offsets
+
+
+class SparseRows(NamedTuple):
+    """CSR 희소 행렬 - 행 i의 열/값은 indices/data[indptr[i]:indptr[i + 1]] (행 안에서 열 오름차순)"""
+    indptr: Any
+    indices: Any
+    data: Any
+    n_cols: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    @classmethod
+    def from_entries(cls, rows, cols, data, n_rows: int, n_cols: int) -> "SparseRows":
+        """(행, 열, 값) 항목 → CSR (같은 칸은 합침)"""
+        keys = np.asarray(rows, dtype=np.int64) * n_cols + np.asarray(cols, dtype=np.int64)
+        keys, inverse = np.unique(keys, return_inverse=True)
+        values = np.bincount(inverse, weights=data, minlength=len(keys)).astype(np.float32)
+        rows = keys // n_cols
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n_rows))))
+        return cls(indptr, (keys % n_cols).astype(np.int32), values, n_cols)
+
+    def row_ids(self):
+        """항목별 행 번호"""
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+    def take(self, rows: Sequence[int]) -> "SparseRows":
+        """지정한 행만 그 순서대로 모은 행렬"""
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        positions = _spans(starts, lengths)
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        return SparseRows(indptr, self.indices[positions], self.data[positions], self.n_cols)
+
+    @staticmethod
+    def stack(parts: Sequence["SparseRows"]) -> "SparseRows":
+        """행 방향으로 이어 붙이기"""
+        offsets = np.cumsum([0] + [int(part.indptr[-1]) for part in parts[:-1]])
+        indptr = np.concatenate([[0]] + [part.indptr[1:] + offset for part, offset in zip(parts, offsets)])
+        return SparseRows(
+            indptr, np.concatenate([part.indices for part in parts]),
+            np.concatenate([part.data for part in parts]), parts[0].n_cols,
+        )
+
+    def transpose(self) -> "SparseRows":
+        """열 × 행 CSR (열별로 그 열을 가진 행을 찾는 역색인)"""
+        order = np.argsort(self.indices, kind="stable")
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(self.indices, minlength=self.n_cols))))
+        return SparseRows(indptr, self.row_ids()[order].astype(np.int32), self.data[order], self.n_rows)
+
+    def dot_dense(self, matrix):
+        """(행 × 열) @ 밀집 (열 × k) → 밀집 (행 × k)"""
+        contributions = self.data[:, None] * matrix[self.indices]
+        row_ids = self.row_ids()
+        return np.stack([
+            np.bincount(row_ids, weights=contributions[:, k], minlength=self.n_rows)
+            for k in range(matrix.shape[1])
+        ], axis=1)
+
+    def dot_transposed(self, transposed: "SparseRows"):
+        """(행 × 열) @ 다른 행렬의 전치 → 밀집 (행 × 다른 행렬의 행) - transposed는 다른 행렬.transpose()"""
+        starts = transposed.indptr[self.indices]
+        lengths = transposed.indptr[self.indices + 1] - starts
+        positions = _spans(starts, lengths)
+        entries = np.repeat(np.arange(len(self.indices)), lengths)
+        n_other = transposed.n_cols
+        keys = self.row_ids()[entries] * n_other + transposed.indices[positions]
+        weights = self.data[entries] * transposed.data[positions]
+        return np.bincount(keys, weights=weights, minlength=self.n_rows * n_other).reshape(self.n_rows, n_other)
+
+
+def hash_features(documents: Iterable[List[str]]) -> SparseRows:
+    """토큰 목록들 → 문서 × FEATURE_HASH_DIM 개수 희소 행렬"""
+    rows: List[int] = []
+    cols: List[int] = []
+    count = 0
+    for row, tokens in enumerate(documents):
+        rows.extend([row] * len(tokens))
+        cols.extend(feature_index(token) for token in tokens)
+        count = row + 1
+    return SparseRows.from_entries(rows, cols, np.ones(len(cols)), count, FEATURE_HASH_DIM)
+
+
+def tfidf(counts: SparseRows) -> SparseRows:
+    """개수 행렬 → 로그 TF × 평활 IDF, 행 L2 정규화 (내적이 코사인 유사도)"""
+    data = 1.0 + np.log(counts.data)
+    df = np.bincount(counts.indices, minlength=counts.n_cols)
+    idf = np.log((1.0 + counts.n_rows) / (1.0 + df)) + 1.0
+    data = data * idf[counts.indices]
+    norms = np.sqrt(np.bincount(counts.row_ids(), weights=data * data, minlength=counts.n_rows))
+    norms[norms == 0] = 1.0
+    data = data / np.repeat(norms, np.diff(counts.indptr))
+    return counts._replace(data=data.astype(np.float32))
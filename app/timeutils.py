@@ -0,0 +1,95 @@
+# app/timeutils.py
+"""
+시간 정규화
+
+- 저장: published는 항상 UTC(naive)로 저장합니다. (to_storage_utc)
+- 조회: DB마다 다른 반환 형식(PostgreSQL datetime, SQLite 문자열)을 UTC aware datetime으로 맞춥니다. (to_utc)
+- 표시: 기사 국가의 현지 시각 문자열(KR → KST, US → ET)을 조회 직후 한 번만 계산합니다. (local_display)
+  템플릿은 published_local_str / local_tz를 출력만 하고 시간 계산을 하지 않습니다.
+"""
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo
+    EASTERN = ZoneInfo("America/New_York")
+except Exception:  # tzdata가 없는 환경: 서머타임 없이 EST 고정
+    ZoneInfo = None
+    EASTERN = timezone(timedelta(hours=-5), "EST")
+
+KST = timezone(timedelta(hours=9), "KST")
+
+# 국가별 표시 시간대 (시간대, 표시 이름)
+COUNTRY_TIMEZONES = {
+    "KR": (KST, "KST"),
+    "US": (EASTERN, "ET"),
+}
+DEFAULT_TIMEZONE = COUNTRY_TIMEZONES["KR"]
+
+LOCAL_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def utc_now() -> datetime:
+    """현재 UTC 시각 (aware)"""
+    return datetime.now(timezone.utc)
+
+
+def utc_cutoff(days: float) -> datetime:
+    """최근 N일 조회 기준 시각 (DB 저장 형식과 같은 naive UTC)"""
+    return (utc_now() - timedelta(days=days)).replace(tzinfo=None)
+
+
+def to_utc(value: Any) -> Optional[datetime]:
+    """datetime 또는 DB 문자열을 UTC aware datetime으로 변환합니다. (naive는 UTC로 간주)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def to_storage_utc(value: Any) -> Optional[datetime]:
+    """DB 저장용 naive UTC datetime"""
+    value = to_utc(value)
+    return value.replace(tzinfo=None) if value else None
+
+
+def register_country_timezone(country: str, zone_name: str, label: str) -> None:
+    """국가별 표시 시간대를 등록합니다. (피드 레지스트리 설정에서 호출, 알 수 없는 시간대는 무시)"""
+    try:
+        zone = ZoneInfo(zone_name)
+    except Exception:
+        return
+    COUNTRY_TIMEZONES[country.upper()] = (zone, label)
+    _format_local.cache_clear()
+
+
+def country_timezone(country: Optional[str]) -> Tuple[tzinfo, str]:
+    return COUNTRY_TIMEZONES.get((country or "").upper(), DEFAULT_TIMEZONE)
+
+
+@lru_cache(maxsize=4096)
+def _format_local(value: datetime, country: Optional[str]) -> str:
+    zone, _ = country_timezone(country)
+    return value.astimezone(zone).strftime(LOCAL_TIME_FORMAT)
+
+
+def local_display(value: Any, country: Optional[str]) -> Tuple[Optional[datetime], Optional[str], str]:
+    """(UTC datetime, 현지 시각 문자열, 시간대 이름) - 조회 결과 후처리용"""
+    published = to_utc(value)
+    tz_name = country_timezone(country)[1]
+    if published is None:
+        return None, None, tz_name
+    return published, _format_local(published, country), tz_name
+
+
+def format_kst(value: Any) -> Optional[str]:
+    """KST 표시 문자열 (초 단위, 요약 정보의 최종 업데이트 시각용)"""
+    value = to_utc(value)
+    return value.astimezone(KST).strftime("%Y-%m-%d %H:%M:%S KST") if value else None
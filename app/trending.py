@@ -0,0 +1,444 @@
+# app/trending.py
+"""
+트렌드 키워드 증분 집계
+
+save_articles_to_db가 새 기사를 저장할 때마다 제목/요약의 키워드를 국가별 시간 버킷(trending_buckets)에 더하고,
+/api/v1/analysis/trending은 최근 구간 버킷과 그 이전 기준 구간 버킷만 읽어 급상승 키워드를 계산합니다.
+30일치 title/summary를 다시 훑지 않습니다.
+- 버킷: 최근 TRENDING_HOURLY_HOURS 시간은 1시간 단위, 그보다 오래된 시간 버킷은 일(UTC) 버킷으로 합치고
+  TRENDING_RETENTION_DAYS가 지나면 삭제합니다. (국가당 버킷 수가 일정하게 유지됨)
+- 버킷 하나: 고정 크기 Count-Min Sketch(보수적 갱신) + Space-Saving 상위 TRENDING_TOP_K개 키워드
+  두 요약 모두 키워드 종류 수와 무관하게 크기가 고정되고, 버킷끼리 더해 합칠 수 있습니다.
+- 조회: 최근 구간 버킷들의 상위 키워드를 후보로, 각 후보의 최근/기준 구간 빈도를 Sketch로 추정해
+  기사 수로 보정한 기대 빈도 대비 비율(surge)로 정렬합니다.
+- 토큰화: 영어는 단어 + 불용어 제거, 한국어는 한글 어절에서 조사를 떼어 냅니다.
+  섹션 키워드 목록(app/keywords.py)을 시드 어휘로 써서 'white house' 같은 구는 한 단어로,
+  'ai', 'tv' 같은 짧은 단어도 키워드로, '대통령이'는 시드 '대통령'으로 맞춥니다.
+빈도는 기사 단위(한 기사에서 여러 번 나와도 1)입니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from array import array
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.article import Article
+from app.keywords import SECTION_KEYWORDS
+from app.repositories.trend_repository import TrendRepository
+from app.timeutils import to_storage_utc, to_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+TRENDING_SKETCH_WIDTH = int(os.getenv("TRENDING_SKETCH_WIDTH", "2048"))
+TRENDING_SKETCH_DEPTH = int(os.getenv("TRENDING_SKETCH_DEPTH", "4"))
+TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", "200"))                  # 버킷별 상위 키워드 수
+TRENDING_HOURLY_HOURS = int(os.getenv("TRENDING_HOURLY_HOURS", "48"))     # 시간 버킷으로 유지하는 기간
+TRENDING_RETENTION_DAYS = int(os.getenv("TRENDING_RETENTION_DAYS", "30"))
+TRENDING_MIN_COUNT = int(os.getenv("TRENDING_MIN_COUNT", "3"))            # 최근 구간 최소 기사 수
+TRENDING_CACHE_TTL = int(os.getenv("TRENDING_CACHE_TTL", "300"))          # 초, 조회 결과 캐시
+
+# 기사당 최대 키워드 수 (긴 요약이 한 버킷을 독차지하지 않도록)
+MAX_TERMS_PER_ARTICLE = 40
+
+ENGLISH_STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have having
+he her here hers herself him himself his how i if in into is it its itself just me more most my myself no
+nor not now of off on once only or other our ours ourselves out over own same she should so some such than
+that the their theirs them themselves then there these they this those through to too under until up very
+was we were what when where which while who whom why will with would you your yours yourself yourselves
+says said say new news one two three first last year years week day days time today yesterday tomorrow
+get gets got make makes made take takes back still amid may might must per via vs like just report reports
+according could would should us mr mrs ms will what's it's here's that's don't can't won't
+monday tuesday wednesday thursday friday saturday sunday
+""".split())
+
+KOREAN_STOPWORDS = frozenset("""
+기자 뉴스 속보 단독 종합 사진 영상 오늘 어제 내일 지난 이번 올해 작년 내년 관련 위해 대한 통해 따라
+위한 있는 없는 있다 없다 했다 한다 된다 밝혔다 말했다 것으로 이후 이날 현재 가운데 등 및 또 더 그 이 저
+""".split())
+
+# 조사/어미 (긴 것부터 떼어 냄, 떼고 남은 어간이 2글자 이상일 때만)
+KOREAN_SUFFIXES = tuple(sorted("""
+은 는 이 가 을 를 의 에 도 만 와 과 로 나 서 께 란 랑
+에서 으로 에게 한테 까지 부터 보다 처럼 마저 조차 이나 이며 라는 라고 이라 에는 에도 으론 과의 와의 로의
+에서는 에서도 으로는 으로도 이라는 이라고 에게서 까지는 부터는 했다 한다 하는 하고 해야 했던
+""".split(), key=len, reverse=True))
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:['’\-.&][a-z0-9]+)*|[가-힣]+")
+
+
+def _seed_vocabulary() -> Tuple[frozenset, Dict[Tuple[str, ...], str], frozenset]:
+    """섹션 키워드 목록에서 (영어 단어, 영어 구 → 키워드, 한국어 단어) 시드 어휘를 만듭니다."""
+    words, phrases, korean = set(), {}, set()
+    for keywords in SECTION_KEYWORDS.values():
+        for keyword in keywords:
+            if re.fullmatch(r"[가-힣]+", keyword):
+                korean.add(keyword)
+            elif " " in keyword:
+                phrases[tuple(keyword.split())] = keyword
+            else:
+                words.add(keyword)
+    return frozenset(words), phrases, frozenset(korean)
+
+
+SEED_WORDS, SEED_PHRASES, SEED_KOREAN = _seed_vocabulary()
+MAX_PHRASE_WORDS = max((len(words) for words in SEED_PHRASES), default=1)
+
+
+def _korean_term(token: str) -> Optional[str]:
+    """한글 어절 → 키워드 (시드 접두 일치 우선, 아니면 조사/어미 제거)"""
+    if token in SEED_KOREAN:
+        return token
+    for length in range(len(token) - 1, 1, -1):
+        stem = token[:length]
+        if stem in SEED_KOREAN and len(token) - length <= 2:
+            return stem
+    for suffix in KOREAN_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            token = token[:-len(suffix)]
+            break
+    if len(token) < 2 or token in KOREAN_STOPWORDS:
+        return None
+    return token
+
+
+def strip_source(title: str, source: Optional[str]) -> str:
+    """구글 뉴스 제목 끝의 ' - 출처'를 떼어 냅니다. (출처 이름이 키워드로 잡히지 않도록)"""
+    if source and title.endswith(f" - {source}"):
+        return title[:-len(source) - 3]
+    return title
+
+
+def extract_terms(title: str, summary: Optional[str] = None, source: Optional[str] = None) -> List[str]:
+    """기사 하나의 키워드 목록 (중복 제거, 등장 순서)"""
+    text = f"{strip_source(title or '', source)} {summary or ''}".lower()
+    if source:
+        # 요약에도 출처 이름이 붙는 경우가 많음
+        text = text.replace(source.lower(), " ")
+    tokens = TOKEN_RE.findall(text)
+
+    terms: Dict[str, None] = {}
+    index = 0
+    while index < len(tokens) and len(terms) < MAX_TERMS_PER_ARTICLE:
+        token = tokens[index]
+        # 시드 구 ('white house', 'artificial intelligence' 등)
+        matched = False
+        for size in range(MAX_PHRASE_WORDS, 1, -1):
+            phrase = SEED_PHRASES.get(tuple(tokens[index:index + size]))
+            if phrase:
+                terms[phrase] = None
+                index += size
+                matched = True
+                break
+        if matched:
+            continue
+        index += 1
+
+        if token[0] >= "가":
+            term = _korean_term(token)
+        else:
+            term = token.replace("’", "'")
+            if term.endswith("'s"):
+                term = term[:-2]
+            if term in ENGLISH_STOPWORDS or term.isdigit():
+                term = None
+            elif len(term) < 3 and term not in SEED_WORDS:
+                term = None
+        if term:
+            terms[term] = None
+    return list(terms)
+
+
+class CountMinSketch:
+    """고정 크기 Count-Min Sketch (보수적 갱신, 프로세스와 무관하게 같은 해시)"""
+
+    def __init__(self, width: int = TRENDING_SKETCH_WIDTH, depth: int = TRENDING_SKETCH_DEPTH,
+                 counts: Optional[array] = None):
+        self.width = width
+        self.depth = depth
+        self.counts = counts if counts is not None else array("I", bytes(4 * width * depth))
+
+    def indexes(self, term: str) -> List[int]:
+        digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, term: str, count: int = 1) -> None:
+        """보수적 갱신: 현재 추정값보다 작은 칸만 올려 과대 추정을 줄임"""
+        cells = self.indexes(term)
+        target = min(self.counts[cell] for cell in cells) + count
+        for cell in cells:
+            if self.counts[cell] < target:
+                self.counts[cell] = target
+
+    def estimate_cells(self, cells: List[int]) -> int:
+        return min(self.counts[cell] for cell in cells)
+
+    def estimate(self, term: str) -> int:
+        return self.estimate_cells(self.indexes(term))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """같은 크기의 Sketch를 더합니다. (버킷 합치기)"""
+        self.counts = array("I", (a + b for a, b in zip(self.counts, other.counts)))
+
+    def to_bytes(self) -> bytes:
+        counts = self.counts
+        if sys.byteorder != "little":
+            counts = array("I", counts)
+            counts.byteswap()
+        return zlib.compress(counts.tobytes(), 6)
+
+    @classmethod
+    def from_bytes(cls, data: Optional[bytes], width: int = TRENDING_SKETCH_WIDTH,
+                   depth: int = TRENDING_SKETCH_DEPTH) -> "CountMinSketch":
+        if not data:
+            return cls(width, depth)
+        counts = array("I")
+        counts.frombytes(zlib.decompress(data))
+        if sys.byteorder != "little":
+            counts.byteswap()
+        if len(counts) != width * depth:
+            # 설정(크기)이 바뀐 뒤의 예전 버킷은 쓸 수 없으므로 빈 Sketch로 취급
+            logger.warning(f"Ignoring trending sketch with {len(counts)} cells (expected {width * depth})")
+            return cls(width, depth)
+        return cls(width, depth, counts)
+
+
+class SpaceSaving:
+    """Space-Saving 상위 키워드 요약 (키워드 → [개수, 오차], 최대 capacity개)"""
+
+    def __init__(self, capacity: int = TRENDING_TOP_K, counters: Optional[Dict[str, List[int]]] = None):
+        self.capacity = capacity
+        self.counters: Dict[str, List[int]] = counters or {}
+
+    def add(self, term: str, count: int = 1) -> None:
+        counter = self.counters.get(term)
+        if counter is not None:
+            counter[0] += count
+        elif len(self.counters) < self.capacity:
+            self.counters[term] = [count, 0]
+        else:
+            # 가장 작은 항목을 밀어내고 그 개수를 오차로 물려받음
+            victim = min(self.counters, key=lambda key: self.counters[key][0])
+            floor = self.counters.pop(victim)[0]
+            self.counters[term] = [floor + count, floor]
+
+    def merge(self, other: "SpaceSaving") -> None:
+        for term, (count, error) in other.counters.items():
+            counter = self.counters.setdefault(term, [0, 0])
+            counter[0] += count
+            counter[1] += error
+        if len(self.counters) > self.capacity:
+            self.counters = dict(self.top(self.capacity))
+
+    def top(self, n: int) -> List[Tuple[str, List[int]]]:
+        return sorted(self.counters.items(), key=lambda item: item[1][0], reverse=True)[:n]
+
+    def to_json(self) -> str:
+        return json.dumps(self.counters, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: Optional[str]) -> "SpaceSaving":
+        return cls(TRENDING_TOP_K, json.loads(data) if data else {})
+
+
+class TermBucket:
+    """시간 버킷 하나의 키워드 요약"""
+
+    def __init__(self, start: datetime, hours: int, article_count: int = 0,
+                 sketch: Optional[CountMinSketch] = None, heavy: Optional[SpaceSaving] = None):
+        self.start = start
+        self.hours = hours
+        self.article_count = article_count
+        self.sketch = sketch or CountMinSketch()
+        self.heavy = heavy or SpaceSaving()
+
+    @classmethod
+    def from_row(cls, row) -> "TermBucket":
+        return cls(
+            to_storage_utc(row.bucket_start), row.bucket_hours, row.article_count or 0,
+            CountMinSketch.from_bytes(row.sketch), SpaceSaving.from_json(row.heavy_hitters)
+        )
+
+    def add_terms(self, terms: Iterable[str]) -> None:
+        self.article_count += 1
+        for term in terms:
+            self.sketch.add(term)
+            self.heavy.add(term)
+
+    def merge(self, other: "TermBucket") -> None:
+        self.article_count += other.article_count
+        self.sketch.merge(other.sketch)
+        self.heavy.merge(other.heavy)
+
+
+def bucket_for(published: datetime, now: datetime) -> Tuple[datetime, int]:
+    """발행 시각의 버킷 (시작 시각, 시간 수) - 최근은 시간 버킷, 오래된 것은 일 버킷"""
+    hour = published.replace(minute=0, second=0, microsecond=0)
+    if hour >= now - timedelta(hours=TRENDING_HOURLY_HOURS):
+        return hour, 1
+    return hour.replace(hour=0), 24
+
+
+def _save(repo: TrendRepository, country: str, bucket: TermBucket, updated_at: datetime) -> None:
+    repo.save_bucket(country, bucket.start, bucket.hours, bucket.article_count,
+                     bucket.sketch.to_bytes(), bucket.heavy.to_json(), updated_at)
+
+
+def _compact(repo: TrendRepository, now: datetime) -> None:
+    """오래된 시간 버킷을 일 버킷으로 합치고 보관 기간이 지난 버킷을 삭제합니다."""
+    hourly_cutoff = now - timedelta(hours=TRENDING_HOURLY_HOURS)
+    by_day: Dict[Tuple[str, datetime], List[Any]] = defaultdict(list)
+    for row in repo.get_hourly_buckets_before(hourly_cutoff):
+        start = to_storage_utc(row.bucket_start)
+        by_day[(row.country, start.replace(hour=0))].append(row)
+
+    for (country, day), rows in by_day.items():
+        # 자정 시간 버킷은 일 버킷과 키가 같으므로 그 행을 일 버킷으로 바꿔 씀
+        target = repo.lock_buckets(country, {day: 24})[day]
+        daily = TermBucket.from_row(target) if target.bucket_hours == 24 else TermBucket(day, 24)
+        for row in rows:
+            daily.merge(TermBucket.from_row(row))
+            start = to_storage_utc(row.bucket_start)
+            if start != day:
+                repo.delete_bucket(country, start)
+        _save(repo, country, daily, now)
+
+    repo.delete_buckets_before((now - timedelta(days=TRENDING_RETENTION_DAYS)).replace(hour=0))
+
+
+def record_article_terms(db: Session, articles: List[Article]) -> int:
+    """새로 저장된 기사의 키워드를 국가별 시간 버킷에 더합니다. (반영한 기사 수)"""
+    if not articles:
+        return 0
+    now = utc_now().replace(tzinfo=None, microsecond=0)
+    retention_start = (now - timedelta(days=TRENDING_RETENTION_DAYS)).replace(hour=0, minute=0, second=0)
+
+    # 국가 → 버킷 → 기사별 키워드 목록
+    grouped: Dict[str, Dict[Tuple[datetime, int], List[List[str]]]] = defaultdict(lambda: defaultdict(list))
+    for article in articles:
+        published = min(to_storage_utc(article.published) or now, now)
+        if published < retention_start or not article.country:
+            continue
+        terms = extract_terms(article.title, article.summary, article.source)
+        grouped[article.country][bucket_for(published, now)].append(terms)
+
+    repo = TrendRepository(db)
+    # 먼저 합쳐 두어야 오래된 기사가 들어갈 일 버킷 키(자정)에 시간 버킷이 남아 있지 않음
+    _compact(repo, now)
+    recorded = 0
+    for country, buckets in grouped.items():
+        locked = repo.lock_buckets(country, {start: hours for start, hours in buckets})
+        for (start, hours), term_lists in buckets.items():
+            bucket = TermBucket.from_row(locked[start])
+            for terms in term_lists:
+                bucket.add_terms(terms)
+            _save(repo, country, bucket, now)
+            recorded += len(term_lists)
+    repo.commit()
+    trending_cache.clear()
+    return recorded
+
+
+class TrendingCache:
+    """조회 결과 캐시 (TTL, 이 프로세스에서 키워드를 기록하면 비움)"""
+
+    def __init__(self, ttl: int = TRENDING_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def put(self, key: tuple, value: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._entries) > 256:
+                self._entries.clear()
+            self._entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 인스턴스
+trending_cache = TrendingCache()
+
+
+def _window_summary(buckets: List[TermBucket]) -> Tuple[int, SpaceSaving]:
+    heavy = SpaceSaving(capacity=sys.maxsize)
+    article_count = 0
+    for bucket in buckets:
+        article_count += bucket.article_count
+        heavy.merge(bucket.heavy)
+    return article_count, heavy
+
+
+def trending_terms(db: Session, country: str, hours: int = 24, baseline_hours: int = 168,
+                   limit: int = 20) -> Dict[str, Any]:
+    """
+    최근 hours시간에 기준 구간(그 이전 baseline_hours시간)보다 많이 등장한 키워드
+    (일 버킷은 시작 시각이 구간 안에 있으면 통째로 포함)
+    """
+    now = utc_now().replace(tzinfo=None)
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    key = (country, hours, baseline_hours, limit, current_hour)
+    cached = trending_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # 현재 시간 버킷까지 포함하도록 시간 단위로 구간을 나눔
+    window_start = current_hour - timedelta(hours=hours - 1)
+    baseline_start = window_start - timedelta(hours=baseline_hours)
+    rows = TrendRepository(db).get_buckets(country, baseline_start)
+    buckets = [TermBucket.from_row(row) for row in rows]
+    current = [bucket for bucket in buckets if bucket.start >= window_start]
+    baseline = [bucket for bucket in buckets if bucket.start < window_start]
+
+    current_articles, candidates = _window_summary(current)
+    baseline_articles = sum(bucket.article_count for bucket in baseline)
+    # 기준 구간 기사 수를 최근 구간 기사 수에 맞춰 기대 빈도를 계산
+    scale = current_articles / baseline_articles if baseline_articles else 0.0
+
+    terms = []
+    for term, _ in candidates.top(max(limit * 5, 100)):
+        cells = current[0].sketch.indexes(term)
+        count = sum(bucket.sketch.estimate_cells(cells) for bucket in current)
+        if count < TRENDING_MIN_COUNT:
+            continue
+        base = sum(bucket.sketch.estimate_cells(cells) for bucket in baseline)
+        expected = base * scale
+        terms.append({
+            'term': term,
+            'count': count,
+            'baseline_count': base,
+            'expected': round(expected, 2),
+            'surge': round((count + 1) / (expected + 1), 3),
+        })
+    terms.sort(key=lambda item: (item['surge'], item['count']), reverse=True)
+
+    result = {
+        'country': country,
+        'terms': terms[:limit],
+        'window': {'start': to_utc(window_start), 'hours': hours, 'articles': current_articles},
+        'baseline': {'start': to_utc(baseline_start), 'hours': baseline_hours, 'articles': baseline_articles},
+    }
+    trending_cache.put(key, result)
+    return result
@@ -0,0 +1,214 @@
+# app/url_resolver.py
+"""
+구글 뉴스 래퍼 URL → 원문 URL 해석 (RESOLVE_CANONICAL_URLS=true일 때 수집 중 적용)
+
+구글 뉴스 RSS의 entry.link는 news.google.com/rss/articles/<id>?oc=5 형태의 래퍼라서, 같은 기사가
+피드마다 다른 래퍼/쿼리로 들어오면 기사 ID(URL 해시)가 달라져 중복 저장됩니다.
+수집 시 래퍼를 원문 URL로 바꾸고 추적 파라미터(utm_* 등)를 제거해 기사 ID를 원문 URL 기준으로 만듭니다.
+- 해석 순서: url_aliases 캐시 → 래퍼 ID에 원문 URL이 들어 있는 예전 형식은 base64 디코딩
+  → 나머지는 URL_RESOLVE_WORKERS개 스레드로 동시에 요청해 리다이렉트 최종 주소나 HTML의 원문 링크 사용
+- 새로고침 하나가 해석에 쓰는 시간은 URL_RESOLVE_BUDGET_SECONDS로 제한하고, 끝나지 않은 래퍼는 이번에는 그대로 둡니다.
+- 실패한 래퍼는 url_aliases에 NULL로 남겨 URL_RESOLVE_RETRY_HOURS 동안 다시 요청하지 않습니다.
+- 이미 저장된 기사의 URL(래퍼 또는 추적 파라미터가 붙은 원문)은 같은 기사가 두 번 저장되지 않도록 그대로 유지합니다.
+요청은 GOOGLE_NEWS_BASE_URL로 보내므로 부하 테스트의 로컬 대역 서버로 검증할 수 있습니다.
+"""
+import base64
+import binascii
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from datetime import timedelta
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from sqlalchemy.orm import Session
+
+from app.metrics import timed
+from app.repositories.url_alias_repository import UrlAliasRepository
+from app.rss_feeds import GOOGLE_NEWS_BASE_URL
+from app.timeutils import to_storage_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+RESOLVE_CANONICAL_URLS = os.getenv("RESOLVE_CANONICAL_URLS", "false").lower() == "true"
+URL_RESOLVE_WORKERS = int(os.getenv("URL_RESOLVE_WORKERS", "8"))
+URL_RESOLVE_TIMEOUT = float(os.getenv("URL_RESOLVE_TIMEOUT", "5"))                # 초, 래퍼 하나당
+URL_RESOLVE_BUDGET_SECONDS = float(os.getenv("URL_RESOLVE_BUDGET_SECONDS", "10"))  # 초, 국가별 새로고침 하나당
+URL_RESOLVE_RETRY_HOURS = float(os.getenv("URL_RESOLVE_RETRY_HOURS", "24"))        # 실패한 래퍼 재시도 간격
+
+WRAPPER_HOSTS = {"news.google.com", urlsplit(GOOGLE_NEWS_BASE_URL).netloc}
+WRAPPER_PATH_RE = re.compile(r"^/(?:rss/)?articles/([A-Za-z0-9_\-]+)")
+
+# 기사 내용과 무관한 추적/유입 경로 파라미터
+TRACKING_PARAMS = frozenset("""
+fbclid gclid dclid gbraid wbraid msclkid yclid mc_cid mc_eid igshid _ga _gl ocid cmpid smid
+ref ref_src ref_url spm guccounter guce_referrer guce_referrer_sig oc at_medium at_campaign
+""".split())
+TRACKING_PREFIXES = ("utm_", "hmb_", "pk_", "itm_")
+
+# 래퍼 페이지 HTML에서 원문 링크 찾기 (리다이렉트하지 않는 경우)
+CANONICAL_LINK_RES = (
+    re.compile(r"""<link[^>]+rel=["']canonical["'][^>]*href=["']([^"']+)["']""", re.IGNORECASE),
+    re.compile(r"""data-n-au=["']([^"']+)["']"""),
+)
+MAX_HTML_SCAN = 200_000
+MAX_URL_LENGTH = 1000  # news_articles.url / url_aliases 컬럼 길이
+
+
+def is_wrapper_url(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.netloc in WRAPPER_HOSTS and WRAPPER_PATH_RE.match(parts.path) is not None
+
+
+def wrapper_key(url: str) -> str:
+    """래퍼 캐시 키 - 쿼리(oc, hl 등)를 뗀 news.google.com 경로"""
+    return "https://news.google.com" + urlsplit(url).path
+
+
+def strip_tracking(url: str) -> str:
+    """추적 파라미터와 fragment를 제거하고 scheme/host를 소문자로 맞춥니다."""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    netloc = parts.netloc.lower()
+    if parts.scheme == "https" and netloc.endswith(":443"):
+        netloc = netloc[:-4]
+    elif parts.scheme == "http" and netloc.endswith(":80"):
+        netloc = netloc[:-3]
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path or "/", urlencode(query), ""))
+
+
+def _valid_target(url: Optional[str]) -> Optional[str]:
+    """래퍼가 아닌 http(s) 절대 URL이면 정규화해서 반환"""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc or parts.netloc in WRAPPER_HOSTS:
+        return None
+    target = strip_tracking(url)
+    return target if len(target) <= MAX_URL_LENGTH else None
+
+
+def decode_wrapper(url: str) -> Optional[str]:
+    """
+    래퍼 ID(protobuf를 base64로 인코딩)에 원문 URL이 그대로 들어 있는 예전 형식이면 요청 없이 꺼냅니다.
+    최근 형식(AU_yqL...)은 암호화된 토큰이라 None을 반환합니다.
+    """
+    match = WRAPPER_PATH_RE.match(urlsplit(url).path)
+    if not match:
+        return None
+    article_id = match.group(1)
+    try:
+        data = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, binascii.Error):
+        return None
+    start = data.find(b"http")
+    if start < 1:
+        return None
+    # URL 앞의 varint 길이 (1~2바이트)
+    length = data[start - 1]
+    if start >= 2 and data[start - 2] & 0x80 and length < 0x80:
+        length = (data[start - 2] & 0x7F) | (length << 7)
+    raw = data[start:start + length]
+    if len(raw) != length:
+        return None
+    try:
+        return _valid_target(raw.decode("ascii"))
+    except UnicodeDecodeError:
+        return None
+
+
+def fetch_canonical(url: str) -> Optional[str]:
+    """래퍼를 요청해 리다이렉트 최종 주소 또는 HTML의 원문 링크를 반환합니다. (못 찾으면 None)"""
+    parts = urlsplit(url)
+    target = GOOGLE_NEWS_BASE_URL + parts.path
+    with timed("url_resolve"):
+        response = requests.get(target, timeout=URL_RESOLVE_TIMEOUT, allow_redirects=True,
+                                headers={"User-Agent": "Mozilla/5.0 (compatible; NextPicker/1.0)"})
+    response.raise_for_status()
+    resolved = _valid_target(response.url)
+    if resolved:
+        return resolved
+    if "html" in response.headers.get("Content-Type", ""):
+        page = response.text[:MAX_HTML_SCAN]
+        for pattern in CANONICAL_LINK_RES:
+            match = pattern.search(page)
+            if match and _valid_target(match.group(1)):
+                return _valid_target(match.group(1))
+    return None
+
+
+def _resolve_one(url: str) -> Optional[str]:
+    return decode_wrapper(url) or fetch_canonical(url)
+
+
+def resolve_canonical_urls(db: Session, urls: Iterable[str]) -> Dict[str, str]:
+    """
+    기사 URL → 기사 ID를 만들 원문(정규화) URL
+    해석하지 못한 래퍼와 이미 저장된 기사의 URL은 그대로 돌려줍니다.
+    """
+    urls = list(dict.fromkeys(urls))
+    canonical = {url: url for url in urls}
+    wrappers = [url for url in urls if is_wrapper_url(url)]
+
+    # 이미 그대로 저장된 URL은 기사 ID가 바뀌어 중복 저장되지 않도록 래퍼든 아니든 그대로 둠
+    repo = UrlAliasRepository(db)
+    stored = set(repo.get_stored_urls(urls))
+    for url in urls:
+        if url not in stored and not is_wrapper_url(url):
+            canonical[url] = strip_tracking(url)
+    if not wrappers:
+        return canonical
+
+    # 컬럼보다 긴 래퍼는 캐시에 넣을 수 없으므로 그대로 둠
+    keys = {url: wrapper_key(url) for url in wrappers if url not in stored and len(wrapper_key(url)) <= MAX_URL_LENGTH}
+    aliases = repo.get_aliases(set(keys.values()))
+
+    now = utc_now()
+    retry_before = to_storage_utc(now - timedelta(hours=URL_RESOLVE_RETRY_HOURS))
+    pending = set()
+    for url, key in keys.items():
+        if key in aliases:
+            target, resolved_at = aliases[key]
+            if target:
+                canonical[url] = target
+                continue
+            if to_storage_utc(resolved_at) >= retry_before:
+                continue
+        pending.add(key)
+
+    results: Dict[str, Optional[str]] = {}
+    if pending:
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=min(URL_RESOLVE_WORKERS, len(pending)))
+        futures = {executor.submit(_resolve_one, key): key for key in pending}
+        try:
+            for future in as_completed(futures, timeout=URL_RESOLVE_BUDGET_SECONDS):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.debug(f"Failed to resolve {key}: {e}")
+                    results[key] = None
+        except TimeoutError:
+            logger.warning(f"URL resolve budget exceeded, {len(pending) - len(results)} wrappers left for the next refresh")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        repo.save_aliases(results, now.replace(tzinfo=None))
+        repo.commit()
+        resolved = sum(1 for target in results.values() if target)
+        logger.info(
+            f"Resolved {resolved}/{len(pending)} Google News wrappers in "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms ({len(set(keys.values())) - len(pending)} cached)"
+        )
+
+    for url, key in keys.items():
+        if results.get(key):
+            canonical[url] = results[key]
+    return canonical
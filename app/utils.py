@@ -1,9 +1,18 @@
 # app/utils.py
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 동작
+    orjson = None
+
+from app.article import Article
+from app.rss_feeds import feed_registry
 from app.schemas import BaseResponse, ErrorResponse
 
 logger = logging.getLogger(__name__)
@@ -23,6 +32,55 @@ def create_success_response(
     )
 
 
+def _json_default(value: Any) -> Any:
+    """표준 json 폴백용 직렬화 (BaseResponse와 같은 datetime 형식)"""
+    if isinstance(value, (datetime, date)):
+        encoded = value.isoformat()
+        return encoded[:-6] + "Z" if encoded.endswith("+00:00") else encoded
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(content: Any) -> bytes:
+    """API 응답과 같은 형식의 JSON 바이트 (orjson 우선, datetime 네이티브 처리)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_json_default,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 바로 직렬화하는 JSON 응답 (datetime 네이티브 처리)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def create_fast_response(
+    data: Any = None,
+    message: str = None,
+    meta: Dict[str, Any] = None
+) -> FastJSONResponse:
+    """
+    빠른 성공 응답 생성 (대용량 목록용)
+
+    BaseResponse 모델과 jsonable_encoder를 거치지 않고 동일한 형식의 envelope을
+    바로 직렬화합니다. data에는 이미 JSON 호환 형태(dict/list)의 값을 넘겨야 합니다.
+    """
+    return FastJSONResponse({
+        "success": True,
+        "message": message,
+        "data": data,
+        "meta": meta or {},
+        "timestamp": datetime.now(),
+        "error": None
+    })
+
+
 def create_error_response(
     message: str,
     error_code: str = None,
@@ -65,8 +123,9 @@ def validate_country(country: str) -> str:
         raise HTTPException(status_code=400, detail="Country parameter is required")
     
     country = country.upper()
-    if country not in ['US', 'KR']:
-        raise HTTPException(status_code=400, detail="Country must be 'US' or 'KR'")
+    if not feed_registry.has_country(country):
+        supported = " or ".join(f"'{code}'" for code in feed_registry.countries)
+        raise HTTPException(status_code=400, detail=f"Country must be {supported}")
     
     return country
 
@@ -102,6 +161,17 @@ def validate_pagination_params(days: int = 1, limit: int = 30) -> tuple[int, int
     return days, limit
 
 
+def serialize_articles(articles: List[Article], fields: Optional[Sequence[str]] = None,
+                       include_url: bool = True) -> List[Dict[str, Any]]:
+    """
+    Article 레코드 목록을 JSON 응답용 dict 목록으로 변환
+    fields로 응답 필드를 고르고(기본은 전체), include_url=False면 url 키를 넣지 않습니다.
+    """
+    if not include_url:
+        fields = tuple(field for field in (fields or Article._fields) if field != "url")
+    return [article.to_dict(fields) for article in articles]
+
+
 def format_news_article(article: Any) -> Dict[str, Any]:
     """뉴스 기사를 표준 형식으로 변환"""
     return {
@@ -0,0 +1 @@
+# NextPicker benchmarks
@@ -0,0 +1,82 @@
+# benchmarks/article_memory.py
+"""
+기사 레코드 메모리 벤치마크
+
+기존 dict 기반 기사와 Article 레코드(NamedTuple)의 기사당 메모리 사용량과
+생성 시간을 비교합니다.
+
+    python -m benchmarks.article_memory --count 100000
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from app.article import Article
+
+
+def _rows(count: int):
+    """DB 조회 결과와 같은 형태의 튜플 row를 생성합니다."""
+    base = datetime(2024, 1, 1)
+    return [
+        (
+            f"{i:032x}",
+            f"Sample headline number {i} about markets and policy",
+            f"https://news.example.com/articles/{i}",
+            f"Source {i % 50}",
+            base + timedelta(minutes=i),
+            "Summary text " * 10,
+            "business",
+            "US",
+            base + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(count)
+    ]
+
+
+def _as_dicts(rows):
+    return [
+        {
+            'id': row[0],
+            'title': row[1],
+            'url': row[2],
+            'source': row[3],
+            'published': row[4],
+            'summary': row[5],
+            'section': row[6],
+            'country': row[7],
+            'created_at': row[8],
+        }
+        for row in rows
+    ]
+
+
+def _as_articles(rows):
+    return [Article._make(row) for row in rows]
+
+
+def measure(builder, rows):
+    """builder 실행 시 추가로 할당된 메모리(bytes)와 소요 시간(초)을 반환합니다."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = builder(rows)
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Article record memory benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = _rows(args.count)
+    for name, builder in (("dict", _as_dicts), ("Article", _as_articles)):
+        size, elapsed = measure(builder, rows)
+        print(f"{name:8s} {size / args.count:8.1f} bytes/article  {elapsed * 1000:8.1f} ms total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# benchmarks/classifier.py
+"""
+섹션 분류 정확도 + 처리량 벤치마크 (키워드 투표 vs 나이브 베이즈 모델)
+
+섹션 피드가 섹션을 정해 준 기사(라벨)를 발행 시각 순으로 나눠 앞부분으로 학습하고 뒷부분으로 평가합니다.
+- 데이터: --database의 news_articles.section_from_feed = 1 기사 (운영 DB 사본 등),
+  또는 --live로 구글 뉴스 섹션 피드를 지금 가져온 기사 (네트워크 필요)
+- 정확도: 전체/섹션별 정확도와 macro F1. 모델은 확신도가 낮으면 키워드로 대신하는 운영 경로(model+fallback)도 측정
+- 처리량: 키워드 분류를 기사마다 호출 vs 모델 일괄 추론(특징 추출 포함 / 행렬 곱만)
+
+    python -m benchmarks.classifier --database sqlite:///./news.db
+    python -m benchmarks.classifier --live --json classifier.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+os.environ.setdefault("ENABLE_SLACK_NOTIFICATIONS", "false")
+# benchmarks.suite가 DATABASE_URL을 합성 DB로 바꾸므로 가져오기 전에 읽어 둠
+DEFAULT_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./news.db")
+
+from benchmarks.normalization import timed  # noqa: E402
+
+Item = Tuple[str, Optional[str], Optional[str], str, Any]  # 제목, 요약, 출처, 섹션, 발행 시각
+
+
+def load_database(url: str) -> List[Item]:
+    """DB의 라벨 있는 기사 (발행 시각 순)"""
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT a.title, a.summary, so.name AS source, se.name AS section, a.published
+            FROM news_articles a
+            JOIN sources so ON so.id = a.source_id
+            JOIN sections se ON se.id = a.section_id
+            WHERE a.section_from_feed = 1
+            ORDER BY a.published
+        """)).fetchall()
+    engine.dispose()
+    return [(row.title, row.summary, row.source, row.section, row.published) for row in rows]
+
+
+def load_live() -> List[Item]:
+    """모든 국가의 섹션 피드를 지금 가져온 기사 (발행 시각 순, 중복 URL 제외)"""
+    from app.news_service import fetch_rss_feed
+    from app.rss_feeds import get_collection_feeds, get_countries
+
+    seen = set()
+    items = []
+    for country in get_countries():
+        for feed in get_collection_feeds(country):
+            if not feed.section:
+                continue
+            for article in fetch_rss_feed(feed.url, country, feed.section):
+                if article.url not in seen:
+                    seen.add(article.url)
+                    items.append((article.title, article.summary, article.source, article.section, article.published))
+    return sorted(items, key=lambda item: item[4])
+
+
+def scores(truth: Sequence[str], predicted: Sequence[str]) -> Dict[str, Any]:
+    """정확도, macro F1, 섹션별 정확도(recall)"""
+    labels = sorted(set(truth))
+    per_section = {}
+    f1s = []
+    for label in labels:
+        tp = sum(1 for t, p in zip(truth, predicted) if t == label and p == label)
+        support = sum(1 for t in truth if t == label)
+        predicted_count = sum(1 for p in predicted if p == label)
+        precision = tp / predicted_count if predicted_count else 0.0
+        recall = tp / support if support else 0.0
+        f1s.append(2 * precision * recall / (precision + recall) if precision + recall else 0.0)
+        per_section[label] = {"support": support, "recall": round(recall, 4), "precision": round(precision, 4)}
+    correct = sum(1 for t, p in zip(truth, predicted) if t == p)
+    return {
+        "accuracy": round(correct / len(truth), 4) if truth else 0.0,
+        "macro_f1": round(sum(f1s) / len(f1s), 4) if f1s else 0.0,
+        "sections": per_section,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword vs learned section classifier: accuracy and throughput")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--database", default=DEFAULT_DATABASE_URL,
+                        help="database with labelled (section_from_feed = 1) articles")
+    source.add_argument("--live", action="store_true", help="fetch Google News section feeds now instead")
+    parser.add_argument("--test-ratio", type=float, default=0.2, help="most recent share used for evaluation")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON")
+    args = parser.parse_args()
+
+    items = load_live() if args.live else load_database(args.database)
+    split = int(len(items) * (1 - args.test_ratio))
+    train, test = items[:split], items[split:]
+    if len(train) < 50 or not test:
+        print(f"not enough labelled articles ({len(items)}); collect with section feeds first or use --live", file=sys.stderr)
+        sys.exit(1)
+
+    from app.news_service import classify_news_section
+    from app.section_classifier import CLASSIFIER_MIN_CONFIDENCE, NaiveBayesModel, featurize
+    from app.text_features import np
+
+    labels = sorted({item[3] for item in train})
+    label_index = {label: i for i, label in enumerate(labels)}
+    started = time.perf_counter()
+    model = NaiveBayesModel.fit(featurize([item[:3] for item in train]), [label_index[item[3]] for item in train], labels)
+    train_seconds = time.perf_counter() - started
+
+    truth = [item[3] for item in test]
+    keyword = [classify_news_section(title, summary or "") for title, summary, *_ in test]
+    features = featurize([item[:3] for item in test])
+    proba = model.predict_proba(features)
+    best = proba.argmax(axis=1)
+    confident = proba[np.arange(len(test)), best] >= CLASSIFIER_MIN_CONFIDENCE
+    learned = [labels[i] for i in best]
+    combined = [learned[i] if confident[i] else keyword[i] for i in range(len(test))]
+
+    report: Dict[str, Any] = {
+        "train_rows": len(train),
+        "test_rows": len(test),
+        "train_seconds": round(train_seconds, 3),
+        "model_bytes": len(model.to_bytes()),
+        "accuracy": {
+            "keyword": scores(truth, keyword),
+            "model": scores(truth, learned),
+            "model+fallback": scores(truth, combined),
+        },
+        "fallback_share": round(1 - float(confident.mean()), 4),
+        "latency": {
+            "keyword_per_article": timed(lambda: [classify_news_section(t, s or "") for t, s, *_ in test], args.iterations),
+            "model_batch": timed(lambda: model.predict_proba(featurize([item[:3] for item in test])), args.iterations),
+            "model_matmul_only": timed(lambda: model.predict_proba(features), args.iterations),
+        },
+    }
+
+    print(f"== accuracy ({len(train):,} train / {len(test):,} test, most recent {args.test_ratio:.0%} held out)")
+    print(f"{'classifier':20} {'accuracy':>10} {'macro F1':>10}")
+    for name, result in report["accuracy"].items():
+        print(f"{name:20} {result['accuracy']:10.1%} {result['macro_f1']:10.3f}")
+    print(f"(model+fallback used the keyword vote for {report['fallback_share']:.1%} of articles)")
+
+    print(f"\n{'section':16} {'support':>8} {'keyword':>10} {'model':>10}")
+    for label, stats in report["accuracy"]["model"]["sections"].items():
+        keyword_recall = report["accuracy"]["keyword"]["sections"].get(label, {}).get("recall", 0.0)
+        print(f"{label:16} {stats['support']:8d} {keyword_recall:10.1%} {stats['recall']:10.1%}")
+
+    print(f"\n== throughput ({len(test):,} articles per call, p50 / p95 ms)")
+    for name, stats in report["latency"].items():
+        rate = len(test) / (stats["p50_ms"] / 1000) if stats["p50_ms"] else 0.0
+        print(f"{name:24} {stats['p50_ms']:9.2f} / {stats['p95_ms']:<9.2f} {rate:12,.0f} articles/s")
+    print(f"\ntrained in {train_seconds:.2f}s, stored model {report['model_bytes'] / 1e3:.0f} KB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
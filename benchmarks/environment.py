@@ -0,0 +1,129 @@
+# benchmarks/environment.py
+"""
+벤치마크/부하 테스트 공용 환경
+
+- BENCH_DATA_DIR: 합성 DB 등 생성 파일 위치 (기본값: 임시 디렉터리/nextpicker-bench)
+- 외부 서비스 로컬 대역 서버
+  - GET: benchmarks/fixtures의 구글 뉴스 RSS를 /us, /kr 또는 구글 뉴스 경로(gl=US|KR 쿼리)로 제공
+    (GOOGLE_NEWS_BASE_URL을 이 서버 주소로 지정하면 rss_feeds의 모든 피드가 여기로 요청됨)
+  - GET /rss/articles/<id>: 구글 뉴스 래퍼처럼 원문 주소(localhost/publisher/..., utm 파라미터 포함)로 302 리다이렉트
+    (RESOLVE_CANONICAL_URLS 검증용, 원문 페이지는 작은 HTML로 응답)
+  - POST: 슬랙 chat.postMessage처럼 {"ok": true}로 응답 (SLACK_API_URL 교체용)
+
+app 모듈을 import하지 않으므로, app이 읽는 환경 변수를 설정하기 전에 서버를 띄울 수 있습니다.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+BENCH_DATA_DIR = os.getenv("BENCH_DATA_DIR", os.path.join(tempfile.gettempdir(), "nextpicker-bench"))
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = {
+    "us": os.path.join(FIXTURE_DIR, "google_news_us.xml"),
+    "kr": os.path.join(FIXTURE_DIR, "google_news_kr.xml"),
+}
+
+
+def dataset_path(rows: int) -> str:
+    """행 수별 합성 news_articles SQLite 파일 경로"""
+    return os.path.join(BENCH_DATA_DIR, f"news_{rows}.db")
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    feeds: Dict[str, bytes] = {}
+    latency = 0.0
+    rotate = False
+    requests_served = 0
+    slack_messages = 0
+    _lock = threading.Lock()
+
+    def _feed_body(self) -> Optional[bytes]:
+        """/us, /kr 또는 구글 뉴스 경로(gl=US|KR 쿼리)에 맞는 fixture"""
+        parsed = urlsplit(self.path)
+        body = self.feeds.get(parsed.path.strip("/"))
+        if body is None:
+            country = parse_qs(parsed.query).get("gl", [""])[0].lower()
+            body = self.feeds.get(country)
+        return body
+
+    def _send_article(self) -> bool:
+        """구글 뉴스 래퍼 → 원문 리다이렉트와 원문 페이지 대역 (처리했으면 True)"""
+        path = urlsplit(self.path).path
+        if path.startswith("/rss/articles/"):
+            # 래퍼 서버와 다른 호스트로 보내야 원문으로 인정되므로 localhost 사용
+            digest = hashlib.md5(path.rsplit("/", 1)[-1].encode()).hexdigest()[:12]
+            self.send_response(302)
+            self.send_header("Location", f"http://localhost:{self.server.server_address[1]}/publisher/{digest}"
+                                         f"?utm_source=google_news&utm_medium=rss")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return True
+        if path.startswith("/publisher/"):
+            body = b"<html><body>article</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return True
+        return False
+
+    def do_GET(self):
+        if self._send_article():
+            return
+        body = self._feed_body()
+        if body is None:
+            self.send_error(404)
+            return
+        with self._lock:
+            type(self).requests_served += 1
+            served = self.requests_served
+        if self.rotate:
+            # 요청마다 기사 링크를 바꿔 매번 신규 기사로 저장되도록 함
+            body = body.replace(b"?oc=5", f"?oc=5&amp;r={served}".encode())
+        if self.latency:
+            time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        """슬랙 chat.postMessage 대역"""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self._lock:
+            type(self).slack_messages += 1
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_feed_server(latency_ms: float = 0.0, rotate: bool = False) -> ThreadingHTTPServer:
+    """
+    로컬 대역 서버: fixture를 /us, /kr 및 구글 뉴스 경로(GOOGLE_NEWS_BASE_URL 교체용)로 제공하고,
+    POST 요청은 슬랙 API(SLACK_API_URL 교체용)처럼 {"ok": true}로 응답합니다.
+    """
+    _FeedHandler.feeds = {name: open(path, "rb").read() for name, path in FIXTURES.items()}
+    _FeedHandler.latency = latency_ms / 1000
+    _FeedHandler.rotate = rotate
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def standin_stats() -> Dict[str, int]:
+    """대역 서버가 처리한 피드 요청 수와 슬랙 메시지 수"""
+    return {"feed_requests": _FeedHandler.requests_served, "slack_messages": _FeedHandler.slack_messages}
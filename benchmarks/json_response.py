@@ -0,0 +1,74 @@
+# benchmarks/json_response.py
+"""
+JSON 응답 직렬화 벤치마크
+
+기존 경로(create_success_response → BaseResponse → jsonable_encoder → JSONResponse)와
+빠른 경로(create_fast_response → orjson)의 초당 처리량을 비교합니다.
+
+    python -m benchmarks.json_response --articles 100 --seconds 3
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.article import Article
+from app.utils import create_fast_response, create_success_response, serialize_articles
+
+
+def _articles(count: int):
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        Article(
+            id=f"{i:032x}",
+            title=f"Sample headline number {i} about markets and policy",
+            url=f"https://news.example.com/articles/{i}",
+            source=f"Source {i % 50}",
+            published=base + timedelta(minutes=i),
+            summary="Summary text " * 15,
+            section="business",
+            country="US",
+            created_at=base + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(count)
+    ]
+
+
+def _baseline(articles, meta):
+    response = create_success_response(data=serialize_articles(articles), message="bench", meta=meta)
+    return JSONResponse(content=jsonable_encoder(response)).body
+
+
+def _fast(articles, meta):
+    return create_fast_response(data=serialize_articles(articles), message="bench", meta=meta).body
+
+
+def run(func, articles, seconds: float) -> float:
+    """seconds 동안 func를 반복 실행해 초당 응답 수를 반환합니다."""
+    meta = {"total": len(articles), "country": "US", "days": 1, "limit": len(articles)}
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        func(articles, meta)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON response serialization benchmark")
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    articles = _articles(args.articles)
+    baseline = run(_baseline, articles, args.seconds)
+    fast = run(_fast, articles, args.seconds)
+    print(f"baseline {baseline:10.1f} responses/s")
+    print(f"fast     {fast:10.1f} responses/s  ({fast / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
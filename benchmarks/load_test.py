@@ -0,0 +1,266 @@
+# benchmarks/load_test.py
+"""
+FastAPI 앱 부하 테스트 (조회 + 새로고침 혼합 트래픽)
+
+워커 1개가 초당 처리하는 /news, /api/v1/news/{country} 요청 수와 지연 시간이
+/api/v1/feeds/refresh 실행 중에 어떻게 변하는지 측정합니다.
+- 합성 SQLite DB(benchmarks.suite와 동일한 데이터셋)를 사용
+- 구글 뉴스 RSS와 슬랙 API는 로컬 대역 서버(benchmarks/environment.py)로 교체
+- --mode inprocess: httpx ASGITransport로 앱을 같은 프로세스에서 호출
+  --mode uvicorn: uvicorn 워커 1개를 띄워 실제 HTTP로 호출 (부하 생성기와 분리되어 더 정확)
+- 조회만 하는 구간과 새로고침을 반복 실행하는 구간을 차례로 측정해 p50/p95/p99와 오류율을 출력
+
+    python -m benchmarks.load_test --mode uvicorn --duration 20 --concurrency 16
+    python -m benchmarks.load_test --mix news=1,api_us=2,api_kr=2,search=1 --phases read
+    python -m benchmarks.load_test --rows 100000 --refresh-interval 5 --fresh-feeds --json result.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.environment import dataset_path, standin_stats, start_feed_server
+
+# 요청 종류: 이름 → (메서드, 경로)
+REQUESTS: Dict[str, Tuple[str, str]] = {
+    "news": ("GET", "/news"),
+    "news_us": ("GET", "/news/us"),
+    "api_us": ("GET", "/api/v1/news/US"),
+    "api_kr": ("GET", "/api/v1/news/KR"),
+    "search": ("GET", "/api/v1/news/search?q=market&days=7"),
+    "refresh": ("POST", "/api/v1/feeds/refresh"),
+}
+DEFAULT_MIX = "news=2,api_us=3,api_kr=3"
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """'news=2,api_us=3' 형식의 트래픽 비율"""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in REQUESTS:
+            raise SystemExit(f"unknown request type '{name}' (choose from {', '.join(REQUESTS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """요청 종류별 지연 시간과 오류 수집"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def record(self, name: str, latency: float, ok: bool) -> None:
+        self.latencies.setdefault(name, []).append(latency)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def finish(self) -> None:
+        self.elapsed = time.perf_counter() - self.started
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        rows = {}
+        names = list(self.latencies) + (["total"] if len(self.latencies) > 1 else [])
+        for name in names:
+            if name == "total":
+                values = sorted(v for series in self.latencies.values() for v in series)
+                errors = sum(self.errors.values())
+            else:
+                values = sorted(self.latencies[name])
+                errors = self.errors.get(name, 0)
+            rows[name] = {
+                "requests": len(values),
+                "rps": round(len(values) / self.elapsed, 1) if self.elapsed else 0.0,
+                "error_rate": round(errors / len(values), 4) if values else 0.0,
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+            }
+        return rows
+
+
+async def _send(client: httpx.AsyncClient, name: str) -> Tuple[float, bool]:
+    method, path = REQUESTS[name]
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, path)
+        ok = response.status_code < 400 and not (
+            response.headers.get("content-type", "").startswith("application/json")
+            and response.json().get("success") is False
+        )
+    except Exception:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+async def _reader(client: httpx.AsyncClient, mix: Dict[str, float], deadline: float, recorder: Recorder, rnd: random.Random) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        name = rnd.choices(names, weights)[0]
+        latency, ok = await _send(client, name)
+        recorder.record(name, latency, ok)
+        # in-process 모드에서는 동기 엔드포인트가 이벤트 루프에 양보하지 않으므로 다른 작업에 차례를 넘김
+        await asyncio.sleep(0)
+
+
+async def _refresher(client: httpx.AsyncClient, interval: float, deadline: float, recorder: Recorder) -> None:
+    """deadline까지 새로고침을 반복 실행 (완료 후 interval초 대기)"""
+    while time.perf_counter() < deadline:
+        latency, ok = await _send(client, "refresh")
+        recorder.record("refresh", latency, ok)
+        await asyncio.sleep(interval)
+
+
+async def run_phase(client: httpx.AsyncClient, mix: Dict[str, float], duration: float, concurrency: int,
+                    refresh_interval: Optional[float], seed: int) -> Recorder:
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+    rnd = random.Random(seed)
+    tasks = [_reader(client, mix, deadline, recorder, random.Random(rnd.random())) for _ in range(concurrency)]
+    if refresh_interval is not None:
+        tasks.append(_refresher(client, refresh_interval, deadline, recorder))
+    await asyncio.gather(*tasks)
+    recorder.finish()
+    return recorder
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(env: Dict[str, str]) -> Tuple[subprocess.Popen, str]:
+    """uvicorn 워커 1개로 앱을 실행하고 헬스체크가 응답할 때까지 기다립니다."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", "1", "--log-level", "warning", "--no-access-log"],
+        env={**os.environ, **env},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise SystemExit("uvicorn exited during startup")
+        try:
+            if httpx.get(f"{base_url}/api/v1/health", timeout=1).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("uvicorn did not become ready within 30s")
+
+
+def print_phase(title: str, summary: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n== {title}")
+    print(f"{'request':10} {'count':>7} {'rps':>8} {'errors':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, row in summary.items():
+        print(f"{name:10} {row['requests']:7d} {row['rps']:8.1f} {row['error_rate']:8.2%} "
+              f"{row['p50_ms']:9.1f} {row['p95_ms']:9.1f} {row['p99_ms']:9.1f}")
+
+
+async def _run(args, base_url: Optional[str], app=None) -> Dict[str, Any]:
+    mix = parse_mix(args.mix)
+    if app is not None:
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120)
+    else:
+        limits = httpx.Limits(max_connections=args.concurrency + 2)
+        client = httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits)
+
+    phases = {}
+    async with client:
+        # 연결/템플릿 캐시 워밍업
+        for name in mix:
+            await _send(client, name)
+        if args.phases in ("read", "both"):
+            recorder = await run_phase(client, mix, args.duration, args.concurrency, None, args.seed)
+            phases["read"] = recorder.summary()
+            print_phase("read only", phases["read"])
+        if args.phases in ("refresh", "both"):
+            recorder = await run_phase(client, mix, args.duration, args.concurrency, args.refresh_interval, args.seed)
+            phases["read+refresh"] = recorder.summary()
+            print_phase(f"read + refresh every {args.refresh_interval:g}s", phases["read+refresh"])
+    return phases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed read/refresh load test for the FastAPI app")
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--rows", type=int, default=10_000, help="synthetic news_articles size")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted request mix, e.g. {DEFAULT_MIX}")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per phase")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent reader connections")
+    parser.add_argument("--phases", choices=("read", "refresh", "both"), default="both")
+    parser.add_argument("--refresh-interval", type=float, default=0.0, help="pause between refreshes")
+    parser.add_argument("--feed-latency-ms", type=float, default=50.0, help="simulated RSS fetch latency")
+    parser.add_argument("--fresh-feeds", action="store_true", help="serve new article links on every fetch")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="write phase summaries as JSON")
+    args = parser.parse_args()
+
+    server = start_feed_server(args.feed_latency_ms, rotate=args.fresh_feeds)
+    standin_url = f"http://127.0.0.1:{server.server_address[1]}"
+    env = {
+        "BENCH_DATABASE_URL": f"sqlite:///{dataset_path(args.rows)}",
+        "DATABASE_URL": f"sqlite:///{dataset_path(args.rows)}",
+        "GOOGLE_NEWS_BASE_URL": standin_url,
+        "SLACK_API_URL": f"{standin_url}/slack/chat.postMessage",
+        "SLACK_BOT_TOKEN": "load-test",
+        "ENABLE_SLACK_NOTIFICATIONS": "true",
+    }
+    # app 모듈이 import 시점에 읽는 환경 변수이므로 import 전에 설정
+    os.environ.update(env)
+
+    from benchmarks.suite import ensure_dataset
+    ensure_dataset(args.rows).dispose()
+
+    process = None
+    try:
+        if args.mode == "uvicorn":
+            process, base_url = start_uvicorn(env)
+            phases = asyncio.run(_run(args, base_url))
+        else:
+            import logging
+            from app.database import init_db
+            from app.main import app
+
+            init_db()
+            logging.getLogger().setLevel(logging.WARNING)
+            phases = asyncio.run(_run(args, None, app))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+        server.shutdown()
+
+    stats = standin_stats()
+    print(f"\nstand-in served {stats['feed_requests']} feed requests, {stats['slack_messages']} Slack messages")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "phases": phases}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# benchmarks/normalization.py
+"""
+출처/섹션 정규화 저장 공간 + 필터 조회 벤치마크
+
+같은 합성 기사(benchmarks.suite 데이터 생성기)를 두 스키마의 SQLite DB로 만들어 비교합니다.
+- legacy: source/section 문자열 컬럼 + (section, published), (source) 인덱스
+- normalized: source_id/section_id 정수 컬럼 + 같은 구성의 인덱스 (현재 운영 스키마)
+dbstat으로 테이블/인덱스별 크기를 구하고, 섹션/출처 필터 조회의 p50/p95를 측정합니다.
+정규화 쪽 조회 시간에는 ID → 이름 변환(메모리 dict) 비용도 포함합니다.
+
+    python -m benchmarks.normalization                  # 1,000,000행
+    python -m benchmarks.normalization --rows 100000 --json normalization.json
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+
+from benchmarks.environment import BENCH_DATA_DIR
+from benchmarks.suite import GENERATE_CHUNK, SECTIONS, _fixture_entries, _synthetic_rows, percentile
+
+from app.timeutils import utc_now
+
+SCHEMA_VERSION = 1
+
+SCHEMAS = {
+    "legacy": """
+        CREATE TABLE news_articles (
+            id VARCHAR(32) PRIMARY KEY, title VARCHAR(500) NOT NULL, url VARCHAR(1000) NOT NULL UNIQUE,
+            source VARCHAR(100) NOT NULL, published DATETIME NOT NULL, summary TEXT, section VARCHAR(50),
+            country VARCHAR(2) NOT NULL, created_at DATETIME, analysis_text TEXT, simhash BIGINT, cluster_id VARCHAR(32)
+        );
+        CREATE INDEX ix_news_articles_section_published ON news_articles (section, published);
+        CREATE INDEX ix_news_articles_source ON news_articles (source);
+    """,
+    "normalized": """
+        CREATE TABLE sources (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(100) NOT NULL UNIQUE);
+        CREATE TABLE sections (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(50) NOT NULL UNIQUE);
+        CREATE TABLE news_articles (
+            id VARCHAR(32) PRIMARY KEY, title VARCHAR(500) NOT NULL, url VARCHAR(1000) NOT NULL UNIQUE,
+            source_id INTEGER NOT NULL, published DATETIME NOT NULL, summary TEXT, section_id SMALLINT,
+            country VARCHAR(2) NOT NULL, created_at DATETIME, analysis_text TEXT, simhash BIGINT, cluster_id VARCHAR(32)
+        );
+        CREATE INDEX ix_news_articles_section_published ON news_articles (section_id, published);
+        CREATE INDEX ix_news_articles_source_id ON news_articles (source_id);
+    """,
+}
+
+
+def build(kind: str, rows: int, regenerate: bool) -> str:
+    """kind 스키마의 합성 DB 경로 (같은 행 수로 만든 DB가 있으면 재사용)"""
+    path = os.path.join(BENCH_DATA_DIR, f"normalization_{kind}_{rows}.db")
+    if os.path.exists(path) and not regenerate:
+        try:
+            with sqlite3.connect(path) as conn:
+                if conn.execute("SELECT version, rows FROM bench_meta").fetchone() == (SCHEMA_VERSION, rows):
+                    return path
+        except sqlite3.Error:
+            pass
+    if os.path.exists(path):
+        os.remove(path)
+
+    print(f"generating {kind} {rows:,} rows -> {path}", file=sys.stderr)
+    started = time.perf_counter()
+    titles = _fixture_entries()
+    source_ids = {name: i + 1 for i, name in enumerate(sorted({entry["source"] for entry in titles}))}
+    section_ids = {name: i + 1 for i, name in enumerate(SECTIONS)}
+    source_names = {i: name for name, i in source_ids.items()}
+    section_names = {i: name for name, i in section_ids.items()}
+
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMAS[kind])
+    if kind == "legacy":
+        columns = "id, title, url, source, published, summary, section, country, created_at, cluster_id, analysis_text, simhash"
+    else:
+        columns = "id, title, url, source_id, published, summary, section_id, country, created_at, cluster_id, analysis_text, simhash"
+        conn.executemany("INSERT INTO sources (id, name) VALUES (?, ?)", [(i, n) for n, i in source_ids.items()])
+        conn.executemany("INSERT INTO sections (id, name) VALUES (?, ?)", [(i, n) for n, i in section_ids.items()])
+    insert = f"INSERT INTO news_articles ({columns}) VALUES ({', '.join('?' * 12)})"
+
+    # 두 DB가 같은 데이터를 갖도록 같은 시드/기준 시각 사용
+    rnd = random.Random(rows)
+    now = utc_now().replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    for start in range(0, rows, GENERATE_CHUNK):
+        batch = []
+        for row in _synthetic_rows(start, min(GENERATE_CHUNK, rows - start), now, titles, rnd, source_ids, section_ids):
+            source, section = row["source_id"], row["section_id"]
+            if kind == "legacy":
+                source, section = source_names[source], section_names[section]
+            batch.append((row["id"], row["title"], row["url"], source, row["published"].isoformat(sep=" "),
+                          row["summary"], section, row["country"], row["created_at"].isoformat(sep=" "),
+                          row["cluster_id"], row["analysis_text"], row["simhash"]))
+        conn.executemany(insert, batch)
+    conn.execute("CREATE TABLE bench_meta (version INTEGER, rows INTEGER, generated_for TEXT)")
+    conn.execute("INSERT INTO bench_meta VALUES (?, ?, ?)", (SCHEMA_VERSION, rows, now.isoformat()))
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    print(f"generated in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+def storage(path: str) -> Dict[str, int]:
+    """news_articles 테이블/인덱스별 바이트 (dbstat)"""
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("""
+            SELECT name, SUM(pgsize) FROM dbstat
+            WHERE name = 'news_articles' OR name LIKE 'ix_news_articles_%'
+               OR name IN ('sources', 'sections')
+            GROUP BY name ORDER BY name
+        """).fetchall()
+    return dict(rows)
+
+
+def timed(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    func()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {"p50_ms": round(percentile(latencies, 50) * 1000, 3), "p95_ms": round(percentile(latencies, 95) * 1000, 3)}
+
+
+def queries(path: str, kind: str, iterations: int) -> Dict[str, Dict[str, float]]:
+    """섹션/출처 필터 조회 지연 (정규화는 이름 → ID 조회와 결과의 ID → 이름 변환 포함)"""
+    conn = sqlite3.connect(path)
+    cutoff_7d = conn.execute("SELECT datetime(MAX(published), '-7 days') FROM news_articles").fetchone()[0]
+    cutoff_30d = conn.execute("SELECT datetime(MAX(published), '-30 days') FROM news_articles").fetchone()[0]
+    source = conn.execute(
+        f"SELECT {'source' if kind == 'legacy' else '(SELECT name FROM sources WHERE id = source_id)'} FROM news_articles LIMIT 1"
+    ).fetchone()[0]
+
+    if kind == "legacy":
+        def latest_by_section() -> List[tuple]:
+            return conn.execute("""
+                SELECT id, title, source, published, section FROM news_articles
+                WHERE section = ? AND published >= ? ORDER BY published DESC LIMIT 50
+            """, ("business", cutoff_7d)).fetchall()
+
+        def count_by_section() -> List[tuple]:
+            return conn.execute("""
+                SELECT section, COUNT(*) FROM news_articles WHERE published >= ? GROUP BY section
+            """, (cutoff_30d,)).fetchall()
+
+        def count_by_source() -> int:
+            return conn.execute("SELECT COUNT(*) FROM news_articles WHERE source = ?", (source,)).fetchone()[0]
+    else:
+        source_names = dict(conn.execute("SELECT id, name FROM sources"))
+        section_names = dict(conn.execute("SELECT id, name FROM sections"))
+        section_ids = {name: i for i, name in section_names.items()}
+        source_ids = {name: i for i, name in source_names.items()}
+
+        def latest_by_section() -> List[tuple]:
+            rows = conn.execute("""
+                SELECT id, title, source_id, published, section_id FROM news_articles
+                WHERE section_id = ? AND published >= ? ORDER BY published DESC LIMIT 50
+            """, (section_ids["business"], cutoff_7d)).fetchall()
+            return [(r[0], r[1], source_names[r[2]], r[3], section_names[r[4]]) for r in rows]
+
+        def count_by_section() -> List[tuple]:
+            rows = conn.execute("""
+                SELECT section_id, COUNT(*) FROM news_articles WHERE published >= ? GROUP BY section_id
+            """, (cutoff_30d,)).fetchall()
+            return [(section_names[r[0]], r[1]) for r in rows]
+
+        def count_by_source() -> int:
+            return conn.execute("SELECT COUNT(*) FROM news_articles WHERE source_id = ?", (source_ids[source],)).fetchone()[0]
+
+    result = {
+        "latest_by_section": timed(latest_by_section, iterations),
+        "count_by_section_30d": timed(count_by_section, max(3, iterations // 10)),
+        "count_by_source": timed(count_by_source, iterations),
+    }
+    conn.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Storage and filtered-scan benchmark for normalized source/section")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON")
+    args = parser.parse_args()
+
+    os.makedirs(BENCH_DATA_DIR, exist_ok=True)
+    report: Dict[str, Any] = {"rows": args.rows}
+    for kind in SCHEMAS:
+        path = build(kind, args.rows, args.regenerate)
+        report[kind] = {"file_bytes": os.path.getsize(path), "objects": storage(path), "queries": queries(path, kind, args.iterations)}
+
+    legacy, normalized = report["legacy"], report["normalized"]
+    print(f"\n== storage ({args.rows:,} rows)")
+    print(f"{'object':40} {'legacy MB':>10} {'normalized MB':>14} {'change':>8}")
+    pairs = [
+        ("news_articles", "news_articles", "news_articles"),
+        ("(section[_id], published) index", "ix_news_articles_section_published", "ix_news_articles_section_published"),
+        ("source[_id] index", "ix_news_articles_source", "ix_news_articles_source_id"),
+    ]
+    for label, old_name, new_name in pairs:
+        old, new = legacy["objects"].get(old_name, 0), normalized["objects"].get(new_name, 0)
+        print(f"{label:40} {old / 1e6:10.1f} {new / 1e6:14.1f} {new / old - 1 if old else 0:+8.1%}")
+    dims = sum(normalized["objects"].get(name, 0) for name in ("sources", "sections"))
+    print(f"{'sources + sections':40} {'-':>10} {dims / 1e6:14.3f}")
+    old, new = legacy["file_bytes"], normalized["file_bytes"]
+    print(f"{'database file':40} {old / 1e6:10.1f} {new / 1e6:14.1f} {new / old - 1:+8.1%}")
+
+    print(f"\n== filtered scans (p50 / p95 ms)")
+    for name in legacy["queries"]:
+        old, new = legacy["queries"][name], normalized["queries"][name]
+        print(f"{name:40} {old['p50_ms']:8.2f} / {old['p95_ms']:<8.2f} {new['p50_ms']:8.2f} / {new['p95_ms']:<8.2f}"
+              f" {new['p50_ms'] / old['p50_ms'] - 1 if old['p50_ms'] else 0:+8.1%}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+# benchmarks/suite.py
+"""
+오프라인 수집/조회 경로 벤치마크 스위트
+
+네트워크 없이 재현 가능하도록 다음을 사용합니다.
+- benchmarks/fixtures의 구글 뉴스 RSS(US/KR) 기록본
+- fixture를 그대로 돌려주는 로컬 HTTP 피드 서버 (benchmarks/environment.py, fetch_rss_feed가 실제 HTTP 요청을 수행)
+- 행 수별(10k/100k/1M) 합성 news_articles SQLite DB (BENCH_DATA_DIR에 생성 후 당일 재사용)
+
+측정 항목: extract_summary, classify_news_section, fetch_rss_feed, save_articles_to_db,
+NewsRepository.get_recent_news(collapse 포함), /news 렌더링. 각 항목의 처리량과
+반복별 지연 시간 p50/p95/p99를 출력합니다.
+
+    python -m benchmarks.suite                                   # 10k, 100k 행
+    python -m benchmarks.suite --rows 10000 100000 1000000
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.environment import BENCH_DATA_DIR, FIXTURES, dataset_path, start_feed_server
+
+# app 모듈 import 전에 설정: 로컬 news.db/운영 DB를 건드리지 않고 슬랙 알림도 보내지 않음
+# (부하 테스트는 BENCH_DATABASE_URL로 합성 DB를, 슬랙은 로컬 대역 서버를 지정)
+os.makedirs(BENCH_DATA_DIR, exist_ok=True)
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL", f"sqlite:///{os.path.join(BENCH_DATA_DIR, 'app.db')}")
+os.environ.setdefault("ENABLE_SLACK_NOTIFICATIONS", "false")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.article import Article, format_analysis_text  # noqa: E402
+from app.clustering import to_signed  # noqa: E402
+from app.database import Base, SessionLocal, _init_sqlite_search_index  # noqa: E402
+from app.dimensions import clear_dimension_caches  # noqa: E402
+from app.news_service import (  # noqa: E402
+    classify_news_section,
+    extract_summary,
+    fetch_rss_feed,
+    get_article_id,
+    save_articles_to_db,
+)
+from app.repositories import NewsRepository  # noqa: E402
+from app.timeutils import utc_now  # noqa: E402
+
+DEFAULT_ROWS = (10_000, 100_000)
+DATASET_VERSION = 5
+GENERATE_CHUNK = 20_000
+SECTIONS = ["politics", "business", "technology", "sports", "entertainment", "health", "science", "general"]
+
+
+# ── 합성 데이터셋 ─────────────────────────────────────────────────────────
+def _fixture_entries() -> List[Dict[str, str]]:
+    import feedparser
+
+    entries = []
+    for path in FIXTURES.values():
+        for entry in feedparser.parse(open(path, "rb").read()).entries:
+            entries.append({"title": entry.title, "summary": entry.summary, "source": entry.source.title})
+    return entries
+
+
+def _synthetic_rows(start: int, count: int, now: datetime, titles: List[Dict[str, str]], rnd: random.Random,
+                    source_ids: Dict[str, int], section_ids: Dict[str, int]):
+    for i in range(start, start + count):
+        country = "US" if i % 2 else "KR"
+        base = titles[i % len(titles)]
+        section = SECTIONS[rnd.randrange(len(SECTIONS))]
+        url = f"https://news.example.com/{country.lower()}/{i}"
+        article_id = get_article_id(url)
+        title = f"{base['title']} #{i}"
+        summary = extract_summary(base["summary"])
+        published = now - timedelta(seconds=rnd.randrange(90 * 86400))
+        yield {
+            "id": article_id,
+            "title": title,
+            "url": url,
+            "source_id": source_ids[base["source"]],
+            "published": published,
+            "summary": summary,
+            "section_id": section_ids[section],
+            "country": country,
+            "created_at": published + timedelta(minutes=10),
+            # 같은 사건 묶음을 흉내 내기 위해 일부 기사는 앞선 기사의 클러스터에 배정
+            "cluster_id": get_article_id(f"https://news.example.com/{country.lower()}/{i - 2}") if i % 5 == 0 and i >= 2 else article_id,
+            "analysis_text": format_analysis_text(title, base["source"], summary, section, country),
+            "simhash": to_signed(rnd.getrandbits(64)),
+        }
+
+
+def ensure_dataset(rows: int, regenerate: bool = False):
+    """rows개 기사를 가진 SQLite DB 엔진을 반환합니다. (오늘 생성된 DB가 있으면 재사용)"""
+    path = dataset_path(rows)
+    today = datetime.now().strftime("%Y-%m-%d")
+    if os.path.exists(path) and not regenerate:
+        engine = create_engine(f"sqlite:///{path}")
+        try:
+            with engine.connect() as conn:
+                meta = conn.execute(text("SELECT version, generated_on FROM bench_meta")).first()
+            if meta and meta.version == DATASET_VERSION and meta.generated_on == today:
+                return engine
+        except Exception:
+            pass
+        engine.dispose()
+    if os.path.exists(path):
+        os.remove(path)
+
+    print(f"generating {rows:,} rows -> {path}", file=sys.stderr)
+    started = time.perf_counter()
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    insert = text("""
+        INSERT INTO news_articles (id, title, url, source_id, published, summary, section_id, country, created_at, cluster_id, analysis_text, simhash)
+        VALUES (:id, :title, :url, :source_id, :published, :summary, :section_id, :country, :created_at, :cluster_id, :analysis_text, :simhash)
+    """)
+    titles = _fixture_entries()
+    rnd = random.Random(rows)
+    now = utc_now().replace(tzinfo=None)  # published는 UTC로 저장
+    # 출처/섹션 차원 테이블 (운영 스키마와 같게 ID로 저장)
+    source_ids = {name: i + 1 for i, name in enumerate(sorted({entry["source"] for entry in titles}))}
+    section_ids = {name: i + 1 for i, name in enumerate(SECTIONS)}
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO sources (id, name) VALUES (:id, :name)"),
+                     [{"id": i, "name": name} for name, i in source_ids.items()])
+        conn.execute(text("INSERT INTO sections (id, name) VALUES (:id, :name)"),
+                     [{"id": i, "name": name} for name, i in section_ids.items()])
+        for start in range(0, rows, GENERATE_CHUNK):
+            chunk = _synthetic_rows(start, min(GENERATE_CHUNK, rows - start), now, titles, rnd, source_ids, section_ids)
+            conn.execute(insert, list(chunk))
+    # 운영 스키마와 같게 FTS 인덱스/트리거까지 생성 (저장 경로 비용에 포함되므로)
+    with engine.begin() as conn:
+        _init_sqlite_search_index(conn)
+        conn.execute(text("CREATE TABLE bench_meta (version INTEGER, generated_on TEXT)"))
+        conn.execute(text("INSERT INTO bench_meta VALUES (:version, :today)"), {"version": DATASET_VERSION, "today": today})
+    print(f"generated in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return engine
+
+
+# ── 측정 ──────────────────────────────────────────────────────────────────
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure(func: Callable[[int], Any], iterations: int, items: int = 1, warmup: int = 2) -> Dict[str, float]:
+    """func(i)를 iterations번 실행해 처리량(items/s)과 반복별 지연 백분위수(ms)를 반환합니다."""
+    for i in range(warmup):
+        func(-1 - i)
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "iterations": iterations,
+        "items_per_iteration": items,
+        "throughput": round(items * iterations / total, 1) if total else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def bench_parsing(results: Dict[str, Dict[str, float]], feed_base: str, iterations: int) -> List[Article]:
+    entries = _fixture_entries()
+    summaries = [entry["summary"] for entry in entries]
+    pairs = [(entry["title"], extract_summary(entry["summary"])) for entry in entries]
+
+    results["extract_summary"] = measure(lambda _: [extract_summary(s) for s in summaries], iterations * 5, items=len(summaries))
+    results["classify_news_section"] = measure(lambda _: [classify_news_section(t, s) for t, s in pairs], iterations * 5, items=len(pairs))
+
+    articles: List[Article] = []
+    for name in FIXTURES:
+        url = f"{feed_base}/{name}"
+        country = name.upper()
+        results[f"fetch_rss_feed[{name}]"] = measure(lambda _: fetch_rss_feed(url, country), iterations, items=40)
+        articles.extend(fetch_rss_feed(url, country))
+    return articles
+
+
+def bench_dataset(results: Dict[str, Dict[str, float]], rows: int, articles: List[Article], iterations: int, regenerate: bool) -> None:
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    engine = ensure_dataset(rows, regenerate)
+    Session = sessionmaker(bind=engine)
+    SessionLocal.configure(bind=engine)  # /news 렌더링이 벤치 DB를 보도록
+    clear_dimension_caches()  # 출처/섹션 ID는 DB마다 다름
+    label = f"{rows // 1000}k" if rows < 1_000_000 else f"{rows // 1_000_000}M"
+    run_id = int(time.time())
+
+    def batch(i: int) -> List[Article]:
+        """반복마다 새 기사 배치 (앞 반복 배치를 절반 섞어 중복 판정 경로도 측정)"""
+        out = []
+        for k, article in enumerate(articles):
+            n = i if k % 2 else i - 1
+            url = f"{article.url}&bench={run_id}-{n}"
+            out.append(article._replace(id=get_article_id(url), url=url))
+        return out
+
+    def save(i: int) -> None:
+        db = Session()
+        try:
+            save_articles_to_db(batch(i), articles[0].country, db)
+        finally:
+            db.close()
+
+    def recent(collapse: bool):
+        def run(_: int) -> None:
+            db = Session()
+            try:
+                NewsRepository(db).get_recent_news("US", days=1, limit=30, collapse=collapse)
+            finally:
+                db.close()
+        return run
+
+    client = TestClient(app)
+
+    def render(_: int) -> None:
+        response = client.get("/news", headers={"Accept-Encoding": "identity"})
+        response.raise_for_status()
+
+    results[f"save_articles_to_db[{label}]"] = measure(save, max(3, iterations // 2), items=len(articles))
+    results[f"get_recent_news[{label}]"] = measure(recent(False), iterations)
+    results[f"get_recent_news_collapsed[{label}]"] = measure(recent(True), iterations)
+    results[f"render_news_page[{label}]"] = measure(render, iterations)
+    engine.dispose()
+
+
+# ── 출력/비교 ─────────────────────────────────────────────────────────────
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'benchmark':40} {'items/s':>12} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, stats in results.items():
+        print(f"{name:40} {stats['throughput']:12.1f} {stats['p50_ms']:10.3f} {stats['p95_ms']:10.3f} {stats['p99_ms']:10.3f}")
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], threshold: float) -> int:
+    """기준선 대비 변화율을 출력하고, 처리량 감소 또는 p95 증가가 threshold를 넘은 항목 수를 반환합니다."""
+    base_results = baseline.get("results", {})
+    regressions = 0
+    print(f"\ncompared with baseline from {baseline.get('meta', {}).get('created_at', '?')} (threshold {threshold:.0%})")
+    print(f"{'benchmark':40} {'items/s':>10} {'p95':>10}")
+    for name, stats in results.items():
+        base = base_results.get(name)
+        if not base:
+            print(f"{name:40} {'new':>10}")
+            continue
+        throughput_change = stats["throughput"] / base["throughput"] - 1 if base["throughput"] else 0.0
+        p95_change = stats["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        regressed = throughput_change < -threshold or p95_change > threshold
+        regressions += regressed
+        print(f"{name:40} {throughput_change:+10.1%} {p95_change:+10.1%}{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline ingestion and read-path benchmark suite")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS), help="synthetic news_articles sizes")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--feed-latency-ms", type=float, default=0.0, help="simulated feed server latency")
+    parser.add_argument("--regenerate", action="store_true", help="rebuild synthetic databases")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold for --compare")
+    args = parser.parse_args()
+
+    server = start_feed_server(args.feed_latency_ms)
+    feed_base = f"http://127.0.0.1:{server.server_address[1]}"
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        articles = bench_parsing(results, feed_base, args.iterations)
+        us_articles = [article for article in articles if article.country == "US"]
+        for rows in args.rows:
+            bench_dataset(results, rows, us_articles, args.iterations, args.regenerate)
+    finally:
+        server.shutdown()
+
+    print_results(results)
+
+    if args.save_baseline:
+        payload = {
+            "meta": {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "rows": args.rows,
+                "iterations": args.iterations,
+            },
+            "results": results,
+        }
+        with open(args.save_baseline, "w") as f:
+            json.dump(payload, f, indent=2)
+        print(f"\nbaseline saved to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()